@@ -0,0 +1,159 @@
+"""
+Base120 Validation Result Cache
+
+Content-addressed cache of artifact validation results. Keys are BLAKE2b
+digests of the canonical JSON form of the artifact combined with
+fingerprints of the schema, mappings and ERR registry, so a result is only
+reused for an identical artifact validated against identical registries.
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+import hashlib
+import threading
+import time
+
+from base120.report import canonical_dumps
+
+
+# Registry objects whose fingerprints are memoized at once
+_MAX_FINGERPRINTS = 64
+
+
+def content_digest(obj: Any) -> bytes:
+    """BLAKE2b-128 digest of the canonical JSON form of `obj`."""
+    return hashlib.blake2b(canonical_dumps(obj).encode("utf-8"), digest_size=16).digest()
+
+
+class ValidationCache:
+    """
+    Thread-safe LRU + TTL cache of validate_artifact() results.
+
+    Pass an instance as ``cache=`` to validate_artifact() or
+    validate_artifacts(). Hits skip schema validation and registry
+    resolution but still emit a validator_result event and record metrics,
+    so observability is unchanged.
+
+    Registry fingerprints are memoized per object identity: schema,
+    mappings and ERR registry objects must not be mutated in place while
+    a cache uses them (load a new object instead).
+
+    Args:
+        maxsize: Maximum number of cached results (least recently used
+            entries are evicted first)
+        ttl: Seconds a result stays valid (None: no expiry)
+        clock: Monotonic clock used for expiry
+
+    Example:
+        >>> cache = ValidationCache(maxsize=100_000, ttl=300)
+        >>> validate_artifact(artifact, schema, mappings, err_registry, cache=cache)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10_000,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"maxsize must be positive, got {maxsize}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[bytes, tuple[float, tuple[str, ...], tuple[str, ...]]] = (
+            OrderedDict()
+        )
+        # id(obj) -> (obj, digest); holding obj keeps its id from being reused
+        self._fingerprints: dict[int, tuple[Any, bytes]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _fingerprint(self, obj: Any) -> bytes:
+        cached = self._fingerprints.get(id(obj))
+        if cached is not None and cached[0] is obj:
+            return cached[1]
+        from base120.shared import registry_digest
+
+        # Shared-memory registries hash the canonical JSON they already hold
+        digest = registry_digest(obj) or content_digest(obj)
+        with self._lock:
+            if len(self._fingerprints) >= _MAX_FINGERPRINTS:
+                self._fingerprints.clear()
+            self._fingerprints[id(obj)] = (obj, digest)
+        return digest
+
+    def key(
+        self,
+        artifact: Mapping[str, Any],
+        schema: Mapping[str, Any],
+        mappings: Mapping[str, Any],
+        err_registry: Sequence[Mapping[str, Any]],
+    ) -> Optional[bytes]:
+        """
+        Return the cache key for one validation, or None if the artifact
+        cannot be canonicalized (e.g. non-JSON values); such artifacts are
+        validated without caching.
+        """
+        try:
+            artifact_digest = content_digest(artifact)
+        except (TypeError, ValueError):
+            return None
+        hasher = hashlib.blake2b(artifact_digest, digest_size=16)
+        hasher.update(self._fingerprint(schema))
+        hasher.update(self._fingerprint(mappings))
+        hasher.update(self._fingerprint(err_registry))
+        return hasher.digest()
+
+    def get(self, key: bytes) -> Optional[tuple[tuple[str, ...], tuple[str, ...]]]:
+        """Return (error_codes, failure_mode_ids) for a live entry, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, error_codes, failure_mode_ids = entry
+            if self.ttl is not None and self._clock() >= expires:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return error_codes, failure_mode_ids
+
+    def put(self, key: bytes, error_codes: Sequence[str], failure_mode_ids: Sequence[str]) -> None:
+        """Store one result, evicting the least recently used entry if full."""
+        expires = self._clock() + self.ttl if self.ttl is not None else 0.0
+        with self._lock:
+            self._entries[key] = (expires, tuple(error_codes), tuple(failure_mode_ids))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached results and registry fingerprints."""
+        with self._lock:
+            self._entries.clear()
+            self._fingerprints.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss/eviction counters and the hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,112 @@
+"""
+Base120 Change Selection
+
+Selects the inputs affected by the changes since a git revision, for
+``validate-artifacts --changed-since``. The diff is read with the local
+git CLI (committed, staged, unstaged and untracked changes since the
+merge base of the revision and HEAD). Selection rules:
+
+- changed artifact and contract files under the given paths are selected;
+- a changed expected-output file selects its corpus input
+  (``expected/<name>.errs.json`` -> ``valid|invalid/<name>.json``,
+  ``<name>.expected.ndjson`` -> ``<name>.ndjson``);
+- a changed schema, registry or validator source file selects every
+  input, since any outcome may depend on it.
+"""
+
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Union
+
+import os
+import subprocess
+
+from base120.inputs import is_expected_output, iter_corpus_paths
+
+
+# Directories (relative to the base120 root) whose changes affect every input
+DEPENDENCY_DIRS = ("schemas", "registries", "base120/validators", "base120/contract")
+
+
+class ChangeDetectionError(RuntimeError):
+    """Raised when the git diff cannot be computed."""
+
+
+def _git(args: Sequence[str], cwd: Union[str, Path]) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, encoding="utf-8"
+        )
+    except OSError as e:
+        raise ChangeDetectionError(f"Failed to run git: {e}")
+    if result.returncode != 0:
+        raise ChangeDetectionError(
+            f"git {' '.join(args)} failed: {result.stderr.strip() or result.returncode}"
+        )
+    return result.stdout
+
+
+def changed_files(rev: str, cwd: Union[str, Path] = ".") -> list[Path]:
+    """
+    Return absolute paths of files changed since `rev`.
+
+    Compares the working tree (including staged changes and untracked,
+    non-ignored files) against the merge base of `rev` and HEAD, like a
+    pull request diff. Deleted files are included.
+
+    Raises:
+        ChangeDetectionError: If git is unavailable or the revision is unknown
+    """
+    top = Path(_git(["rev-parse", "--show-toplevel"], cwd).strip())
+    base = _git(["merge-base", rev, "HEAD"], cwd).strip()
+    names = _git(["diff", "--name-only", "-z", base, "--"], top).split("\0")
+    names += _git(["ls-files", "--others", "--exclude-standard", "-z"], top).split("\0")
+    return sorted({top / name for name in names if name})
+
+
+def _corpus_inputs(expected: Path) -> list[Path]:
+    """Inputs whose expected output lives in `expected`."""
+    if expected.name.endswith(".expected.ndjson"):
+        return [expected.with_name(expected.name[:-len(".expected.ndjson")] + ".ndjson")]
+    if expected.name.endswith(".errs.json") and expected.parent.name == "expected":
+        stem = expected.name[:-len(".errs.json")]
+        return [expected.parent.parent / sub / f"{stem}.json" for sub in ("valid", "invalid")]
+    return []
+
+
+def select_changed_inputs(
+    paths: Sequence[str],
+    changed: Iterable[Path],
+    root: Optional[Union[str, Path]] = None,
+) -> tuple[list[Path], list[Path]]:
+    """
+    Select the inputs under `paths` affected by `changed` files.
+
+    Args:
+        paths: Input files or directories, as given to validate-artifacts
+        changed: Absolute paths of changed files
+        root: base120 root holding DEPENDENCY_DIRS (default: this checkout)
+
+    Returns:
+        (inputs to validate in input order, changed dependency files);
+        every input is selected when any dependency file changed
+    """
+    root = Path(root) if root is not None else Path(__file__).parent.parent
+    dependency_dirs = [os.path.realpath(root / name) for name in DEPENDENCY_DIRS]
+    corpus_roots = [Path(os.path.realpath(raw)) for raw in paths]
+
+    wanted: set[str] = set()
+    dependencies: list[Path] = []
+    for path in changed:
+        real = os.path.realpath(path)
+        if any(real == d or real.startswith(d + os.sep) for d in dependency_dirs):
+            dependencies.append(path)
+        elif any(is_expected_output(Path(real), corpus) for corpus in corpus_roots):
+            wanted.update(os.path.realpath(p) for p in _corpus_inputs(path))
+        else:
+            wanted.add(real)
+
+    selected = [
+        path for path in iter_corpus_paths(paths)
+        if dependencies or os.path.realpath(path) in wanted
+    ]
+    return selected, dependencies
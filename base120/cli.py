@@ -1,19 +1,30 @@
 """Base120 command-line interface."""
+import os
 import sys
 import json
 import argparse
 from pathlib import Path
-from typing import Any
+from collections import deque
+from typing import Any, Iterable, Iterator, Optional, TextIO, Union
 
-from base120.contract.validate import validate_contract
+from base120.codec import loads, pretty_dumps
+from base120.compression import COMPRESSIONS, compression_for, logical_name, open_input, open_output
+from base120.contract.validate import check_contract
 from base120.contract.report import generate_report
+from base120.engine import (
+    DEFAULT_VERSION, RegistryEngine, UnknownVersionError, document_record, iter_file_records
+)
+from base120.inputs import iter_documents, iter_input_paths
+from base120.report import REPORT_FORMATS, StreamingReportWriter, canonical_dumps, read_error_record
+
+ROOT = Path(__file__).parent.parent
 
 
 def load_json_file(path: Path) -> dict[str, Any]:
     """Load and parse a JSON file."""
     try:
         with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return loads(f.read())
     except FileNotFoundError:
         print(f"Error: File not found: {path}", file=sys.stderr)
         sys.exit(2)
@@ -25,6 +36,22 @@ def load_json_file(path: Path) -> dict[str, Any]:
         sys.exit(4)
 
 
+def write_metrics(metrics: Any, path: str) -> None:
+    """Write metrics as Prometheus text (*.prom, *.txt) or a JSON snapshot."""
+    with open(path, 'w', encoding='utf-8') as f:
+        if path.endswith(('.prom', '.txt')):
+            f.write(metrics.to_prometheus())
+        else:
+            f.write(pretty_dumps(metrics.snapshot(), sort_keys=True, ensure_ascii=True) + '\n')
+
+
+def _create_metrics(args: argparse.Namespace) -> Any:
+    if not getattr(args, 'metrics', None):
+        return None
+    from base120.metrics import ValidationMetrics
+    return ValidationMetrics()
+
+
 def validate_contract_command(args: argparse.Namespace) -> int:
     """
     Validate a contract unit file.
@@ -38,13 +65,25 @@ def validate_contract_command(args: argparse.Namespace) -> int:
     
     # Load contract unit
     contract = load_json_file(contract_path)
+    if not isinstance(contract, dict):
+        # Arrays of contract units are streamed by validate-artifacts
+        print(f"Error: {contract_path} does not hold a single contract unit "
+              f"(use validate-artifacts for arrays of contracts)", file=sys.stderr)
+        return 2
     
-    # Load contract schema
-    schema_path = Path(__file__).parent.parent / "schemas" / "v1.0.0" / "contract.schema.json"
-    contract_schema = load_json_file(schema_path)
+    # Load the contract schema of the declared contract_version
+    engine = _create_engine(args)
+    if engine is None:
+        return 2
+    contract_schema = engine.route_contract(contract).contract_schema
+    if contract_schema is None:
+        print(f"Error: No contract schema for version {engine.default_version}", file=sys.stderr)
+        return 2
     
     # Validate contract
-    is_valid, errors, warnings = validate_contract(contract, contract_schema)
+    metrics = _create_metrics(args)
+    is_valid, contract_errors, warnings = check_contract(contract, contract_schema, metrics)
+    errors = [str(e) for e in contract_errors]
     
     # Extract metadata for report
     service_name = contract.get("service_name", "unknown")
@@ -58,20 +97,31 @@ def validate_contract_command(args: argparse.Namespace) -> int:
         is_valid=is_valid,
         errors=errors,
         warnings=warnings,
-        validated_environments=environments
+        validated_environments=environments,
+        error_details=[e.to_dict() for e in contract_errors]
     )
     
     # Write report to file
     output_path = Path(args.output)
     try:
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-            f.write('\n')  # Add trailing newline
+            if args.canonical:
+                # Canonical bytes: sorted keys, no insignificant whitespace
+                f.write(canonical_dumps(report))
+            else:
+                f.write(pretty_dumps(report) + '\n')  # Add trailing newline
         print(f"Validation report written to: {output_path}")
     except Exception as e:
         print(f"Error: Failed to write report to {output_path}: {e}", file=sys.stderr)
         sys.exit(5)
     
+    if metrics is not None:
+        try:
+            write_metrics(metrics, args.metrics)
+        except OSError as e:
+            print(f"Error: Failed to write metrics to {args.metrics}: {e}", file=sys.stderr)
+            sys.exit(5)
+    
     # Print validation results to stdout
     print(f"\nService: {service_name}")
     print(f"Status: {report['validation_status'].upper()}")
@@ -94,6 +144,572 @@ def validate_contract_command(args: argparse.Namespace) -> int:
         return 1
 
 
+def _create_engine(args: argparse.Namespace) -> Any:
+    """Return a RegistryEngine defaulting to --schema-version, or None if unknown."""
+    try:
+        return RegistryEngine(ROOT, default_version=args.schema_version)
+    except UnknownVersionError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return None
+
+
+def _open_report_output(args: argparse.Namespace) -> Optional[TextIO]:
+    """
+    Open the -o report for writing, compressed per --compression or its
+    extension (stdout for ``-`` unless compressed); None if it cannot be opened.
+    """
+    compression = compression_for(args.output, args.compression)
+    if args.output == "-" and compression is None:
+        return sys.stdout
+    try:
+        return open_output(args.output, compression)
+    except OSError as e:
+        print(f"Error: Failed to write report to {args.output}: {e}", file=sys.stderr)
+        return None
+
+
+_worker_engine: Any = None
+
+
+def _init_validation_worker(default_version: str, shared: dict[str, str]) -> None:
+    global _worker_engine
+    # Versions attach to the parent's shared registries on first use
+    _worker_engine = RegistryEngine(ROOT, default_version=default_version, shared=shared)
+
+
+# Documents (or NDJSON lines) per task sent to a --jobs worker
+_SHARD_SIZE = 256
+
+
+def _validate_shard_in_worker(
+    shard: tuple[Optional[str], list[tuple[str, Any]]],
+) -> tuple[list[dict[str, Any]], bool]:
+    """
+    Return (records, failed) for one shard. NDJSON shards carry their
+    path and raw lines, parsed here; a line that fails to parse ends the
+    shard with its error record, as iter_file_records() ends the file.
+    """
+    path, items = shard
+    if path is None:
+        return [document_record(_worker_engine, location, document)
+                for location, document in items], False
+    records: list[dict[str, Any]] = []
+    for location, line in items:
+        try:
+            document = loads(line)
+        except json.JSONDecodeError as e:
+            records.append(read_error_record(path, e))
+            return records, True
+        records.append(document_record(_worker_engine, location, document))
+    return records, False
+
+
+def _iter_shards(
+    paths: Iterable[Path],
+) -> Iterator[tuple[Optional[str], Union[list[tuple[str, Any]], dict[str, Any]]]]:
+    """
+    Split the inputs into (path, items) shards of up to _SHARD_SIZE items
+    for the --jobs workers, in input order.
+
+    NDJSON files are read here but parsed by the workers: their shards
+    hold (location, line) pairs and name their file. Other files are
+    parsed here (arrays stream element by element) and their documents
+    are batched across files under path None. Read errors are yielded in
+    place as (path, error record).
+    """
+    batch: list[tuple[str, Any]] = []
+    for path in paths:
+        if not logical_name(path).endswith(".ndjson"):
+            try:
+                for item in iter_documents(path):
+                    batch.append(item)
+                    if len(batch) >= _SHARD_SIZE:
+                        yield None, batch
+                        batch = []
+            except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+                if batch:
+                    yield None, batch
+                    batch = []
+                yield None, read_error_record(str(path), e)
+            continue
+        if batch:
+            yield None, batch
+            batch = []
+        lines: list[tuple[str, Any]] = []
+        try:
+            with open_input(path) as f:
+                for lineno, line in enumerate(f, 1):
+                    if line.strip():
+                        lines.append((f"{path}:{lineno}", line))
+                        if len(lines) >= _SHARD_SIZE:
+                            yield str(path), lines
+                            lines = []
+        except (OSError, UnicodeDecodeError) as e:
+            if lines:
+                yield str(path), lines
+                lines = []
+            yield str(path), read_error_record(str(path), e)
+        if lines:
+            yield str(path), lines
+    if batch:
+        yield None, batch
+
+
+def _iter_report_records(
+    paths: Iterable[Path],
+    engine: RegistryEngine,
+    jobs: int,
+    metrics: Any = None,
+    cache: Any = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Records for all inputs in input order, across `jobs` worker processes
+    if > 1. Workers validate against registries the parent publishes once
+    in shared memory (base120.shared).
+
+    With workers, inputs are split into shards (see _iter_shards()) and at
+    most 2 * `jobs` shards are in flight, so memory stays bounded by the
+    shard size however large a single input file is.
+    """
+    if jobs <= 1:
+        for path in paths:
+            yield from iter_file_records(path, engine, metrics, cache)
+        return
+    from concurrent.futures import Future, ProcessPoolExecutor
+    published = engine.publish_shared()
+    # (NDJSON path or None, records or the worker's (records, failed))
+    pending: deque[tuple[Optional[str], Any]] = deque()
+    # NDJSON files with a line that failed to parse; later shards are dropped
+    failed: set[str] = set()
+
+    def settle() -> Iterator[dict[str, Any]]:
+        path, outcome = pending.popleft()
+        if isinstance(outcome, Future):
+            records, stopped = outcome.result()
+        else:
+            records, stopped = [outcome], True
+        if path is not None:
+            if path in failed:
+                return
+            if stopped:
+                failed.add(path)
+        yield from records
+
+    try:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_validation_worker,
+            initargs=(engine.default_version, {r.version: r.name for r in published}),
+        ) as pool:
+            for path, items in _iter_shards(paths):
+                if isinstance(items, dict):
+                    pending.append((path, items))
+                else:
+                    pending.append((path, pool.submit(_validate_shard_in_worker, (path, items))))
+                while len(pending) > 2 * jobs:
+                    yield from settle()
+            while pending:
+                yield from settle()
+    finally:
+        for registry in published:
+            registry.close()
+
+
+def validate_artifacts_command(args: argparse.Namespace) -> int:
+    """
+    Validate artifacts in bulk, streaming results to a report.
+    
+    Returns:
+        0 if every artifact passes
+        1 if any artifact fails or cannot be read
+        2 for an unknown --schema-version, an invalid option combination or
+          a failed --changed-since diff
+        5 if the report cannot be written
+    """
+    engine = _create_engine(args)
+    if engine is None:
+        return 2
+    jobs = args.jobs or os.cpu_count() or 1
+    if jobs > 1 and (args.metrics or args.cache):
+        print("Error: --metrics and --cache require --jobs 1", file=sys.stderr)
+        return 2
+    metrics = _create_metrics(args)
+    cache = None
+    if args.cache:
+        from base120.cache import ValidationCache
+        cache = ValidationCache(maxsize=args.cache)
+    
+    to_stdout = args.output == "-"
+    # Keep stdout clean for the report when streaming to it
+    console = sys.stderr if to_stdout else sys.stdout
+    
+    inputs: Iterable[Path] = iter_input_paths(args.paths)
+    if args.changed_since:
+        from base120.changes import ChangeDetectionError, changed_files, select_changed_inputs
+        try:
+            changed = changed_files(args.changed_since)
+        except ChangeDetectionError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+        inputs, dependencies = select_changed_inputs(args.paths, changed, ROOT)
+        if dependencies:
+            print(f"{len(dependencies)} schema/registry/validator file(s) changed since "
+                  f"{args.changed_since}; validating all {len(inputs)} input file(s)", file=console)
+        else:
+            print(f"{len(inputs)} input file(s) changed since {args.changed_since}", file=console)
+    
+    output = _open_report_output(args)
+    if output is None:
+        return 5
+    
+    try:
+        with StreamingReportWriter(output, format=args.format, canonical=args.canonical) as writer:
+            for record in _iter_report_records(inputs, engine, jobs, metrics, cache):
+                writer.write(record)
+            summary = writer.close()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    
+    if metrics is not None:
+        try:
+            write_metrics(metrics, args.metrics)
+        except OSError as e:
+            print(f"Error: Failed to write metrics to {args.metrics}: {e}", file=sys.stderr)
+            return 5
+    
+    if not to_stdout:
+        print(f"Validation report written to: {args.output}", file=console)
+    print(
+        f"Validated {summary['total']} artifact(s): {summary['passed']} passed, "
+        f"{summary['failed']} failed, {summary['errored']} unreadable",
+        file=console
+    )
+    for entry in summary["top_errors"]:
+        print(f"  {entry['code']}: {entry['count']}", file=console)
+    if cache is not None:
+        stats = cache.stats()
+        print(
+            f"Cache: {stats['hits']} hit(s), {stats['misses']} miss(es) "
+            f"({stats['hit_rate']:.1%} hit rate)",
+            file=console
+        )
+    
+    return 0 if summary["failed"] == 0 and summary["errored"] == 0 else 1
+
+
+def validate_stream_command(args: argparse.Namespace) -> int:
+    """
+    Validate NDJSON artifacts from stdin, one canonical error array per line.
+    
+    This is the canonical implementation of the mirror conformance protocol.
+    Every line is validated against --schema-version, whatever version the
+    artifact declares.
+    
+    Returns:
+        0 on success
+        2 for an unknown --schema-version
+        3 if an input line is not valid JSON
+    """
+    import io
+    
+    engine = _create_engine(args)
+    if engine is None:
+        return 2
+    version = engine.get(args.schema_version)
+    stdin = io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8')
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='\n')
+    
+    for lineno, line in enumerate(stdin, 1):
+        if not line.strip():
+            continue
+        try:
+            artifact = loads(line)
+        except json.JSONDecodeError as e:
+            out.flush()
+            print(f"Error: Invalid JSON on line {lineno}: {e}", file=sys.stderr)
+            return 3
+        errors = version.validate(artifact)
+        out.write(canonical_dumps(errors) + "\n")
+    
+    out.flush()
+    return 0
+
+
+def conformance_command(args: argparse.Namespace) -> int:
+    """
+    Certify mirror implementations against the canonical validator.
+    
+    Returns:
+        0 if every mirror is conformant
+        1 if any implementation diverges or fails, or a corpus file
+          cannot be read
+        5 if the report cannot be written
+    """
+    import shlex
+    from base120.conformance import run_conformance
+    
+    mirrors: dict[str, list[str]] = {}
+    for spec in args.mirror:
+        name, sep, command = spec.partition("=")
+        if not sep:
+            name, command = f"mirror{len(mirrors) + 1}", spec
+        mirrors[name] = shlex.split(command)
+    
+    report = run_conformance(
+        args.paths,
+        mirrors,
+        jobs=args.jobs,
+        shard_size=args.shard_size,
+        timeout=args.timeout,
+    )
+    
+    if args.output:
+        try:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(pretty_dumps(report) + '\n')
+        except OSError as e:
+            print(f"Error: Failed to write report to {args.output}: {e}", file=sys.stderr)
+            return 5
+        print(f"Conformance report written to: {args.output}")
+    
+    print(f"\nArtifacts: {report['artifacts']} in {report['shards']} shard(s), "
+          f"{report['wall_seconds']:.2f}s wall")
+    for impl in report["implementations"]:
+        rate = impl["artifacts_per_second"]
+        print(f"  {impl['name']}: {impl['status'].upper()} "
+              f"({impl['divergences']} divergence(s), {impl['seconds']:.2f}s"
+              f"{f', {rate:.0f}/s' if rate else ''})")
+        divergence = impl.get("first_divergence")
+        if divergence:
+            print(f"    first divergence at {divergence['location']}:")
+            print(f"      canonical: {divergence['canonical']}")
+            print(f"      mirror:    {divergence['mirror']}")
+        if "error" in impl:
+            print(f"    error: {impl['error']}")
+    if report["unreadable"]:
+        print(f"  Unreadable corpus file(s): {len(report['unreadable'])}")
+        for record in report["unreadable"]:
+            print(f"    {record['path']}: {record['message']}")
+    
+    if report["conformant"]:
+        print("\n✓ Conformance PASSED")
+        return 0
+    print("\n✗ Conformance FAILED")
+    return 1
+
+
+def impact_command(args: argparse.Namespace) -> int:
+    """
+    Report the artifacts whose error codes change under new registries.
+    
+    The analysis pins --schema-version: its schema filters the corpus and
+    its registries are the baseline, whatever version artifacts declare.
+    
+    Returns:
+        0 if no indexed artifact changes outcome
+        1 if any artifact changes outcome or any input cannot be read
+        2 for an unknown --schema-version
+        5 if the index or report cannot be written
+    """
+    from base120.impact import SubclassIndex, analyze_impact, changed_subclasses
+    
+    engine = _create_engine(args)
+    if engine is None:
+        return 2
+    version = engine.get(args.schema_version)
+    schema = version.schema
+    old_mappings, old_err_registry = version.mappings, version.err_registry
+    if args.base_mappings:
+        old_mappings = load_json_file(Path(args.base_mappings))
+    if args.base_err:
+        old_err_registry = load_json_file(Path(args.base_err))["registry"]
+    new_mappings = load_json_file(Path(args.mappings)) if args.mappings else old_mappings
+    new_err_registry = (
+        load_json_file(Path(args.err))["registry"] if args.err else old_err_registry
+    )
+    
+    # Keep stdout clean for the report when streaming to it
+    to_stdout = args.output == "-"
+    console = sys.stderr if to_stdout else sys.stdout
+    
+    index = None
+    if args.index and Path(args.index).exists():
+        try:
+            index = SubclassIndex.load(args.index)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: Ignoring unreadable index {args.index}: {e}", file=sys.stderr)
+        if index is not None and not index.is_current(args.paths, schema):
+            print(f"Index {args.index} is stale; rebuilding", file=console)
+            index = None
+    if index is None:
+        index = SubclassIndex.build(args.paths, schema, version.is_valid)
+        if args.index:
+            try:
+                index.save(args.index)
+            except OSError as e:
+                print(f"Error: Failed to write index to {args.index}: {e}", file=sys.stderr)
+                return 5
+    
+    changed = changed_subclasses(
+        index.classes, old_mappings, old_err_registry, new_mappings, new_err_registry
+    )
+    
+    output = _open_report_output(args)
+    if output is None:
+        return 5
+    try:
+        with StreamingReportWriter(output, format=args.format, canonical=args.canonical) as writer:
+            for record in analyze_impact(index, old_mappings, old_err_registry,
+                                         new_mappings, new_err_registry, subclasses=changed):
+                writer.write(record)
+            # Unreadable inputs may hide changed artifacts; report them as errors
+            for record in index.errors:
+                writer.write(record)
+            summary = writer.close()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    
+    if not to_stdout:
+        print(f"Impact report written to: {args.output}", file=console)
+    print(
+        f"Indexed {len(index)} artifact(s) in {len(index.classes)} subclass(es) "
+        f"({index.schema_failures} schema failure(s) unaffected)",
+        file=console
+    )
+    print(f"Changed: {len(changed)} subclass(es), "
+          f"{summary['total'] - summary['errored']} artifact(s)", file=console)
+    for subclass in sorted(changed):
+        before, after = changed[subclass]
+        print(f"  {subclass}: {list(before)} -> {list(after)} "
+              f"({len(index.classes[subclass])} artifact(s))", file=console)
+    if index.errors:
+        print(f"Unreadable: {index.unreadable} input(s) not analyzed", file=console)
+        for record in index.errors:
+            print(f"  {record['path']}: {record['message']}", file=console)
+    return 1 if summary["total"] else 0
+
+
+def watch_command(args: argparse.Namespace) -> int:
+    """
+    Re-validate artifacts and contracts whenever their files change.
+    
+    Streams NDJSON result records to stdout until interrupted.
+    
+    Returns:
+        0 when interrupted
+        2 if --schema-version is unknown
+    """
+    import io
+    from base120.watch import Watcher
+    
+    engine = _create_engine(args)
+    if engine is None:
+        return 2
+    watcher = Watcher(args.paths, engine)
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', newline='\n')
+    print(f"[watch] watching {', '.join(args.paths)} every {args.interval * 1000:.0f} ms "
+          f"(Ctrl-C to stop)", file=sys.stderr, flush=True)
+    try:
+        watcher.run(out, interval=args.interval, canonical=args.canonical)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        out.flush()
+    return 0
+
+
+def determinism_check_command(args: argparse.Namespace) -> int:
+    """
+    Verify that independent validation passes produce identical output.
+    
+    Returns:
+        0 if every pass produced identical output
+        1 if any pass diverges, fails or times out
+        2 if --passes and --seeds are combined
+        5 if the report cannot be written
+    """
+    from base120.determinism import check_determinism
+    
+    if args.seeds and args.passes is not None:
+        print("Error: --passes and --seeds cannot be combined; "
+              "--seeds sets one pass per seed", file=sys.stderr)
+        return 2
+    seeds = args.seeds.split(",") if args.seeds else None
+    report = check_determinism(
+        args.paths,
+        passes=args.passes if args.passes is not None else 3,
+        seeds=seeds,
+        schema_version=args.schema_version,
+        timeout=args.timeout,
+    )
+    
+    if args.output:
+        try:
+            with open(args.output, 'w', encoding='utf-8') as f:
+                f.write(pretty_dumps(report) + '\n')
+        except OSError as e:
+            print(f"Error: Failed to write report to {args.output}: {e}", file=sys.stderr)
+            return 5
+        print(f"Determinism report written to: {args.output}")
+    
+    print(f"\nDocuments: {report['documents']}, {report['passes']} passes, "
+          f"{report['wall_seconds']:.2f}s wall")
+    for seed, digest in report["digests"].items():
+        error = report.get("errors", {}).get(seed)
+        print(f"  PYTHONHASHSEED={seed}: {digest}{f' (error: {error})' if error else ''}")
+    divergence = report.get("first_divergence")
+    if divergence:
+        print(f"\n{report['divergences']} divergent document(s); first at "
+              f"{divergence['location']} (#{divergence['index']}):")
+        for seed, output in divergence["outputs_by_seed"].items():
+            print(f"    PYTHONHASHSEED={seed}: {canonical_dumps(output)}")
+    
+    if report["deterministic"]:
+        print("\n✓ Determinism check PASSED")
+        return 0
+    print("\n✗ Determinism check FAILED")
+    return 1
+
+
+def generate_corpus_command(args: argparse.Namespace) -> int:
+    """
+    Generate a synthetic corpus with expected outputs.
+    
+    Returns:
+        0 on success
+        5 if the corpus cannot be written
+    """
+    from base120.synth import generate_corpus
+    
+    version = RegistryEngine(ROOT).get(DEFAULT_VERSION)
+    
+    try:
+        stats = generate_corpus(
+            Path(args.out_dir),
+            args.count,
+            version.schema,
+            version.mappings,
+            version.err_registry,
+            contract_schema=version.contract_schema,
+            seed=args.seed,
+            schema_failure_ratio=args.schema_failure_ratio,
+            contracts=args.contracts,
+            graph_size=args.graph_size,
+            format=args.format,
+        )
+    except OSError as e:
+        print(f"Error: Failed to write corpus to {args.out_dir}: {e}", file=sys.stderr)
+        return 5
+    
+    print(f"Corpus written to: {args.out_dir}")
+    print(f"Artifacts: {stats['artifacts_valid']} valid, {stats['artifacts_invalid']} invalid")
+    if args.contracts:
+        print(f"Contracts: {stats['contracts_valid']} valid, {stats['contracts_invalid']} invalid")
+    return 0
+
+
 def main() -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -101,6 +717,26 @@ def main() -> int:
         description='Base120 governance substrate CLI'
     )
     
+    parser.add_argument(
+        '--profile',
+        metavar='PATH',
+        help='Run the command under cProfile; write raw stats to PATH and a '
+             'hotspot summary with per-stage timings to PATH.txt'
+    )
+    parser.add_argument(
+        '--trace-memory',
+        metavar='PATH',
+        help='Run the command under tracemalloc; write the snapshot to PATH and '
+             'a summary of peak usage and top allocation sites to PATH.txt'
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=30,
+        metavar='N',
+        help='Entries per table in profile and memory summaries (default: 30)'
+    )
+    
     subparsers = parser.add_subparsers(
         title='commands',
         dest='command',
@@ -121,13 +757,354 @@ def main() -> int:
         default='contract_report.json',
         help='Output path for validation report (default: contract_report.json)'
     )
+    validate_parser.add_argument(
+        '--canonical',
+        action='store_true',
+        help='Write the report as canonical JSON (sorted keys, no whitespace)'
+    )
+    validate_parser.add_argument(
+        '--schema-version',
+        default=DEFAULT_VERSION,
+        metavar='VERSION',
+        help='Contract schema version used when the contract_version has no '
+             f'schema of its own (default: {DEFAULT_VERSION})'
+    )
+    validate_parser.add_argument(
+        '--metrics',
+        metavar='PATH',
+        help='Record stage latencies and outcome counts; write Prometheus text '
+             '(*.prom, *.txt) or a JSON snapshot to this path'
+    )
+    
+    # validate-artifacts command
+    artifacts_parser = subparsers.add_parser(
+        'validate-artifacts',
+        help='Validate artifact files or directories in bulk'
+    )
+    artifacts_parser.add_argument(
+        'paths',
+        nargs='+',
+        help='Artifact files (.json object or array, .ndjson) or directories'
+    )
+    artifacts_parser.add_argument(
+        '-o', '--output',
+        default='artifact_report.ndjson',
+        help="Output path for the streamed report, or '-' for stdout "
+             "(default: artifact_report.ndjson)"
+    )
+    artifacts_parser.add_argument(
+        '--format',
+        choices=REPORT_FORMATS,
+        default='ndjson',
+        help='Report layout: one JSON object per line, or a single JSON document (default: ndjson)'
+    )
+    artifacts_parser.add_argument(
+        '--canonical',
+        action='store_true',
+        help='Serialize report entries as canonical JSON (sorted keys, no whitespace)'
+    )
+    artifacts_parser.add_argument(
+        '--compression',
+        choices=list(COMPRESSIONS),
+        default=None,
+        help='Compress the report (default: by extension of -o: .gz, .bz2, .xz)'
+    )
+    artifacts_parser.add_argument(
+        '--metrics',
+        metavar='PATH',
+        help='Record stage latencies and outcome counts; write Prometheus text '
+             '(*.prom, *.txt) or a JSON snapshot to this path'
+    )
+    artifacts_parser.add_argument(
+        '--cache',
+        type=int,
+        default=0,
+        metavar='SIZE',
+        help='Reuse results for identical artifacts, keeping up to SIZE results '
+             '(default: 0, disabled)'
+    )
+    artifacts_parser.add_argument(
+        '--changed-since',
+        metavar='REV',
+        help='Validate only inputs changed since the merge base of REV and HEAD '
+             '(all inputs if a schema, registry or validator changed)'
+    )
+    artifacts_parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes; 0 for the CPU count (default: 1)'
+    )
+    artifacts_parser.add_argument(
+        '--schema-version',
+        default=DEFAULT_VERSION,
+        metavar='VERSION',
+        help='Version for artifacts without a schema_version field; others are '
+             f'validated against the version they declare (default: {DEFAULT_VERSION})'
+    )
+    
+    # validate-stream command
+    stream_parser = subparsers.add_parser(
+        'validate-stream',
+        help='Validate NDJSON artifacts from stdin (mirror conformance protocol)'
+    )
+    stream_parser.add_argument(
+        '--schema-version',
+        default=DEFAULT_VERSION,
+        metavar='VERSION',
+        help=f'Schema and registry version to validate against (default: {DEFAULT_VERSION})'
+    )
+    
+    # conformance command
+    conformance_parser = subparsers.add_parser(
+        'conformance',
+        help='Certify mirror implementations against the canonical validator'
+    )
+    conformance_parser.add_argument(
+        'paths',
+        nargs='+',
+        help='Corpus files or directories (expected outputs are skipped)'
+    )
+    conformance_parser.add_argument(
+        '-m', '--mirror',
+        action='append',
+        default=[],
+        metavar='[NAME=]COMMAND',
+        help='Mirror executable implementing the stdin/stdout protocol (repeatable)'
+    )
+    conformance_parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=None,
+        help='Maximum concurrent subprocesses (default: CPU count)'
+    )
+    conformance_parser.add_argument(
+        '--shard-size',
+        type=int,
+        default=5000,
+        help='Artifacts per subprocess invocation (default: 5000)'
+    )
+    conformance_parser.add_argument(
+        '--timeout',
+        type=float,
+        default=None,
+        help='Per-invocation timeout in seconds'
+    )
+    conformance_parser.add_argument(
+        '-o', '--output',
+        default=None,
+        help='Write the JSON conformance report to this path'
+    )
+    
+    # determinism-check command
+    determinism_parser = subparsers.add_parser(
+        'determinism-check',
+        help='Verify that parallel validation passes with varied hash seeds agree'
+    )
+    determinism_parser.add_argument(
+        'paths',
+        nargs='+',
+        help='Corpus files or directories (expected outputs are skipped)'
+    )
+    determinism_parser.add_argument(
+        '-n', '--passes',
+        type=int,
+        default=None,
+        help='Number of parallel passes (default: 3)'
+    )
+    determinism_parser.add_argument(
+        '--seeds',
+        metavar='S1,S2,...',
+        help='Comma-separated PYTHONHASHSEED values, one pass each '
+             '(default: 0..N-1; cannot be combined with --passes)'
+    )
+    determinism_parser.add_argument(
+        '--schema-version',
+        default=DEFAULT_VERSION,
+        metavar='VERSION',
+        help=f'Version for artifacts without a schema_version field (default: {DEFAULT_VERSION})'
+    )
+    determinism_parser.add_argument(
+        '--timeout',
+        type=float,
+        default=None,
+        help='Seconds the passes may run in total before they are killed'
+    )
+    determinism_parser.add_argument(
+        '-o', '--output',
+        default=None,
+        help='Write the JSON determinism report to this path'
+    )
+    
+    # impact command
+    impact_parser = subparsers.add_parser(
+        'impact',
+        help='List artifacts whose error codes change under new registries'
+    )
+    impact_parser.add_argument(
+        'paths',
+        nargs='+',
+        help='Artifact files (.json object or array, .ndjson) or directories'
+    )
+    impact_parser.add_argument(
+        '--mappings',
+        metavar='PATH',
+        help='Proposed mappings.json (default: unchanged)'
+    )
+    impact_parser.add_argument(
+        '--err',
+        metavar='PATH',
+        help='Proposed err.json (default: unchanged)'
+    )
+    impact_parser.add_argument(
+        '--base-mappings',
+        metavar='PATH',
+        help='Current mappings.json (default: the registry of --schema-version)'
+    )
+    impact_parser.add_argument(
+        '--base-err',
+        metavar='PATH',
+        help='Current err.json (default: the registry of --schema-version)'
+    )
+    impact_parser.add_argument(
+        '--schema-version',
+        default=DEFAULT_VERSION,
+        metavar='VERSION',
+        help=f'Schema and baseline registry version (default: {DEFAULT_VERSION})'
+    )
+    impact_parser.add_argument(
+        '--index',
+        metavar='PATH',
+        help='Subclass index file; reused while the corpus is unchanged, '
+             'otherwise rebuilt and saved here'
+    )
+    impact_parser.add_argument(
+        '-o', '--output',
+        default='impact_report.ndjson',
+        help="Output path for the streamed report, or '-' for stdout "
+             "(default: impact_report.ndjson)"
+    )
+    impact_parser.add_argument(
+        '--format',
+        choices=REPORT_FORMATS,
+        default='ndjson',
+        help='Report layout: one JSON object per line, or a single JSON document (default: ndjson)'
+    )
+    impact_parser.add_argument(
+        '--canonical',
+        action='store_true',
+        help='Serialize report entries as canonical JSON (sorted keys, no whitespace)'
+    )
+    impact_parser.add_argument(
+        '--compression',
+        choices=list(COMPRESSIONS),
+        default=None,
+        help='Compress the report (default: by extension of -o: .gz, .bz2, .xz)'
+    )
+    
+    # watch command
+    watch_parser = subparsers.add_parser(
+        'watch',
+        help='Re-validate artifacts and contracts as their files change'
+    )
+    watch_parser.add_argument(
+        'paths',
+        nargs='+',
+        help='Files (.json, .ndjson) or directories to watch'
+    )
+    watch_parser.add_argument(
+        '--interval',
+        type=float,
+        default=0.02,
+        metavar='SECONDS',
+        help='Polling interval (default: 0.02)'
+    )
+    watch_parser.add_argument(
+        '--schema-version',
+        default=DEFAULT_VERSION,
+        metavar='VERSION',
+        help=f'Version for artifacts without a schema_version field (default: {DEFAULT_VERSION})'
+    )
+    watch_parser.add_argument(
+        '--canonical',
+        action='store_true',
+        help='Serialize records as canonical JSON (sorted keys, no whitespace)'
+    )
+    
+    # generate-corpus command
+    corpus_parser = subparsers.add_parser(
+        'generate-corpus',
+        help='Generate a deterministic synthetic corpus for load testing'
+    )
+    corpus_parser.add_argument(
+        'out_dir',
+        help='Directory to write the corpus into'
+    )
+    corpus_parser.add_argument(
+        '-n', '--count',
+        type=int,
+        default=1000,
+        help='Number of artifacts to generate (default: 1000)'
+    )
+    corpus_parser.add_argument(
+        '--seed',
+        type=int,
+        default=0,
+        help='Random seed; identical arguments produce identical corpora (default: 0)'
+    )
+    corpus_parser.add_argument(
+        '--schema-failure-ratio',
+        type=float,
+        default=0.1,
+        help='Fraction of artifacts that break the schema (default: 0.1)'
+    )
+    corpus_parser.add_argument(
+        '--contracts',
+        type=int,
+        default=0,
+        help='Number of contract units to generate (default: 0)'
+    )
+    corpus_parser.add_argument(
+        '--graph-size',
+        type=int,
+        default=16,
+        help='Failure graph node count for generated contracts (default: 16)'
+    )
+    corpus_parser.add_argument(
+        '--format',
+        choices=('files', 'ndjson'),
+        default='files',
+        help='Golden corpus directory layout, or line-aligned NDJSON files (default: files)'
+    )
     
     # Parse arguments
     args = parser.parse_args()
     
-    # Route to command handler
+    if args.profile or args.trace_memory:
+        from base120.profiling import profile_run
+        with profile_run(args.profile, args.trace_memory, args.profile_top):
+            return run_command(args)
+    return run_command(args)
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """Route parsed arguments to the command handler."""
     if args.command == 'validate-contract':
         return validate_contract_command(args)
+    if args.command == 'validate-artifacts':
+        return validate_artifacts_command(args)
+    if args.command == 'validate-stream':
+        return validate_stream_command(args)
+    if args.command == 'conformance':
+        return conformance_command(args)
+    if args.command == 'determinism-check':
+        return determinism_check_command(args)
+    if args.command == 'impact':
+        return impact_command(args)
+    if args.command == 'watch':
+        return watch_command(args)
+    if args.command == 'generate-corpus':
+        return generate_corpus_command(args)
     
     return 0
 
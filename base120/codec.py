@@ -0,0 +1,206 @@
+"""
+Base120 JSON Codec
+
+All JSON parsing and serialization on the hot paths goes through this
+module. When orjson is installed it is used by default; otherwise, or
+with BASE120_JSON_BACKEND=stdlib, the standard json module is used
+(BASE120_JSON_BACKEND=orjson or auto select orjson when available).
+
+Both backends return the same values and write the same bytes, for
+canonical JSON, for the compact lines of event logs and reports, and for
+the indented JSON of pretty-printed reports.
+orjson differs from json for integers beyond 64 bits, the exponent form
+of floats, NaN/Infinity and lone surrogates. Inputs that hit one of
+these cases are detected cheaply and handled by json, so switching
+backends never changes conformance output.
+"""
+
+from typing import Any, Optional, Union
+
+import json
+import math
+import os
+import re
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+JSON_BACKENDS = ("stdlib", "orjson")
+
+# Digits -> "1", everything else -> " ": a run of 19 digits may be an
+# integer outside orjson's 64-bit range, which it would parse as a float
+_DIGIT_RUNS = bytes(0x31 if 0x30 <= c <= 0x39 else 0x20 for c in range(256))
+_LONG_DIGITS = b"1" * 19
+# Floats json writes in exponent form (>= 1e16 or < 1e-4) come out of
+# orjson as 1e16 / 1e-7 (json: 1e+16 / 1e-07) or 0.00001 (json: 1e-05).
+# Matches inside strings only cost a fallback.
+_EXPONENT = re.compile(rb"e(?<=[0-9]e)[-0-9]")
+_SMALL_FLOAT = b"0.0000"
+_DIGITS = frozenset(b"0123456789")
+
+
+def _needs_stdlib(out: bytes) -> bool:
+    """True if orjson wrote a float differently from json."""
+    if _EXPONENT.search(out) is not None:
+        return True
+    # A small float starts a number; zero-fraction timestamps
+    # ("00:00.000000Z") have a digit before it and stay on the fast path
+    at = out.find(_SMALL_FLOAT)
+    while at != -1:
+        if at == 0 or out[at - 1] not in _DIGITS:
+            return True
+        at = out.find(_SMALL_FLOAT, at + 1)
+    return False
+
+
+def json_backend(name: Optional[str] = None) -> str:
+    """
+    Resolve a JSON backend name.
+
+    `name` defaults to $BASE120_JSON_BACKEND (or "auto"); "auto" and
+    "orjson" select orjson when it is installed and "stdlib" otherwise.
+
+    Raises:
+        ValueError: If the name is not "auto" or one of JSON_BACKENDS
+    """
+    if name is None:
+        name = os.environ.get("BASE120_JSON_BACKEND") or "auto"
+    if name != "auto" and name not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend {name!r} "
+                         f"(expected auto or one of: {', '.join(JSON_BACKENDS)})")
+    return "orjson" if name != "stdlib" and orjson is not None else "stdlib"
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_nonfinite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_nonfinite(value) for value in obj)
+    return False
+
+
+def _stdlib_loads(data: Union[str, bytes]) -> Any:
+    return json.loads(data)
+
+
+def _stdlib_dumps(obj: Any, ensure_ascii: bool = True) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=ensure_ascii)
+
+
+def _stdlib_canonical_dumps(obj: Any) -> str:
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _stdlib_pretty_dumps(obj: Any, sort_keys: bool = False, ensure_ascii: bool = False) -> str:
+    return json.dumps(obj, indent=2, sort_keys=sort_keys, ensure_ascii=ensure_ascii)
+
+
+def _orjson_loads(data: Union[str, bytes]) -> Any:
+    try:
+        raw = data.encode("utf-8") if isinstance(data, str) else data
+    except UnicodeEncodeError:
+        return json.loads(data)
+    if _LONG_DIGITS in raw.translate(_DIGIT_RUNS):
+        return json.loads(data)
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        # json accepts more (NaN, huge floats, lone surrogates) and keeps
+        # its own error messages for input that is really malformed
+        return json.loads(data)
+
+
+# dataclasses and datetimes go to json, which rejects them like before
+_PASSTHROUGH = (orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+                if orjson is not None else 0)
+
+
+def _orjson_dumps(obj: Any, ensure_ascii: bool = True) -> str:
+    try:
+        out = orjson.dumps(obj, option=_PASSTHROUGH)
+    except orjson.JSONEncodeError:
+        return _stdlib_dumps(obj, ensure_ascii)
+    if (_needs_stdlib(out)
+            or (b"null" in out and _has_nonfinite(obj))
+            # json escapes non-ASCII and DEL with ensure_ascii; orjson never
+            or (ensure_ascii and (not out.isascii() or b"\x7f" in out))):
+        return _stdlib_dumps(obj, ensure_ascii)
+    return out.decode("utf-8")
+
+
+def _orjson_canonical_dumps(obj: Any) -> str:
+    try:
+        out = orjson.dumps(obj, option=_PASSTHROUGH | orjson.OPT_SORT_KEYS)
+    except orjson.JSONEncodeError:
+        return _stdlib_canonical_dumps(obj)
+    if (_needs_stdlib(out)
+            or (b"null" in out and _has_nonfinite(obj))):
+        return _stdlib_canonical_dumps(obj)
+    return out.decode("utf-8")
+
+
+def _orjson_pretty_dumps(obj: Any, sort_keys: bool = False, ensure_ascii: bool = False) -> str:
+    option = _PASSTHROUGH | orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+    try:
+        out = orjson.dumps(obj, option=option)
+    except orjson.JSONEncodeError:
+        return _stdlib_pretty_dumps(obj, sort_keys, ensure_ascii)
+    if (_needs_stdlib(out)
+            or (b"null" in out and _has_nonfinite(obj))
+            or (ensure_ascii and (not out.isascii() or b"\x7f" in out))):
+        return _stdlib_pretty_dumps(obj, sort_keys, ensure_ascii)
+    return out.decode("utf-8")
+
+
+class JSONCodec:
+    """
+    JSON functions of one backend.
+
+    Attributes:
+        backend: "stdlib" or "orjson"
+        loads: Parse a str or bytes document (errors: json.JSONDecodeError)
+        dumps: Serialize one compact JSON line (keys in insertion order,
+            no spaces); `ensure_ascii` escapes non-ASCII characters like
+            json.dumps()
+        canonical_dumps: Canonical JSON (see canonical_dumps())
+        pretty_dumps: JSON indented by 2 spaces, as json.dumps(indent=2);
+            `sort_keys` and `ensure_ascii` (default False) as for json.dumps()
+    """
+
+    def __init__(self, backend: Optional[str] = None) -> None:
+        self.backend = json_backend(backend)
+        if self.backend == "orjson":
+            self.loads = _orjson_loads
+            self.dumps = _orjson_dumps
+            self.canonical_dumps = _orjson_canonical_dumps
+            self.pretty_dumps = _orjson_pretty_dumps
+        else:
+            self.loads = _stdlib_loads
+            self.dumps = _stdlib_dumps
+            self.canonical_dumps = _stdlib_canonical_dumps
+            self.pretty_dumps = _stdlib_pretty_dumps
+
+
+_CODEC = JSONCodec()
+
+BACKEND = _CODEC.backend
+loads = _CODEC.loads
+dumps = _CODEC.dumps
+pretty_dumps = _CODEC.pretty_dumps
+
+
+def canonical_dumps(obj: Any) -> str:
+    """
+    Serialize to canonical JSON.
+
+    Follows the serialization rules in mirrors/CONFORMANCE_CONTRACT.md:
+    sorted object keys, no insignificant whitespace, non-ASCII characters
+    emitted as-is (encode the result as UTF-8). The bytes are the same
+    with either backend.
+    """
+    return _CODEC.canonical_dumps(obj)
@@ -0,0 +1,252 @@
+"""
+Base120 Compressed Streams
+
+Transparent gzip, bz2 and xz support for bulk inputs, reports and event
+logs. The compression is chosen by file extension (``.gz``, ``.bz2``,
+``.xz``) or explicitly by name. Compressed inputs are decompressed by a
+prefetch thread that stays a few chunks ahead of the reader. The
+decompressors release the GIL, so decompression overlaps with parsing
+and validation.
+"""
+
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional, TextIO, Union
+
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import sys
+import threading
+import zlib
+
+
+# Compression name -> file extension
+COMPRESSIONS = {"gzip": ".gz", "bz2": ".bz2", "xz": ".xz"}
+
+PREFETCH_CHUNK_SIZE = 1 << 20
+PREFETCH_DEPTH = 4
+
+_COMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    # mtime=0 keeps gzip output byte-identical across runs
+    "gzip": lambda data: gzip.compress(data, mtime=0),
+    "bz2": bz2.compress,
+    "xz": lzma.compress,
+}
+# Incremental compressors (compress() then flush()) writing the same formats;
+# zlib's gzip wrapper also stores mtime 0
+_STREAM_COMPRESSORS: dict[str, Callable[[], Any]] = {
+    "gzip": lambda: zlib.compressobj(wbits=31),
+    "bz2": bz2.BZ2Compressor,
+    "xz": lzma.LZMACompressor,
+}
+_DECOMPRESSORS: dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.decompress, "bz2": bz2.decompress, "xz": lzma.decompress,
+}
+
+
+def compression_for(path: Union[str, Path], compression: Optional[str] = None) -> Optional[str]:
+    """
+    Return the compression for `path`: `compression` if given, otherwise
+    the one named by its extension (None for plain files).
+
+    Raises:
+        ValueError: If `compression` is not one of COMPRESSIONS
+    """
+    if compression is not None:
+        if compression not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {compression!r} "
+                             f"(expected one of: {', '.join(COMPRESSIONS)})")
+        return compression
+    name = str(path)
+    for candidate, extension in COMPRESSIONS.items():
+        if name.endswith(extension):
+            return candidate
+    return None
+
+
+def logical_name(path: Union[str, Path]) -> str:
+    """File name without its compression extension (``a.ndjson.gz`` -> ``a.ndjson``)."""
+    name = Path(path).name
+    compression = compression_for(name)
+    return name[:-len(COMPRESSIONS[compression])] if compression else name
+
+
+def _open_compressed(target: Any, mode: str, compression: str) -> BinaryIO:
+    """Binary stream over a path or file object (file objects are left open on close)."""
+    if compression == "gzip":
+        # mtime=0 keeps gzip output byte-identical across runs
+        if isinstance(target, (str, Path)):
+            return gzip.GzipFile(target, mode, mtime=0)  # type: ignore[return-value]
+        return gzip.GzipFile(fileobj=target, mode=mode, mtime=0)  # type: ignore[return-value]
+    if compression == "bz2":
+        return bz2.BZ2File(target, mode)  # type: ignore[return-value]
+    return lzma.LZMAFile(target, mode)  # type: ignore[return-value]
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    """Compress `data` as one complete stream (concatenated streams stay readable)."""
+    return _COMPRESSORS[compression](data)
+
+
+def compressor(compression: str) -> Any:
+    """
+    Start one compressed stream, fed piecewise.
+
+    Returns an object whose ``compress(data)`` returns the output produced
+    so far and whose ``flush()`` returns the rest and ends the stream.
+    """
+    return _STREAM_COMPRESSORS[compression]()
+
+
+def decompress(data: bytes, compression: Optional[str]) -> bytes:
+    """
+    Decompress the contents of a whole file (no-op for None).
+
+    Raises:
+        OSError: If the data is corrupt or truncated
+    """
+    if compression is None:
+        return data
+    try:
+        return _DECOMPRESSORS[compression](data)
+    except OSError:
+        raise
+    except Exception as e:
+        raise OSError(f"Invalid {compression} data: {e}") from e
+
+
+class PrefetchReader(io.RawIOBase):
+    """
+    Read-only raw stream filled by a background thread.
+
+    The thread reads `chunk_size` bytes at a time from `source` into a
+    queue of at most `depth` chunks, so producing data (e.g.
+    decompression) overlaps with consuming it. Errors raised by `source`
+    are re-raised to the reader, as OSError, at the point in the stream
+    where they occurred. Closing the reader stops the thread and closes
+    `source`.
+    """
+
+    def __init__(
+        self,
+        source: BinaryIO,
+        chunk_size: int = PREFETCH_CHUNK_SIZE,
+        depth: int = PREFETCH_DEPTH,
+    ) -> None:
+        super().__init__()
+        self._source = source
+        self._chunk_size = chunk_size
+        self._queue: "queue.Queue[Union[bytes, BaseException]]" = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._chunk = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(target=self._fill, name="base120-prefetch", daemon=True)
+        self._thread.start()
+
+    def _put(self, item: Union[bytes, BaseException]) -> None:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _fill(self) -> None:
+        try:
+            while not self._stop.is_set():
+                chunk = self._source.read(self._chunk_size)
+                self._put(chunk)
+                if not chunk:
+                    return
+        except BaseException as e:
+            self._put(e)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._chunk:
+            if self._eof:
+                return 0
+            item = self._queue.get()
+            if isinstance(item, BaseException):
+                self._eof = True
+                if isinstance(item, OSError):
+                    raise item
+                raise OSError(f"Corrupt or truncated compressed data: {item}") from item
+            if not item:
+                self._eof = True
+                return 0
+            self._chunk = memoryview(item)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            self._stop.set()
+            # Free a slot so a producer blocked on a full queue sees the stop
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._thread.join()
+            self._source.close()
+        super().close()
+
+
+def open_input(
+    path: Union[str, Path],
+    compression: Optional[str] = None,
+    prefetch: bool = True,
+) -> TextIO:
+    """
+    Open an input file as UTF-8 text, decompressing per `compression` or
+    its extension (see compression_for()).
+
+    Compressed files are decompressed in a PrefetchReader thread unless
+    `prefetch` is False. Plain files are opened directly.
+    """
+    return io.TextIOWrapper(open_binary_input(path, compression, prefetch), encoding="utf-8")
+
+
+def open_binary_input(
+    path: Union[str, Path],
+    compression: Optional[str] = None,
+    prefetch: bool = True,
+) -> BinaryIO:
+    """Binary counterpart of open_input()."""
+    compression = compression_for(path, compression)
+    if compression is None:
+        return open(path, "rb")
+    source = _open_compressed(path, "rb", compression)
+    if not prefetch:
+        return source
+    return io.BufferedReader(PrefetchReader(source), PREFETCH_CHUNK_SIZE)  # type: ignore[return-value]
+
+
+def open_output(path: str, compression: Optional[str] = None) -> TextIO:
+    """
+    Open a report or log for writing UTF-8 text, compressed per
+    `compression` or the extension of `path`.
+
+    A `path` of ``-`` writes the compressed stream to stdout; closing the
+    result finishes the stream without closing stdout.
+
+    Raises:
+        ValueError: For ``-`` without a compression (use sys.stdout)
+    """
+    compression = compression_for(path, compression)
+    if path == "-":
+        if compression is None:
+            raise ValueError("Uncompressed output to stdout needs no wrapper; use sys.stdout")
+        raw = _open_compressed(sys.stdout.buffer, "wb", compression)
+    elif compression is None:
+        return open(path, "w", encoding="utf-8")
+    else:
+        raw = _open_compressed(path, "wb", compression)
+    return io.TextIOWrapper(raw, encoding="utf-8", newline="\n")
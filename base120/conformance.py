@@ -0,0 +1,235 @@
+"""
+Base120 Mirror Conformance Runner
+
+Runs the canonical validator and any number of mirror executables as
+subprocesses over a corpus, compares their canonical outputs byte-for-byte,
+and reports the first divergence per mirror.
+
+Mirror protocol (see mirrors/CONFORMANCE_CONTRACT.md):
+    The executable reads artifacts from stdin, one canonical JSON document
+    per line, and writes exactly one canonical error array per input line to
+    stdout, in input order, then exits 0. The canonical implementation of
+    this protocol is ``base120 validate-stream``.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence
+
+import os
+import subprocess
+import sys
+import time
+
+from base120.inputs import iter_corpus_paths, iter_documents
+from base120.report import canonical_dumps, read_error_record
+
+
+CANONICAL = "canonical"
+
+# Process-level command for the canonical implementation of the protocol
+CANONICAL_COMMAND = (sys.executable, "-m", "base120.cli", "validate-stream")
+
+
+def iter_corpus_lines(
+    paths: Sequence[str],
+    unreadable: Optional[list[dict[str, Any]]] = None,
+) -> Iterator[tuple[str, bytes]]:
+    """
+    Yield (location, canonical JSON line) pairs for every artifact in a corpus.
+
+    Accepts the same inputs as ``validate-artifacts``. Expected-output files
+    (``expected/`` directories and ``*.expected.ndjson``) are skipped so a
+    generated or golden corpus directory can be passed as-is.
+
+    Files that cannot be read or parsed are appended to `unreadable` as
+    ``"status": "error"`` records (as validate-artifacts reports them),
+    after the artifacts read before the failure; without `unreadable` the
+    error is raised.
+    """
+    for path in iter_corpus_paths(paths):
+        try:
+            for location, document in iter_documents(path):
+                yield location, (canonical_dumps(document) + "\n").encode("utf-8")
+        except (OSError, ValueError) as e:
+            if unreadable is None:
+                raise
+            unreadable.append(read_error_record(str(path), e))
+
+
+def _shards(items: Iterable[tuple[str, bytes]], size: int) -> Iterator[list[tuple[str, bytes]]]:
+    shard: list[tuple[str, bytes]] = []
+    for item in items:
+        shard.append(item)
+        if len(shard) >= size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+
+def _run_implementation(
+    argv: Sequence[str],
+    payload: bytes,
+    timeout: Optional[float],
+) -> dict[str, Any]:
+    """Run one implementation over one shard and capture its output lines."""
+    started = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            list(argv),
+            input=payload,
+            capture_output=True,
+            timeout=timeout,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return {"seconds": time.perf_counter() - started, "error": str(e), "lines": None}
+    seconds = time.perf_counter() - started
+    if proc.returncode != 0:
+        stderr = proc.stderr.decode("utf-8", "replace").strip()
+        return {
+            "seconds": seconds,
+            "error": f"exit code {proc.returncode}: {stderr[-500:]}",
+            "lines": None,
+        }
+    return {"seconds": seconds, "error": None, "lines": proc.stdout.splitlines()}
+
+
+class _ImplementationStats:
+    """Running totals for one implementation."""
+
+    def __init__(self, name: str, argv: Sequence[str]) -> None:
+        self.name = name
+        self.argv = list(argv)
+        self.seconds = 0.0
+        self.checked = 0
+        self.divergences = 0
+        self.first_divergence: Optional[dict[str, Any]] = None
+        self.error: Optional[str] = None
+
+    def to_dict(self, artifacts: int) -> dict[str, Any]:
+        if self.error is not None:
+            status = "error"
+        elif self.divergences:
+            status = "divergent"
+        else:
+            status = "conformant"
+        record: dict[str, Any] = {
+            "name": self.name,
+            "command": self.argv,
+            "status": status,
+            "artifacts_checked": self.checked,
+            "divergences": self.divergences,
+            "seconds": round(self.seconds, 6),
+            "artifacts_per_second": round(artifacts / self.seconds, 1) if self.seconds else None,
+        }
+        if self.first_divergence is not None:
+            record["first_divergence"] = self.first_divergence
+        if self.error is not None:
+            record["error"] = self.error
+        return record
+
+
+def run_conformance(
+    paths: Sequence[str],
+    mirrors: Mapping[str, Sequence[str]],
+    jobs: Optional[int] = None,
+    shard_size: int = 5000,
+    timeout: Optional[float] = None,
+    canonical_command: Sequence[str] = CANONICAL_COMMAND,
+) -> dict[str, Any]:
+    """
+    Certify mirrors against the canonical validator over a corpus.
+
+    The corpus is split into shards of `shard_size` artifacts. Each shard is
+    piped to every implementation as a separate subprocess; up to `jobs`
+    subprocesses run at once. Shards are compared in corpus order, so the
+    reported first divergence is the earliest one in the corpus.
+
+    Args:
+        paths: Corpus files or directories
+        mirrors: Mirror name -> command argv
+        jobs: Maximum concurrent subprocesses (default: CPU count)
+        shard_size: Artifacts per subprocess invocation
+        timeout: Per-invocation timeout in seconds
+        canonical_command: Command implementing the protocol canonically
+
+    Returns:
+        Report dict with overall totals and per-implementation results;
+        corpus files that could not be read are listed under
+        ``unreadable`` and make the run non-conformant
+    """
+    jobs = jobs or os.cpu_count() or 1
+    implementations = {CANONICAL: list(canonical_command)}
+    implementations.update({name: list(argv) for name, argv in mirrors.items()})
+    stats = {name: _ImplementationStats(name, argv) for name, argv in implementations.items()}
+
+    artifacts = 0
+    started = time.perf_counter()
+    # Bound in-flight shards so memory stays proportional to jobs * shard_size
+    max_pending = max(1, jobs // len(implementations)) + 1
+    pending: deque[tuple[list[tuple[str, bytes]], dict[str, Future[dict[str, Any]]]]] = deque()
+    unreadable: list[dict[str, Any]] = []
+
+    def settle(shard: list[tuple[str, bytes]], futures: dict[str, Future[dict[str, Any]]]) -> None:
+        outcomes = {name: future.result() for name, future in futures.items()}
+        for name, outcome in outcomes.items():
+            stats[name].seconds += outcome["seconds"]
+            if outcome["error"] is not None and stats[name].error is None:
+                stats[name].error = f"{shard[0][0]}: {outcome['error']}"
+
+        reference = outcomes[CANONICAL]["lines"]
+        if reference is None or len(reference) != len(shard):
+            if stats[CANONICAL].error is None:
+                stats[CANONICAL].error = (
+                    f"{shard[0][0]}: expected {len(shard)} output lines"
+                )
+            return
+        stats[CANONICAL].checked += len(shard)
+
+        for name in mirrors:
+            lines = outcomes[name]["lines"]
+            if lines is None:
+                continue
+            mirror = stats[name]
+            for index, (location, _) in enumerate(shard):
+                actual = lines[index] if index < len(lines) else None
+                if actual == reference[index]:
+                    continue
+                mirror.divergences += 1
+                if mirror.first_divergence is None:
+                    mirror.first_divergence = {
+                        "location": location,
+                        "canonical": reference[index].decode("utf-8", "replace"),
+                        "mirror": None if actual is None else actual.decode("utf-8", "replace"),
+                        "found_after_seconds": round(time.perf_counter() - started, 6),
+                    }
+            if len(lines) > len(shard):
+                mirror.divergences += len(lines) - len(shard)
+            mirror.checked += len(shard)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for shard in _shards(iter_corpus_lines(paths, unreadable), shard_size):
+            artifacts += len(shard)
+            payload = b"".join(line for _, line in shard)
+            futures = {
+                name: pool.submit(_run_implementation, argv, payload, timeout)
+                for name, argv in implementations.items()
+            }
+            pending.append((shard, futures))
+            while len(pending) >= max_pending:
+                settle(*pending.popleft())
+        while pending:
+            settle(*pending.popleft())
+
+    results = [stats[name].to_dict(artifacts) for name in implementations]
+    conformant = not unreadable and all(r["status"] == "conformant" for r in results)
+    return {
+        "artifacts": artifacts,
+        "shards": -(-artifacts // shard_size) if artifacts else 0,
+        "jobs": jobs,
+        "wall_seconds": round(time.perf_counter() - started, 6),
+        "conformant": conformant,
+        "implementations": results,
+        "unreadable": unreadable,
+    }
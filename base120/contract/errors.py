@@ -0,0 +1,162 @@
+"""Structured error records for contract unit validation."""
+from typing import Any, Callable, Optional, Sequence
+
+
+# Schema errors
+SCHEMA_VIOLATION = "schema.violation"
+
+# Failure graph errors
+GRAPH_MISSING_NODES = "graph.missing_nodes"
+GRAPH_MISSING_EDGES = "graph.missing_edges"
+GRAPH_DUPLICATE_NODE_IDS = "graph.duplicate_node_ids"
+GRAPH_UNKNOWN_EDGE_NODE = "graph.unknown_edge_node"
+GRAPH_TERMINATION_ESCALATES = "graph.termination_escalates"
+GRAPH_RETRIES_BELOW_MIN = "graph.retries_below_min"
+GRAPH_RETRIES_ABOVE_MAX = "graph.retries_above_max"
+GRAPH_NO_TERMINATION = "graph.no_termination"
+GRAPH_CYCLE = "graph.cycle"
+
+# Metadata errors
+METADATA_INVALID_DATETIME = "metadata.invalid_datetime"
+METADATA_CREATED_AFTER_UPDATED = "metadata.created_after_updated"
+METADATA_EMPTY_ENVIRONMENTS = "metadata.empty_environments"
+METADATA_VERSION_BELOW_MINIMUM = "metadata.version_below_minimum"
+
+
+def _render_schema_path(path: Sequence[Any]) -> str:
+    return ".".join(str(p) for p in path) if path else "root"
+
+
+# Message renderers keyed by error code. Each renderer reproduces the
+# historical human-readable message exactly so string consumers are unaffected.
+_RENDERERS: dict[str, Callable[["ContractError"], str]] = {
+    SCHEMA_VIOLATION: lambda e: (
+        f"Schema error at '{_render_schema_path(e.path)}': {e.params['detail']}"
+    ),
+    GRAPH_MISSING_NODES: lambda e: "Failure graph missing 'nodes' field",
+    GRAPH_MISSING_EDGES: lambda e: "Failure graph missing 'edges' field",
+    GRAPH_DUPLICATE_NODE_IDS: lambda e: (
+        f"Duplicate node IDs found: {list(e.params['node_ids'])}"
+    ),
+    GRAPH_UNKNOWN_EDGE_NODE: lambda e: (
+        f"Edge {e.edge_index}: '{e.params['end']}' node '{e.node_id}' does not exist"
+    ),
+    GRAPH_TERMINATION_ESCALATES: lambda e: (
+        f"Termination node '{e.node_id}' has outgoing edge "
+        f"to '{e.params['to']}' (termination nodes cannot escalate)"
+    ),
+    GRAPH_RETRIES_BELOW_MIN: lambda e: (
+        f"Node '{e.node_id}': max_retries must be >= 0"
+    ),
+    GRAPH_RETRIES_ABOVE_MAX: lambda e: (
+        f"Node '{e.node_id}': max_retries must be <= 10"
+    ),
+    GRAPH_NO_TERMINATION: lambda e: (
+        "Failure graph must contain at least one termination node"
+    ),
+    GRAPH_CYCLE: lambda e: (
+        f"Failure graph contains a cycle: {' -> '.join(e.params['cycle'])}"
+    ),
+    METADATA_INVALID_DATETIME: lambda e: (
+        f"Metadata: '{e.params['field']}' field has invalid datetime format: "
+        f"{e.params['value']}"
+    ),
+    METADATA_CREATED_AFTER_UPDATED: lambda e: (
+        f"Metadata: 'created' date ({e.params['created']}) is after 'updated' "
+        f"date ({e.params['updated']})"
+    ),
+    METADATA_EMPTY_ENVIRONMENTS: lambda e: (
+        "Metadata: compatibility.environments must not be empty"
+    ),
+    METADATA_VERSION_BELOW_MINIMUM: lambda e: (
+        f"Metadata: contract_version ({e.params['contract_version']}) is less "
+        f"than minimum_version ({e.params['minimum_version']})"
+    ),
+}
+
+
+class ContractError:
+    """
+    A single contract validation error.
+
+    Records carry the raw facts (code, location, offending ids) and only
+    render a human-readable message when ``message`` or ``str()`` is used.
+
+    Attributes:
+        code: Stable machine-readable error code (e.g., "graph.cycle")
+        path: Location of the error within the contract as path segments
+        node_id: Failure graph node ID involved, if any
+        edge_index: Index of the failure graph edge involved, if any
+        params: Code-specific details used to render the message
+    """
+
+    __slots__ = ("code", "path", "node_id", "edge_index", "params", "_message")
+
+    def __init__(
+        self,
+        code: str,
+        path: Sequence[Any] = (),
+        node_id: Optional[str] = None,
+        edge_index: Optional[int] = None,
+        **params: Any,
+    ) -> None:
+        self.code = code
+        self.path = tuple(path)
+        self.node_id = node_id
+        self.edge_index = edge_index
+        self.params = params
+        self._message: Optional[str] = None
+
+    @property
+    def message(self) -> str:
+        """Human-readable message, rendered on first access."""
+        if self._message is None:
+            self._message = _RENDERERS[self.code](self)
+        return self._message
+
+    @property
+    def json_path(self) -> str:
+        """JSONPath-style location, e.g. ``$.failure_graph.edges[2].to``."""
+        parts = ["$"]
+        for segment in self.path:
+            if isinstance(segment, int):
+                parts.append(f"[{segment}]")
+            else:
+                parts.append(f".{segment}")
+        return "".join(parts)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize the error to a JSON-compatible dict.
+
+        Optional fields (node_id, edge_index) are omitted when unset.
+        """
+        record: dict[str, Any] = {
+            "code": self.code,
+            "path": self.json_path,
+            "message": self.message,
+        }
+        if self.node_id is not None:
+            record["node_id"] = self.node_id
+        if self.edge_index is not None:
+            record["edge_index"] = self.edge_index
+        return record
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"ContractError({self.code!r}, path={self.json_path!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ContractError):
+            return NotImplemented
+        return (
+            self.code == other.code
+            and self.path == other.path
+            and self.node_id == other.node_id
+            and self.edge_index == other.edge_index
+            and self.params == other.params
+        )
+
+    __hash__ = None  # type: ignore[assignment]
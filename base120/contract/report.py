@@ -1,6 +1,7 @@
 """Contract validation report generation."""
-from typing import Any, Mapping, Sequence
-from datetime import datetime, timezone
+from typing import Any, Mapping, Optional, Sequence
+
+from base120.report import report_timestamp
 
 
 def generate_report(
@@ -8,7 +9,8 @@ def generate_report(
     is_valid: bool,
     errors: Sequence[str],
     warnings: Sequence[str],
-    validated_environments: Sequence[str]
+    validated_environments: Sequence[str],
+    error_details: Optional[Sequence[Mapping[str, Any]]] = None
 ) -> dict[str, Any]:
     """
     Generate a machine-readable validation report.
@@ -16,18 +18,24 @@ def generate_report(
     Returns a dictionary that can be serialized to JSON containing:
     - service_name: Name of the service
     - validation_status: "pass" or "fail"
-    - timestamp: ISO 8601 timestamp
+    - timestamp: ISO 8601 timestamp (BASE120_FIXED_TIMESTAMP when set)
     - errors: List of error messages
     - warnings: List of warning messages
     - compatibility: Validated environments
+    - error_details: Structured error records (only when provided)
     """
-    return {
+    report: dict[str, Any] = {
         "service_name": service_name,
         "validation_status": "pass" if is_valid else "fail",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": report_timestamp(),
         "errors": list(errors),
         "warnings": list(warnings),
         "compatibility": {
             "validated_environments": list(validated_environments)
         }
     }
+    
+    if error_details is not None:
+        report["error_details"] = [dict(detail) for detail in error_details]
+    
+    return report
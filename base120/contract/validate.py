@@ -1,8 +1,32 @@
 """Contract unit validation logic for Base120."""
-from typing import Any, Mapping, Sequence, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence, Optional
+from collections import Counter
 from datetime import datetime
 from jsonschema.validators import Draft202012Validator
 
+from base120.contract.errors import (
+    ContractError,
+    SCHEMA_VIOLATION,
+    GRAPH_MISSING_NODES,
+    GRAPH_MISSING_EDGES,
+    GRAPH_DUPLICATE_NODE_IDS,
+    GRAPH_UNKNOWN_EDGE_NODE,
+    GRAPH_TERMINATION_ESCALATES,
+    GRAPH_RETRIES_BELOW_MIN,
+    GRAPH_RETRIES_ABOVE_MAX,
+    GRAPH_NO_TERMINATION,
+    GRAPH_CYCLE,
+    METADATA_INVALID_DATETIME,
+    METADATA_CREATED_AFTER_UPDATED,
+    METADATA_EMPTY_ENVIRONMENTS,
+    METADATA_VERSION_BELOW_MINIMUM,
+)
+from base120.tracing import stage_timer
+from base120.validators.compiler import compiled_validator
+
+if TYPE_CHECKING:
+    from base120.metrics import ValidationMetrics
+
 
 def _parse_datetime(datetime_str: Optional[str]) -> Optional[datetime]:
     """
@@ -78,6 +102,27 @@ def _compare_semver(version1: str, version2: str) -> int:
     return 0
 
 
+def check_contract_schema(
+    contract: Mapping[str, Any],
+    contract_schema: Mapping[str, Any]
+) -> list[ContractError]:
+    """
+    Validate a contract unit against the contract schema.
+    
+    Returns a list of structured errors.
+    Empty list indicates successful validation.
+    """
+    # Valid contracts never need jsonschema; invalid ones use it for details
+    is_valid = compiled_validator(contract_schema)
+    if is_valid is not None and is_valid(contract):
+        return []
+    validator = Draft202012Validator(contract_schema)
+    return [
+        ContractError(SCHEMA_VIOLATION, path=error.path, detail=error.message)
+        for error in validator.iter_errors(contract)
+    ]
+
+
 def validate_contract_schema(
     contract: Mapping[str, Any],
     contract_schema: Mapping[str, Any]
@@ -88,21 +133,16 @@ def validate_contract_schema(
     Returns a list of validation error messages.
     Empty list indicates successful validation.
     """
-    validator = Draft202012Validator(contract_schema)
-    errors = []
-    
-    for error in validator.iter_errors(contract):
-        # Format error path
-        path = ".".join(str(p) for p in error.path) if error.path else "root"
-        errors.append(f"Schema error at '{path}': {error.message}")
-    
-    return errors
+    return [str(e) for e in check_contract_schema(contract, contract_schema)]
 
 
-def _has_cycle(edges: list[dict[str, Any]], node_ids: set[str]) -> tuple[bool, list[str]]:
+def _has_cycle(edges: list[dict[str, Any]], node_ids: Iterable[str]) -> tuple[bool, list[str]]:
     """
     Detect cycles in a directed graph using depth-first search.
     
+    The search is iterative (no recursion limit on deep graphs) and visits
+    start nodes in the order given, so the reported cycle is deterministic.
+    
     Returns:
         Tuple of (has_cycle, cycle_path) where:
         - has_cycle: True if a cycle exists
@@ -113,48 +153,46 @@ def _has_cycle(edges: list[dict[str, Any]], node_ids: set[str]) -> tuple[bool, l
     for edge in edges:
         from_id = edge.get("from")
         to_id = edge.get("to")
-        if from_id in graph and to_id in node_ids:
+        if from_id in graph and to_id in graph:
             graph[from_id].append(to_id)
     
-    # DFS with cycle detection
-    visited = set()
-    rec_stack = set()
-    path = []
-    
-    def dfs(node: str) -> bool:
-        """DFS helper that returns True if cycle detected."""
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-        
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                if dfs(neighbor):
-                    return True
-            elif neighbor in rec_stack:
-                # Found a cycle - extract it from path
-                cycle_start = path.index(neighbor)
-                path_copy = path[cycle_start:] + [neighbor]
-                path.clear()
-                path.extend(path_copy)
-                return True
-        
-        path.pop()
-        rec_stack.remove(node)
-        return False
+    # DFS with cycle detection; each stack frame is an iterator over
+    # the remaining neighbors of the node at the same depth in `path`
+    visited: set[str] = set()
+    rec_stack: set[str] = set()
+    path: list[str] = []
     
     # Check all nodes as potential cycle starting points
-    for node_id in node_ids:
-        if node_id not in visited:
-            if dfs(node_id):
-                return True, path
+    for start in graph:
+        if start in visited:
+            continue
+        visited.add(start)
+        rec_stack.add(start)
+        path.append(start)
+        stack = [iter(graph[start])]
+        
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    rec_stack.add(neighbor)
+                    path.append(neighbor)
+                    stack.append(iter(graph[neighbor]))
+                    break
+                if neighbor in rec_stack:
+                    # Found a cycle - extract it from path
+                    cycle_start = path.index(neighbor)
+                    return True, path[cycle_start:] + [neighbor]
+            else:
+                stack.pop()
+                rec_stack.discard(path.pop())
     
     return False, []
 
 
-def validate_failure_graph(
+def check_failure_graph(
     failure_graph: Mapping[str, Any]
-) -> list[str]:
+) -> list[ContractError]:
     """
     Validate semantic rules for the failure graph.
     
@@ -164,36 +202,57 @@ def validate_failure_graph(
     - No cycles in escalation paths (termination nodes must be reachable)
     - Retry limits are within bounds
     - Actions are semantically valid
+    
+    Returns a list of structured errors located relative to the contract root.
     """
-    errors = []
+    errors: list[ContractError] = []
     
     if "nodes" not in failure_graph:
-        return ["Failure graph missing 'nodes' field"]
+        return [ContractError(GRAPH_MISSING_NODES, path=("failure_graph",))]
     
     if "edges" not in failure_graph:
-        return ["Failure graph missing 'edges' field"]
+        return [ContractError(GRAPH_MISSING_EDGES, path=("failure_graph",))]
     
     nodes = failure_graph["nodes"]
     edges = failure_graph["edges"]
     
     # Check node ID uniqueness
     node_ids = [node.get("id") for node in nodes]
-    if len(node_ids) != len(set(node_ids)):
-        duplicates = [nid for nid in node_ids if node_ids.count(nid) > 1]
-        errors.append(f"Duplicate node IDs found: {list(set(duplicates))}")
-    
     node_id_set = set(node_ids)
+    if len(node_ids) != len(node_id_set):
+        counts = Counter(node_ids)
+        duplicates = [nid for nid in counts if counts[nid] > 1]
+        errors.append(ContractError(
+            GRAPH_DUPLICATE_NODE_IDS,
+            path=("failure_graph", "nodes"),
+            node_ids=duplicates,
+        ))
     
     # Check edge references
+    dangling_edges = False
     for i, edge in enumerate(edges):
         from_id = edge.get("from")
         to_id = edge.get("to")
         
         if from_id not in node_id_set:
-            errors.append(f"Edge {i}: 'from' node '{from_id}' does not exist")
+            dangling_edges = True
+            errors.append(ContractError(
+                GRAPH_UNKNOWN_EDGE_NODE,
+                path=("failure_graph", "edges", i, "from"),
+                node_id=from_id,
+                edge_index=i,
+                end="from",
+            ))
         
         if to_id not in node_id_set:
-            errors.append(f"Edge {i}: 'to' node '{to_id}' does not exist")
+            dangling_edges = True
+            errors.append(ContractError(
+                GRAPH_UNKNOWN_EDGE_NODE,
+                path=("failure_graph", "edges", i, "to"),
+                node_id=to_id,
+                edge_index=i,
+                end="to",
+            ))
     
     # Check that termination nodes don't have outgoing edges
     termination_nodes = {
@@ -201,49 +260,67 @@ def validate_failure_graph(
         if node.get("action") == "terminate"
     }
     
-    for edge in edges:
+    for i, edge in enumerate(edges):
         if edge.get("from") in termination_nodes:
-            errors.append(
-                f"Termination node '{edge.get('from')}' has outgoing edge "
-                f"to '{edge.get('to')}' (termination nodes cannot escalate)"
-            )
+            errors.append(ContractError(
+                GRAPH_TERMINATION_ESCALATES,
+                path=("failure_graph", "edges", i),
+                node_id=edge.get("from"),
+                edge_index=i,
+                to=edge.get("to"),
+            ))
     
     # Check retry limits
-    for node in nodes:
+    for i, node in enumerate(nodes):
         max_retries = node.get("max_retries")
         if max_retries is not None:
+            path = ("failure_graph", "nodes", i, "max_retries")
             if max_retries < 0:
-                errors.append(
-                    f"Node '{node.get('id')}': max_retries must be >= 0"
-                )
+                errors.append(ContractError(
+                    GRAPH_RETRIES_BELOW_MIN, path=path, node_id=node.get("id")
+                ))
             if max_retries > 10:
-                errors.append(
-                    f"Node '{node.get('id')}': max_retries must be <= 10"
-                )
+                errors.append(ContractError(
+                    GRAPH_RETRIES_ABOVE_MAX, path=path, node_id=node.get("id")
+                ))
     
     # Check for at least one termination node
     if not termination_nodes:
-        errors.append(
-            "Failure graph must contain at least one termination node"
-        )
+        errors.append(ContractError(
+            GRAPH_NO_TERMINATION, path=("failure_graph", "nodes")
+        ))
     
     # Check for cycles in the graph
-    # Only check if there are no errors about missing nodes (to avoid spurious cycle errors)
-    if not any("does not exist" in err for err in errors):
-        has_cycle, cycle_path = _has_cycle(edges, node_id_set)
+    # Only check if no edge references a missing node (to avoid spurious cycle errors)
+    if not dangling_edges:
+        has_cycle, cycle_path = _has_cycle(edges, dict.fromkeys(node_ids))
         if has_cycle:
-            cycle_str = " -> ".join(cycle_path)
-            errors.append(
-                f"Failure graph contains a cycle: {cycle_str}"
-            )
+            errors.append(ContractError(
+                GRAPH_CYCLE,
+                path=("failure_graph", "edges"),
+                node_id=cycle_path[0],
+                cycle=list(cycle_path),
+            ))
     
     return errors
 
 
-def validate_metadata_consistency(
+def validate_failure_graph(
+    failure_graph: Mapping[str, Any]
+) -> list[str]:
+    """
+    Validate semantic rules for the failure graph.
+    
+    Returns a list of validation error messages.
+    See check_failure_graph() for the rules enforced.
+    """
+    return [str(e) for e in check_failure_graph(failure_graph)]
+
+
+def check_metadata_consistency(
     metadata: Mapping[str, Any],
     contract_version: str
-) -> list[str]:
+) -> list[ContractError]:
     """
     Validate metadata consistency rules.
     
@@ -252,8 +329,10 @@ def validate_metadata_consistency(
     - Contract version is compatible with environment requirements
     - Compatibility environments are non-empty
     - Datetime fields are valid ISO 8601 timestamps
+    
+    Returns a list of structured errors located relative to the contract root.
     """
-    errors = []
+    errors: list[ContractError] = []
     
     created_str = metadata.get("created")
     updated_str = metadata.get("updated")
@@ -265,77 +344,117 @@ def validate_metadata_consistency(
     if created_str:
         created_dt = _parse_datetime(created_str)
         if created_dt is None:
-            errors.append(
-                f"Metadata: 'created' field has invalid datetime format: {created_str}"
-            )
+            errors.append(ContractError(
+                METADATA_INVALID_DATETIME,
+                path=("metadata", "created"),
+                field="created",
+                value=created_str,
+            ))
     
     if updated_str:
         updated_dt = _parse_datetime(updated_str)
         if updated_dt is None:
-            errors.append(
-                f"Metadata: 'updated' field has invalid datetime format: {updated_str}"
-            )
+            errors.append(ContractError(
+                METADATA_INVALID_DATETIME,
+                path=("metadata", "updated"),
+                field="updated",
+                value=updated_str,
+            ))
     
     # Compare dates if both are valid
     if created_dt and updated_dt:
         if created_dt > updated_dt:
-            errors.append(
-                f"Metadata: 'created' date ({created_str}) is after 'updated' "
-                f"date ({updated_str})"
-            )
+            errors.append(ContractError(
+                METADATA_CREATED_AFTER_UPDATED,
+                path=("metadata", "created"),
+                created=created_str,
+                updated=updated_str,
+            ))
     
     compatibility = metadata.get("compatibility", {})
     environments = compatibility.get("environments", [])
     
     if not environments:
-        errors.append("Metadata: compatibility.environments must not be empty")
+        errors.append(ContractError(
+            METADATA_EMPTY_ENVIRONMENTS,
+            path=("metadata", "compatibility", "environments"),
+        ))
     
     minimum_version = compatibility.get("minimum_version")
     if minimum_version:
         # Check that contract_version >= minimum_version using proper semver comparison
         if _compare_semver(contract_version, minimum_version) < 0:
-            errors.append(
-                f"Metadata: contract_version ({contract_version}) is less "
-                f"than minimum_version ({minimum_version})"
-            )
+            errors.append(ContractError(
+                METADATA_VERSION_BELOW_MINIMUM,
+                path=("contract_version",),
+                contract_version=contract_version,
+                minimum_version=minimum_version,
+            ))
     
     return errors
 
 
-def validate_contract(
+def validate_metadata_consistency(
+    metadata: Mapping[str, Any],
+    contract_version: str
+) -> list[str]:
+    """
+    Validate metadata consistency rules.
+    
+    Returns a list of validation error messages.
+    See check_metadata_consistency() for the rules enforced.
+    """
+    return [str(e) for e in check_metadata_consistency(metadata, contract_version)]
+
+
+def check_contract(
     contract: Mapping[str, Any],
-    contract_schema: Mapping[str, Any]
-) -> tuple[bool, list[str], list[str]]:
+    contract_schema: Mapping[str, Any],
+    metrics: Optional["ValidationMetrics"] = None
+) -> tuple[bool, list[ContractError], list[str]]:
     """
-    Validate a complete contract unit.
+    Validate a complete contract unit, returning structured errors.
     
     Returns:
         tuple of (is_valid, errors, warnings)
         - is_valid: True if contract passes all validations
-        - errors: List of error messages (blocking issues)
+        - errors: List of ContractError records (blocking issues)
         - warnings: List of warning messages (non-blocking issues)
+    
+    When `metrics` is given, per-stage latencies and error codes are recorded.
+    Under an active trace (base120.tracing.trace), stage spans are added to
+    the trace's totals.
     """
-    errors = []
-    warnings = []
+    errors: list[ContractError] = []
+    warnings: list[str] = []
+    watch = stage_timer("contract", metrics)
     
     # 1. Schema validation (hard requirement)
-    schema_errors = validate_contract_schema(contract, contract_schema)
+    schema_errors = check_contract_schema(contract, contract_schema)
     errors.extend(schema_errors)
+    if watch is not None:
+        watch.lap("schema")
     
     # If schema validation fails, don't proceed with semantic validation
     if schema_errors:
+        if watch is not None:
+            watch.finish(e.code for e in errors)
         return False, errors, warnings
     
     # 2. Failure graph semantic validation
     failure_graph = contract.get("failure_graph", {})
-    graph_errors = validate_failure_graph(failure_graph)
+    graph_errors = check_failure_graph(failure_graph)
     errors.extend(graph_errors)
+    if watch is not None:
+        watch.lap("failure_graph")
     
     # 3. Metadata consistency validation
     metadata = contract.get("metadata", {})
     contract_version = contract.get("contract_version", "")
-    metadata_errors = validate_metadata_consistency(metadata, contract_version)
+    metadata_errors = check_metadata_consistency(metadata, contract_version)
     errors.extend(metadata_errors)
+    if watch is not None:
+        watch.lap("metadata")
     
     # 4. Check for warnings (non-blocking issues - governance smells)
     
@@ -376,5 +495,27 @@ def validate_contract(
                 "(consider defining model validation rules)"
             )
     
+    if watch is not None:
+        watch.lap("warnings")
+        watch.finish(e.code for e in errors)
+    
     is_valid = len(errors) == 0
     return is_valid, errors, warnings
+
+
+def validate_contract(
+    contract: Mapping[str, Any],
+    contract_schema: Mapping[str, Any],
+    metrics: Optional["ValidationMetrics"] = None
+) -> tuple[bool, list[str], list[str]]:
+    """
+    Validate a complete contract unit.
+    
+    Returns:
+        tuple of (is_valid, errors, warnings)
+        - is_valid: True if contract passes all validations
+        - errors: List of error messages (blocking issues)
+        - warnings: List of warning messages (non-blocking issues)
+    """
+    is_valid, errors, warnings = check_contract(contract, contract_schema, metrics)
+    return is_valid, [str(e) for e in errors], warnings
@@ -0,0 +1,209 @@
+"""
+Base120 Determinism Verifier
+
+Runs N independent validation passes over a corpus in parallel
+subprocesses, each with a different PYTHONHASHSEED, and checks that they
+produce byte-identical output. Each pass streams one canonical JSON line
+per input document::
+
+    [location, report record, [validator_result events]]
+
+with events timestamped from BASE120_FIXED_TIMESTAMP. The parent reads
+all passes in lockstep, folds every line into a per-pass SHA-256 digest,
+and records the first divergent document, so memory stays constant
+regardless of corpus size. An optional timeout bounds the whole check:
+passes still running at the deadline are killed and reported as errors.
+
+A single pass can be run directly: ``python -m base120.determinism PATH...``.
+"""
+
+from typing import Any, Optional, Sequence, TextIO
+
+import hashlib
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from base120.codec import loads
+from base120.engine import DEFAULT_VERSION, RegistryEngine, iter_file_records
+from base120.inputs import iter_corpus_paths
+from base120.report import canonical_dumps
+
+
+DEFAULT_FIXED_TIMESTAMP = "2026-01-01T00:00:00.000000Z"
+
+# Process-level command for one validation pass
+PASS_COMMAND = (sys.executable, "-m", "base120.determinism")
+
+
+def run_pass(paths: Sequence[str], output: TextIO, schema_version: str = DEFAULT_VERSION) -> int:
+    """Validate every input document under `paths`, writing one canonical line each."""
+    engine = RegistryEngine(default_version=schema_version)
+    events: list[dict[str, Any]] = []
+    for path in iter_corpus_paths(paths):
+        for record in iter_file_records(path, engine, event_sink=events.append):
+            output.write(canonical_dumps([record["path"], record, events]) + "\n")
+            events.clear()
+    output.flush()
+    return 0
+
+
+def _divergence(
+    lines: Sequence[Optional[bytes]],
+    seeds: Sequence[str],
+    index: int,
+) -> dict[str, Any]:
+    """Describe the first document where the passes disagree."""
+    outputs = {}
+    location = None
+    for seed, line in zip(seeds, lines):
+        if line is None:
+            outputs[seed] = None
+            continue
+        try:
+            decoded = loads(line)
+            location = location or decoded[0]
+            outputs[seed] = decoded[1:]
+        except (ValueError, IndexError):
+            outputs[seed] = line.decode("utf-8", "replace")
+    return {"index": index, "location": location, "outputs_by_seed": outputs}
+
+
+def check_determinism(
+    paths: Sequence[str],
+    passes: int = 3,
+    seeds: Optional[Sequence[str]] = None,
+    schema_version: str = DEFAULT_VERSION,
+    timeout: Optional[float] = None,
+    pass_command: Sequence[str] = PASS_COMMAND,
+) -> dict[str, Any]:
+    """
+    Run `passes` validation passes in parallel and compare their outputs.
+
+    Args:
+        paths: Corpus files or directories (expected outputs are skipped)
+        passes: Number of passes (at least 2)
+        seeds: PYTHONHASHSEED per pass (default: "0", "1", ...); when
+            given, the number of seeds is the number of passes
+        schema_version: Version for artifacts that declare none
+        timeout: Seconds the passes may run in total; passes still running
+            at the deadline are killed and recorded under ``errors``
+        pass_command: Command running one pass (paths are appended)
+
+    Returns:
+        JSON-serializable report; ``deterministic`` is True when every pass
+        produced identical output and exited cleanly
+    """
+    seeds = [str(seed) for seed in (seeds if seeds is not None else range(passes))]
+    if len(seeds) < 2:
+        raise ValueError("determinism-check needs at least 2 passes")
+
+    started = time.perf_counter()
+    env = dict(os.environ)
+    env.setdefault("BASE120_FIXED_TIMESTAMP", DEFAULT_FIXED_TIMESTAMP)
+    argv = [*pass_command, "--schema-version", schema_version, "--", *paths]
+
+    procs = []
+    stderr_files = []
+    timed_out: set[int] = set()
+    lock = threading.Lock()
+
+    def expire() -> None:
+        with lock:
+            for index, proc in enumerate(procs):
+                if proc.poll() is None:
+                    timed_out.add(index)
+                    proc.kill()
+
+    # Killing the passes at the deadline ends the lockstep read below with EOF
+    timer = threading.Timer(timeout, expire) if timeout is not None else None
+    try:
+        for seed in seeds:
+            stderr = tempfile.TemporaryFile()
+            stderr_files.append(stderr)
+            procs.append(subprocess.Popen(
+                argv, stdout=subprocess.PIPE, stderr=stderr,
+                env={**env, "PYTHONHASHSEED": seed},
+            ))
+        if timer is not None:
+            timer.daemon = True
+            timer.start()
+
+        hashers = [hashlib.sha256() for _ in procs]
+        documents = divergences = 0
+        first_divergence = None
+        while True:
+            lines = [proc.stdout.readline() for proc in procs]  # type: ignore[union-attr]
+            if not any(lines):
+                break
+            for hasher, line in zip(hashers, lines):
+                hasher.update(line)
+            if any(line != lines[0] for line in lines):
+                divergences += 1
+                if first_divergence is None:
+                    first_divergence = _divergence(
+                        [line or None for line in lines], seeds, documents
+                    )
+            documents += 1
+
+        errors = {}
+        for index, (seed, proc, stderr) in enumerate(zip(seeds, procs, stderr_files)):
+            remaining = None if timeout is None else max(0.0, started + timeout - time.perf_counter())
+            try:
+                returncode = proc.wait(timeout=remaining)
+            except subprocess.TimeoutExpired:
+                expire()
+                returncode = proc.wait()
+            if index in timed_out:
+                errors[seed] = f"timed out after {timeout:g}s"
+            elif returncode != 0:
+                stderr.seek(0)
+                message = stderr.read().decode("utf-8", "replace").strip()
+                errors[seed] = f"exit code {returncode}: {message[-500:]}"
+    finally:
+        if timer is not None:
+            timer.cancel()
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+                proc.wait()
+            if proc.stdout is not None:
+                proc.stdout.close()
+        for stderr in stderr_files:
+            stderr.close()
+
+    digests = {seed: hasher.hexdigest() for seed, hasher in zip(seeds, hashers)}
+    report: dict[str, Any] = {
+        "passes": len(seeds),
+        "seeds": seeds,
+        "documents": documents,
+        "digests": digests,
+        "divergences": divergences,
+        "deterministic": divergences == 0 and not errors and len(set(digests.values())) == 1,
+        "wall_seconds": round(time.perf_counter() - started, 6),
+    }
+    if first_divergence is not None:
+        report["first_divergence"] = first_divergence
+    if errors:
+        report["errors"] = errors
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Entry point for a single pass (used by check_determinism)."""
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m base120.determinism")
+    parser.add_argument("--schema-version", default=DEFAULT_VERSION)
+    parser.add_argument("paths", nargs="+")
+    args = parser.parse_args(argv)
+    out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="\n")
+    return run_pass(args.paths, out, args.schema_version)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,378 @@
+"""
+Base120 Registry Engine
+
+Loads several schema/registry versions side by side and routes each
+artifact to the version it declares, so mixed traffic (e.g. during a
+v1.0 -> v1.1 rollout) is validated in one process without reloading
+anything per request.
+
+Layout under the repository root:
+
+    schemas/<version>/artifact.schema.json
+    schemas/<version>/contract.schema.json
+    registries/<version>/{mappings,err}.json   (optional; defaults to
+                                                registries/*.json)
+
+Versions are loaded on first use and kept for the engine's lifetime.
+Identical documents are shared between versions, so versions that only
+differ in their schema reuse one parsed registry and therefore one set of
+compiled FM tables and cache fingerprints. Each version's schema gets its
+own compiled predicate.
+"""
+
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Optional, Sequence, Union
+)
+
+import hashlib
+import json
+import re
+import threading
+
+from base120.codec import loads
+from base120.contract.validate import check_contract
+from base120.inputs import is_contract, iter_documents
+from base120.report import artifact_record, contract_record, error_record, read_error_record
+from base120.validators.bitset import compile_tables
+from base120.validators.compiler import compile_schema
+from base120.validators.validate import validate_artifact, validate_artifacts
+
+if TYPE_CHECKING:
+    from base120.cache import ValidationCache
+    from base120.metrics import ValidationMetrics
+
+
+DEFAULT_ROOT = Path(__file__).parent.parent
+DEFAULT_VERSION = "v1.0.0"
+
+_VERSION = re.compile(r"^v(\d+)\.(\d+)\.(\d+)$")
+
+
+def version_key(version: str) -> tuple[int, int, int]:
+    """Sort key for ``vMAJOR.MINOR.PATCH`` version strings."""
+    match = _VERSION.match(version)
+    if match is None:
+        raise ValueError(f"Invalid version {version!r}: expected vMAJOR.MINOR.PATCH")
+    major, minor, patch = (int(part) for part in match.groups())
+    return major, minor, patch
+
+
+class UnknownVersionError(KeyError):
+    """Raised when an artifact or contract declares a version that is not available."""
+
+    def __init__(self, version: Any, available: Sequence[str]) -> None:
+        super().__init__(version)
+        self.version = version
+        self.available = tuple(available)
+
+    def __str__(self) -> str:
+        return (f"Unknown schema version {self.version!r} "
+                f"(available: {', '.join(self.available) or 'none'})")
+
+
+class RegistryVersion:
+    """
+    Schemas and registries of one version.
+
+    Attributes:
+        version: Version string (e.g. "v1.0.0")
+        schema: Artifact JSON schema
+        contract_schema: Contract JSON schema, or None if the version has none
+        mappings: Parsed mappings.json
+        err_registry: ERR registry entries
+        is_valid: compile_schema(schema), compiled once at load (None if
+            the schema needs jsonschema)
+        tables: FM bitset tables of mappings and err_registry (None if they
+            cannot be compiled); built here unless passed in
+
+    The documents are owned by the engine and never modified, so the
+    compiled predicate and tables stay in step with them.
+    """
+
+    __slots__ = ("version", "schema", "contract_schema", "mappings", "err_registry", "is_valid",
+                 "tables")
+
+    def __init__(
+        self,
+        version: str,
+        schema: Mapping[str, Any],
+        contract_schema: Optional[Mapping[str, Any]],
+        mappings: Mapping[str, Any],
+        err_registry: Sequence[Mapping[str, Any]],
+        tables: Any = None,
+    ) -> None:
+        self.version = version
+        self.schema = schema
+        self.contract_schema = contract_schema
+        self.mappings = mappings
+        self.err_registry = err_registry
+        self.is_valid = compile_schema(schema)
+        self.tables = tables if tables is not None else compile_tables(mappings, err_registry)
+
+    def validate(
+        self,
+        artifact: Mapping[str, Any],
+        event_sink: Optional[Callable[[Mapping[str, Any]], None]] = None,
+        metrics: Optional["ValidationMetrics"] = None,
+        cache: Optional["ValidationCache"] = None,
+    ) -> list[str]:
+        """validate_artifact() against this version."""
+        return validate_artifact(
+            artifact, self.schema, self.mappings, self.err_registry,
+            event_sink=event_sink, metrics=metrics, cache=cache, schema_version=self.version,
+            is_valid=self.is_valid, tables=self.tables,
+        )
+
+
+class RegistryEngine:
+    """
+    Version-aware validator over the versions found under `root`.
+
+    Artifacts declare their version in ``schema_version`` and contracts
+    in ``contract_version``. Artifacts without a declared version use
+    `default_version`; contracts declaring a version without its own
+    contract schema are checked against the default version's.
+
+    Thread-safe: versions load once under a lock and are read-only after.
+
+    Args:
+        root: Directory containing ``schemas/`` and ``registries/``
+        default_version: Version for artifacts that declare none
+        version_field: Artifact field holding the declared version
+        shared: Version -> name of a SharedRegistry segment
+            (base120.shared) to attach on first use instead of reading
+            that version's files; attachments stay open for the engine's
+            lifetime
+
+    Example:
+        >>> engine = RegistryEngine()
+        >>> engine.validate({"schema_version": "v1.1.0", ...})
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = DEFAULT_ROOT,
+        default_version: str = DEFAULT_VERSION,
+        version_field: str = "schema_version",
+        shared: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.version_field = version_field
+        schemas_dir = self.root / "schemas"
+        found = [
+            path.name for path in schemas_dir.iterdir()
+            if path.is_dir() and _VERSION.match(path.name)
+            and (path / "artifact.schema.json").is_file()
+        ] if schemas_dir.is_dir() else []
+        self.versions: tuple[str, ...] = tuple(sorted(found, key=version_key))
+        if default_version not in self.versions:
+            raise UnknownVersionError(default_version, self.versions)
+        self.default_version = default_version
+        self._loaded: dict[str, RegistryVersion] = {}
+        # BLAKE2b of file bytes -> parsed document, shared across versions
+        self._documents: dict[bytes, Any] = {}
+        # (id(mappings), id(err_registry)) -> tables; the documents above
+        # live as long as the engine, so their ids are never reused
+        self._tables: dict[tuple[int, int], Any] = {}
+        self._shared = dict(shared or {})
+        self._attached: list[Any] = []
+        self._lock = threading.Lock()
+
+    def _document(self, path: Path) -> Any:
+        data = path.read_bytes()
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        document = self._documents.get(digest)
+        if document is None:
+            document = self._documents[digest] = loads(data)
+        return document
+
+    def _registry_path(self, version: str, name: str) -> Path:
+        versioned = self.root / "registries" / version / name
+        return versioned if versioned.is_file() else self.root / "registries" / name
+
+    def get(self, version: str) -> RegistryVersion:
+        """Return a version, loading it on first use."""
+        loaded = self._loaded.get(version)
+        if loaded is not None:
+            return loaded
+        if version not in self.versions:
+            raise UnknownVersionError(version, self.versions)
+        with self._lock:
+            loaded = self._loaded.get(version)
+            if loaded is None and version in self._shared:
+                from base120.shared import SharedRegistry
+
+                registry = SharedRegistry.attach(self._shared[version])
+                self._attached.append(registry)
+                loaded = self._loaded[version] = registry.registry_version()
+            if loaded is None:
+                schema_dir = self.root / "schemas" / version
+                contract_path = schema_dir / "contract.schema.json"
+                mappings = self._document(self._registry_path(version, "mappings.json"))
+                err_registry = self._document(self._registry_path(version, "err.json"))["registry"]
+                key = (id(mappings), id(err_registry))
+                if key not in self._tables:
+                    self._tables[key] = compile_tables(mappings, err_registry)
+                loaded = RegistryVersion(
+                    version,
+                    self._document(schema_dir / "artifact.schema.json"),
+                    self._document(contract_path) if contract_path.is_file() else None,
+                    mappings,
+                    err_registry,
+                    self._tables[key],
+                )
+                self._loaded[version] = loaded
+        return loaded
+
+    def load_all(self) -> None:
+        """Load every available version now instead of on first use."""
+        for version in self.versions:
+            self.get(version)
+
+    def publish_shared(self) -> list[Any]:
+        """
+        Publish every version in a SharedRegistry segment.
+
+        Returns the registries; pass ``{r.version: r.name for r in ...}``
+        as ``shared`` to the engines of worker processes, and close() the
+        registries (which unlinks them) once the workers are done.
+        """
+        from base120.shared import SharedRegistry
+
+        published: list[Any] = []
+        try:
+            for name in self.versions:
+                version = self.get(name)
+                published.append(SharedRegistry.publish(
+                    version.schema, version.mappings, version.err_registry,
+                    contract_schema=version.contract_schema, version=name,
+                ))
+        except BaseException:
+            for registry in published:
+                registry.close()
+            raise
+        return published
+
+    def route(self, artifact: Mapping[str, Any]) -> RegistryVersion:
+        """Return the version an artifact declares (or the default)."""
+        declared = artifact.get(self.version_field)
+        if declared is None:
+            return self.get(self.default_version)
+        if not isinstance(declared, str):
+            raise UnknownVersionError(declared, self.versions)
+        return self.get(declared)
+
+    def route_contract(self, contract: Mapping[str, Any]) -> RegistryVersion:
+        """Return the version whose contract schema checks `contract`."""
+        declared = contract.get("contract_version")
+        if declared in self.versions and self.get(declared).contract_schema is not None:
+            return self.get(declared)
+        return self.get(self.default_version)
+
+    def validate(
+        self,
+        artifact: Mapping[str, Any],
+        event_sink: Optional[Callable[[Mapping[str, Any]], None]] = None,
+        metrics: Optional["ValidationMetrics"] = None,
+        cache: Optional["ValidationCache"] = None,
+    ) -> list[str]:
+        """
+        Validate one artifact against the version it declares.
+
+        Raises:
+            UnknownVersionError: If the declared version is not available
+        """
+        return self.route(artifact).validate(
+            artifact, event_sink=event_sink, metrics=metrics, cache=cache
+        )
+
+    def validate_many(
+        self,
+        artifacts: Iterable[Mapping[str, Any]],
+        event_sink: Optional[Callable[[Mapping[str, Any]], None]] = None,
+        metrics: Optional["ValidationMetrics"] = None,
+        cache: Optional["ValidationCache"] = None,
+    ) -> list[list[str]]:
+        """
+        Validate a mixed-version batch; results are in input order.
+
+        Artifacts are grouped per version and each group goes through
+        validate_artifacts(), so events are still emitted per batch (one
+        batch per version).
+
+        Raises:
+            UnknownVersionError: If any declared version is not available
+                (raised before anything is validated)
+        """
+        groups: dict[str, tuple[RegistryVersion, list[int], list[Mapping[str, Any]]]] = {}
+        count = 0
+        for artifact in artifacts:
+            version = self.route(artifact)
+            group = groups.setdefault(version.version, (version, [], []))
+            group[1].append(count)
+            group[2].append(artifact)
+            count += 1
+
+        results: list[list[str]] = [[] for _ in range(count)]
+        for version, positions, members in groups.values():
+            outcomes = validate_artifacts(
+                members, version.schema, version.mappings, version.err_registry,
+                event_sink=event_sink, metrics=metrics, cache=cache,
+                schema_version=version.version, is_valid=version.is_valid,
+                tables=version.tables,
+            )
+            for position, outcome in zip(positions, outcomes):
+                results[position] = outcome
+        return results
+
+
+def document_record(
+    engine: RegistryEngine,
+    location: str,
+    document: Any,
+    metrics: Optional["ValidationMetrics"] = None,
+    cache: Optional["ValidationCache"] = None,
+    event_sink: Optional[Callable[[Mapping[str, Any]], None]] = None,
+) -> dict[str, Any]:
+    """
+    Validate one input document and return its report record.
+
+    Contract units (documents with ``contract_version`` and
+    ``failure_graph``) are checked with check_contract() against their
+    version's contract schema; anything else is validated as an artifact.
+    Non-objects and unknown versions become ``"status": "error"`` records.
+    """
+    if not isinstance(document, Mapping):
+        return error_record(location, "Artifact is not a JSON object")
+    if is_contract(document):
+        contract_schema = engine.route_contract(document).contract_schema
+        if contract_schema is None:
+            return error_record(location, "No contract schema available", kind="contract")
+        _, errors, warnings = check_contract(document, contract_schema, metrics)
+        return contract_record(location, document, errors, warnings)
+    try:
+        errors = engine.validate(document, event_sink=event_sink, metrics=metrics, cache=cache)
+    except UnknownVersionError as e:
+        return error_record(location, str(e))
+    return artifact_record(location, document, errors)
+
+
+def iter_file_records(
+    path: Path,
+    engine: RegistryEngine,
+    metrics: Optional["ValidationMetrics"] = None,
+    cache: Optional["ValidationCache"] = None,
+    event_sink: Optional[Callable[[Mapping[str, Any]], None]] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield document_record() for every document in one input file.
+
+    Unreadable files yield an error record after any records already
+    produced for the documents before the failure.
+    """
+    try:
+        for location, document in iter_documents(path):
+            yield document_record(engine, location, document, metrics, cache, event_sink)
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        yield read_error_record(str(path), e)
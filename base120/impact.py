@@ -0,0 +1,220 @@
+"""
+Base120 Registry Impact Analysis
+
+Finds the stored artifacts whose error codes would change under a new
+mappings.json / ERR registry without re-validating the corpus. For a
+schema-valid artifact the outcome depends only on its subclass, so:
+
+1. an inverted index maps each subclass to the artifacts that use it
+   (built once, saved to disk and reused while the corpus is unchanged);
+2. the two registry versions are compared per subclass through their
+   FM bitset tables;
+3. only the artifacts of subclasses whose error codes differ are reported.
+
+Artifacts that fail the schema are not indexed: their outcome
+(ERR-SCHEMA-001) does not depend on the registries. Inputs that cannot
+be read are kept in the index as error records, and a file that fails
+partway contributes none of its artifacts, so its impact is never
+silently under-reported.
+"""
+
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Mapping, Optional, Sequence, Union
+
+import os
+
+from base120.cache import content_digest
+from base120.codec import loads
+from base120.inputs import iter_documents, iter_input_paths
+from base120.report import canonical_dumps, error_record, read_error_record
+from base120.validators.bitset import FMTables
+from base120.validators.compiler import Predicate
+from base120.validators.schema import validate_schema
+
+
+INDEX_FORMAT = 2
+
+
+def _source_stamp(path: Path) -> list[int]:
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+class SubclassIndex:
+    """
+    Inverted index: subclass -> [(location, artifact_id), ...].
+
+    Attributes:
+        classes: Subclass -> list of (location, artifact ID) pairs
+        sources: Input file -> [size, mtime_ns] when it was indexed
+        schema_digest: Hex digest of the schema used to filter artifacts
+        schema_failures: Artifacts left out because they fail the schema
+        errors: ``"status": "error"`` records for input files or entries
+            that could not be read
+    """
+
+    def __init__(
+        self,
+        classes: Mapping[str, Sequence[Sequence[Any]]],
+        sources: Mapping[str, Sequence[int]],
+        schema_digest: str,
+        schema_failures: int = 0,
+        errors: Sequence[Mapping[str, Any]] = (),
+    ) -> None:
+        self.classes = {subclass: [tuple(entry) for entry in entries]
+                        for subclass, entries in classes.items()}
+        self.sources = {path: list(stamp) for path, stamp in sources.items()}
+        self.schema_digest = schema_digest
+        self.schema_failures = schema_failures
+        self.errors = [dict(record) for record in errors]
+
+    @property
+    def unreadable(self) -> int:
+        """Number of input files or entries that could not be read."""
+        return len(self.errors)
+
+    @classmethod
+    def build(
+        cls,
+        paths: Sequence[str],
+        schema: Mapping[str, Any],
+        is_valid: Optional[Predicate] = None,
+    ) -> "SubclassIndex":
+        """
+        Index every schema-valid artifact under `paths`.
+
+        `is_valid` is an optional compile_schema(schema) predicate (e.g.
+        RegistryVersion.is_valid). Unreadable inputs become error records;
+        a file that fails partway is recorded as one error and none of its
+        artifacts are indexed.
+        """
+        classes: dict[str, list[tuple[str, Any]]] = {}
+        sources: dict[str, list[int]] = {}
+        schema_failures = 0
+        errors: list[dict[str, Any]] = []
+        for path in iter_input_paths(paths):
+            try:
+                stamp = _source_stamp(path)
+            except OSError as e:
+                errors.append(read_error_record(str(path), e))
+                continue
+            sources[str(path)] = stamp
+            entries: list[tuple[str, str, Any]] = []
+            file_errors: list[dict[str, Any]] = []
+            file_failures = 0
+            try:
+                for location, artifact in iter_documents(path):
+                    if not isinstance(artifact, Mapping):
+                        file_errors.append(error_record(location, "Artifact is not a JSON object"))
+                    elif validate_schema(artifact, schema, is_valid):
+                        file_failures += 1
+                    else:
+                        # Same key validate_artifact() resolves
+                        entries.append((str(artifact.get("class", "")), location,
+                                        artifact.get("id", "unknown")))
+            except (OSError, ValueError) as e:
+                errors.append(read_error_record(str(path), e))
+                continue
+            errors.extend(file_errors)
+            schema_failures += file_failures
+            for subclass, location, artifact_id in entries:
+                classes.setdefault(subclass, []).append((location, artifact_id))
+        return cls(classes, sources, content_digest(schema).hex(), schema_failures, errors)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SubclassIndex":
+        """Load an index written by save()."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = loads(f.read())
+        if data.get("format") != INDEX_FORMAT:
+            raise ValueError(f"Unsupported impact index format in {path}: {data.get('format')!r}")
+        return cls(data["classes"], data["sources"], data["schema_digest"],
+                   data.get("schema_failures", 0), data.get("errors", ()))
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the index as canonical JSON (atomically replaced)."""
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(canonical_dumps({
+                "format": INDEX_FORMAT,
+                "classes": self.classes,
+                "sources": self.sources,
+                "schema_digest": self.schema_digest,
+                "schema_failures": self.schema_failures,
+                "errors": self.errors,
+            }))
+        os.replace(tmp, path)
+
+    def is_current(self, paths: Sequence[str], schema: Mapping[str, Any]) -> bool:
+        """True if `paths` and `schema` are unchanged since the index was built."""
+        if self.schema_digest != content_digest(schema).hex():
+            return False
+        seen = set()
+        for path in iter_input_paths(paths):
+            key = str(path)
+            seen.add(key)
+            try:
+                if self.sources.get(key) != _source_stamp(path):
+                    return False
+            except OSError:
+                return False
+        return seen == set(self.sources)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.classes.values())
+
+
+def changed_subclasses(
+    subclasses: Iterable[str],
+    old_mappings: Mapping[str, Any],
+    old_err_registry: Sequence[Mapping[str, Any]],
+    new_mappings: Mapping[str, Any],
+    new_err_registry: Sequence[Mapping[str, Any]],
+) -> dict[str, tuple[tuple[str, ...], tuple[str, ...]]]:
+    """
+    Return {subclass: (old error codes, new error codes)} for the given
+    subclasses whose error codes differ between the two registry versions.
+    """
+    old = FMTables.compile(old_mappings, old_err_registry)
+    new = FMTables.compile(new_mappings, new_err_registry)
+    changed = {}
+    for subclass in subclasses:
+        before = old.errors(old.failure_modes(subclass)[0])
+        after = new.errors(new.failure_modes(subclass)[0])
+        if before != after:
+            changed[subclass] = (before, after)
+    return changed
+
+
+def analyze_impact(
+    index: SubclassIndex,
+    old_mappings: Mapping[str, Any],
+    old_err_registry: Sequence[Mapping[str, Any]],
+    new_mappings: Mapping[str, Any],
+    new_err_registry: Sequence[Mapping[str, Any]],
+    subclasses: Optional[dict[str, tuple[tuple[str, ...], tuple[str, ...]]]] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield one record per indexed artifact whose error codes change.
+
+    Records are ordered by subclass, then by corpus order, and carry
+    ``errors`` (new codes) and ``previous_errors`` (old codes). Pass the
+    result of changed_subclasses() as `subclasses` to reuse it.
+    """
+    if subclasses is None:
+        subclasses = changed_subclasses(
+            index.classes, old_mappings, old_err_registry, new_mappings, new_err_registry
+        )
+    for subclass in sorted(subclasses):
+        before, after = subclasses[subclass]
+        for location, artifact_id in index.classes.get(subclass, ()):
+            yield {
+                "record_type": "result",
+                "kind": "impact",
+                "path": location,
+                "artifact_id": artifact_id,
+                "class": subclass,
+                "status": "fail" if after else "pass",
+                "errors": list(after),
+                "previous_errors": list(before),
+            }
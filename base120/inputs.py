@@ -0,0 +1,321 @@
+"""
+Base120 Input Readers
+
+Lazy iteration over artifact and contract inputs for bulk commands.
+Files holding a top-level JSON array are streamed element by element, so
+memory stays bounded by the largest element rather than the file size.
+An accelerated streaming backend (ijson) is used when installed and
+selected with BASE120_STREAM_BACKEND=ijson; otherwise the standard
+json module is used.
+"""
+
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional, Sequence, TextIO
+
+import io
+import json
+import os
+import re
+
+from base120.codec import loads
+from base120.compression import logical_name, open_binary_input, open_input
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+
+STREAM_BACKENDS = ("stdlib", "ijson")
+STREAM_CHUNK_SIZE = 1 << 16
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+# Longest lookahead the decoder needs (literals such as -Infinity,
+# surrogate-pair escapes, number suffixes); values or errors closer than
+# this to the end of the buffer may continue in the next chunk
+_LOOKAHEAD = 16
+
+
+def iter_input_paths(paths: Sequence[str]) -> Iterator[Path]:
+    """
+    Yield input files in deterministic order.
+    
+    Directories are walked recursively (sorted, one directory at a time)
+    for *.json and *.ndjson files, plain or compressed (.gz, .bz2, .xz).
+    """
+    for raw in paths:
+        path = Path(raw)
+        if not path.is_dir():
+            yield path
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for name in sorted(filenames):
+                if logical_name(name).endswith((".json", ".ndjson")):
+                    yield Path(dirpath) / name
+
+
+def is_expected_output(path: Path, root: Optional[Path] = None) -> bool:
+    """
+    True for expected-output files of a corpus (``expected/`` directories
+    and ``*.expected.ndjson``), which hold results rather than inputs.
+
+    Only directories below the corpus `root` (the path that was passed in)
+    count, so a checkout that happens to live under some ``expected/``
+    directory is not mistaken for one. Without `root`, only the file's own
+    parent directory is considered.
+    """
+    if logical_name(path).endswith(".expected.ndjson"):
+        return True
+    if root is None:
+        return path.parent.name == "expected"
+    try:
+        return "expected" in path.parent.relative_to(root).parts
+    except ValueError:
+        return False
+
+
+def iter_corpus_paths(paths: Sequence[str]) -> Iterator[Path]:
+    """
+    Yield the input files under `paths` as iter_input_paths() does,
+    skipping expected outputs below each given path.
+    """
+    for raw in paths:
+        root = Path(raw)
+        for path in iter_input_paths([raw]):
+            if not is_expected_output(path, root):
+                yield path
+
+
+def is_contract(document: Any) -> bool:
+    """True if a document looks like a contract unit rather than an artifact."""
+    return (isinstance(document, dict)
+            and "contract_version" in document and "failure_graph" in document)
+
+
+def stream_backend(name: Optional[str] = None) -> str:
+    """
+    Resolve the streaming backend for top-level arrays.
+
+    `name` defaults to $BASE120_STREAM_BACKEND (or "stdlib"); "ijson"
+    falls back to "stdlib" when ijson is not installed.
+
+    Raises:
+        ValueError: If the name is not one of STREAM_BACKENDS
+    """
+    if name is None:
+        name = os.environ.get("BASE120_STREAM_BACKEND") or "stdlib"
+    if name not in STREAM_BACKENDS:
+        raise ValueError(f"Unknown stream backend {name!r} "
+                         f"(expected one of: {', '.join(STREAM_BACKENDS)})")
+    return "ijson" if name == "ijson" and ijson is not None else "stdlib"
+
+
+def iter_json_array(f: TextIO, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Yield the elements of the top-level JSON array read from `f`.
+
+    Reads `chunk_size` characters at a time and decodes each element with
+    json.JSONDecoder.raw_decode() as soon as it is complete, so at most one
+    element plus one chunk is buffered. Elements are identical to those of
+    json.load(). Malformed input raises json.JSONDecodeError (with line and
+    column relative to the whole file) after the elements before it.
+    """
+    buf = _read_until_value(f, chunk_size)
+    start = _skip_whitespace(buf, 0)
+    if buf[start:start + 1] != "[":
+        raise json.JSONDecodeError("Expecting '['", buf, start)
+    yield from _iter_array(f, buf, start + 1, chunk_size)
+
+
+def iter_documents(path: Path, backend: Optional[str] = None) -> Iterator[tuple[str, Any]]:
+    """
+    Yield (location, document) pairs from an input file.
+    
+    *.ndjson files yield one document per non-empty line; a JSON file whose
+    top level is an array yields each element as it is parsed (see
+    iter_json_array(); `backend` as for stream_backend()); any other JSON
+    file yields itself. Compressed files (see open_input()) are
+    decompressed on the fly. Parse errors propagate as
+    json.JSONDecodeError / OSError, after the documents that precede them.
+    """
+    if logical_name(path).endswith(".ndjson"):
+        with open_input(path) as f:
+            for lineno, line in enumerate(f, 1):
+                if line.strip():
+                    yield f"{path}:{lineno}", loads(line)
+        return
+    if stream_backend(backend) == "ijson":
+        with open_binary_input(path) as fb:
+            yield from _iter_documents_ijson(path, fb)
+        return
+    with open_input(path) as f:
+        buf = _read_until_value(f, STREAM_CHUNK_SIZE)
+        start = _skip_whitespace(buf, 0)
+        if buf[start:start + 1] == "[":
+            for i, item in enumerate(_iter_array(f, buf, start + 1, STREAM_CHUNK_SIZE)):
+                yield f"{path}[{i}]", item
+            return
+        data = loads(buf + f.read())
+    yield str(path), data
+
+
+def iter_text_documents(path: Path, text: str) -> Iterator[tuple[str, Any]]:
+    """
+    Yield (location, document) pairs from the already-read contents of
+    `path` (already decompressed), with the same rules and locations as
+    iter_documents().
+    """
+    if logical_name(path).endswith(".ndjson"):
+        # Same newline translation as reading the file in text mode
+        for lineno, line in enumerate(io.StringIO(text, newline=None), 1):
+            if line.strip():
+                yield f"{path}:{lineno}", loads(line)
+        return
+    yield from _split_documents(path, loads(text))
+
+
+def _skip_whitespace(buf: str, pos: int) -> int:
+    return _WHITESPACE.match(buf, pos).end()  # type: ignore[union-attr]
+
+
+def _read_until_value(f: TextIO, chunk_size: int) -> str:
+    """Read chunks until the buffer holds a non-whitespace character (or EOF)."""
+    buf = f.read(chunk_size)
+    while buf and _skip_whitespace(buf, 0) == len(buf):
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        buf += chunk
+    return buf
+
+
+def _iter_array(f: TextIO, buf: str, pos: int, chunk_size: int) -> Iterator[Any]:
+    """
+    Stream array elements from `buf[pos:]` (just past the opening bracket)
+    followed by the rest of `f`.
+    """
+    decode = _DECODER.raw_decode
+    skip = _WHITESPACE.match
+    eof = False
+    # Position of buf[0] in the file, and line bookkeeping for the consumed prefix
+    offset = lines = line_start = 0
+
+    def fill(minimum: int) -> None:
+        # Drop the consumed prefix and read at least `minimum` more characters
+        nonlocal buf, pos, eof, offset, lines, line_start
+        dropped = buf[:pos]
+        newlines = dropped.count("\n")
+        if newlines:
+            lines += newlines
+            line_start = offset + dropped.rindex("\n") + 1
+        offset += pos
+        parts = [buf[pos:]]
+        wanted = max(minimum, chunk_size)
+        while wanted > 0:
+            chunk = f.read(wanted)
+            if not chunk:
+                eof = True
+                break
+            parts.append(chunk)
+            wanted -= len(chunk)
+        buf = "".join(parts)
+        pos = 0
+
+    def error(msg: str, at: int) -> json.JSONDecodeError:
+        # Report the position within the whole file, as json.load() would
+        lineno = lines + buf.count("\n", 0, at) + 1
+        newline = buf.rfind("\n", 0, at)
+        colno = at - newline if newline >= 0 else offset + at - line_start + 1
+        err = json.JSONDecodeError(msg, buf, at)
+        err.pos, err.lineno, err.colno = offset + at, lineno, colno
+        err.args = (f"{msg}: line {lineno} column {colno} (char {offset + at})",)
+        return err
+
+    def next_token() -> str:
+        nonlocal pos
+        pos = skip(buf, pos).end()
+        while pos == len(buf) and not eof:
+            fill(0)
+            pos = skip(buf, pos).end()
+        return buf[pos:pos + 1]
+
+    token = next_token()
+    if token == "]":
+        pos += 1
+    else:
+        while True:
+            if not token:
+                raise error("Expecting value", pos)
+            while True:
+                try:
+                    item, end = decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    truncated = (e.pos >= len(buf) - _LOOKAHEAD
+                                 or e.msg.startswith("Unterminated string"))
+                    if eof or not truncated:
+                        raise error(e.msg, e.pos)
+                else:
+                    # A number near the buffer end may continue in the next
+                    # chunk ("0." decodes as 0 until the fraction arrives)
+                    if eof or end < len(buf) - _LOOKAHEAD:
+                        break
+                # Read at least as much again as is pending, so re-scanning a
+                # large element stays linear overall
+                fill(len(buf) - pos)
+            yield item
+            pos = end
+            token = next_token()
+            if token == "]":
+                pos += 1
+                break
+            if token != ",":
+                raise error("Expecting ',' delimiter", pos)
+            pos += 1
+            token = next_token()
+
+    if next_token():
+        raise error("Extra data", pos)
+
+
+def _iter_documents_ijson(path: Path, f: BinaryIO) -> Iterator[tuple[str, Any]]:
+    """iter_documents() for one JSON file using the ijson backend."""
+    head = f.read(STREAM_CHUNK_SIZE)
+    while head and not head.strip():
+        chunk = f.read(STREAM_CHUNK_SIZE)
+        if not chunk:
+            break
+        head += chunk
+    if not head.lstrip().startswith(b"["):
+        data = loads((head + f.read()).decode("utf-8"))
+        yield str(path), data
+        return
+    # Push parser: the stream need not be seekable (compressed inputs)
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, "item", use_float=True)
+    index = 0
+    try:
+        while head:
+            parser.send(head)
+            for item in items:
+                yield f"{path}[{index}]", item
+                index += 1
+            del items[:]
+            head = f.read(STREAM_CHUNK_SIZE)
+        parser.close()
+        for item in items:
+            yield f"{path}[{index}]", item
+            index += 1
+    except ijson.JSONError as e:
+        err = json.JSONDecodeError(str(e), "", 0)
+        err.args = (str(e),)
+        raise err from e
+
+
+def _split_documents(path: Path, data: Any) -> Iterator[tuple[str, Any]]:
+    if isinstance(data, list):
+        for i, item in enumerate(data):
+            yield f"{path}[{i}]", item
+    else:
+        yield str(path), data
@@ -0,0 +1,242 @@
+"""
+Base120 Metrics
+
+Opt-in, in-process metrics for validation runs: per-stage latency
+histograms, counts by result, error code and failure mode, and throughput.
+Exportable as a snapshot dict or in Prometheus text exposition format.
+
+Validators only touch metrics when a ValidationMetrics instance is passed,
+so disabled metrics cost a single ``is None`` check per stage.
+"""
+
+from bisect import bisect_left
+from typing import Any, Iterable, Optional
+
+import threading
+import time
+
+
+# Latency bucket upper bounds in seconds (Prometheus "le" values)
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0,
+)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (cumulative on export)."""
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # last slot is +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Return (le, cumulative count) pairs including +Inf."""
+        pairs = []
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            pairs.append((_format_bound(bound), running))
+        pairs.append(("+Inf", running + self.counts[-1]))
+        return pairs
+
+
+def _format_bound(value: float) -> str:
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Stopwatch:
+    """
+    Times consecutive stages of one validation call.
+
+    Created via ValidationMetrics.stopwatch(); each lap() records the time
+    since the previous lap under the given stage name, and finish() records
+    the total plus result counters.
+    """
+
+    __slots__ = ("_metrics", "_kind", "_started", "_last")
+
+    def __init__(self, metrics: "ValidationMetrics", kind: str) -> None:
+        self._metrics = metrics
+        self._kind = kind
+        self._started = self._last = metrics.clock()
+
+    def lap(self, stage: str) -> None:
+        now = self._metrics.clock()
+        self._metrics.observe_stage(self._kind, stage, now - self._last)
+        self._last = now
+
+    def finish(
+        self,
+        error_codes: Iterable[str],
+        failure_mode_ids: Iterable[str] = (),
+    ) -> None:
+        now = self._metrics.clock()
+        self._metrics.observe_stage(self._kind, "total", now - self._started)
+        self._metrics.count_result(
+            self._kind, error_codes, failure_mode_ids, at=now, started=self._started
+        )
+
+
+class ValidationMetrics:
+    """
+    Thread-safe metrics registry for validation runs.
+
+    Pass an instance as ``metrics=`` to validate_artifact() or
+    validate_contract() to record stage latencies and outcome counts.
+
+    Example:
+        >>> metrics = ValidationMetrics()
+        >>> validate_artifact(artifact, schema, mappings, err_registry, metrics=metrics)
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        clock: Any = time.perf_counter,
+    ) -> None:
+        self.buckets = buckets
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._stages: dict[tuple[str, str], Histogram] = {}
+        self._results: dict[tuple[str, str], int] = {}
+        self._error_codes: dict[tuple[str, str], int] = {}
+        self._failure_modes: dict[str, int] = {}
+        self._first: Optional[float] = None
+        self._last: Optional[float] = None
+
+    def stopwatch(self, kind: str) -> Stopwatch:
+        """Start timing one validation of the given kind ("artifact", "contract")."""
+        return Stopwatch(self, kind)
+
+    def observe_stage(self, kind: str, stage: str, seconds: float) -> None:
+        """Record one stage latency."""
+        key = (kind, stage)
+        with self._lock:
+            histogram = self._stages.get(key)
+            if histogram is None:
+                histogram = self._stages[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def count_result(
+        self,
+        kind: str,
+        error_codes: Iterable[str],
+        failure_mode_ids: Iterable[str] = (),
+        at: Optional[float] = None,
+        started: Optional[float] = None,
+    ) -> None:
+        """
+        Record the outcome of one validation.
+        
+        `at` and `started` are clock readings for the end and start of the
+        validation; they bound the window used for throughput.
+        """
+        codes = list(error_codes)
+        at = self.clock() if at is None else at
+        key = (kind, "failure" if codes else "success")
+        with self._lock:
+            self._results[key] = self._results.get(key, 0) + 1
+            for code in codes:
+                code_key = (kind, code)
+                self._error_codes[code_key] = self._error_codes.get(code_key, 0) + 1
+            for fm in failure_mode_ids:
+                self._failure_modes[fm] = self._failure_modes.get(fm, 0) + 1
+            begin = at if started is None else started
+            if self._first is None or begin < self._first:
+                self._first = begin
+            if self._last is None or at > self._last:
+                self._last = at
+
+    def _throughput(self) -> tuple[int, float, Optional[float]]:
+        total = sum(self._results.values())
+        if self._first is None or self._last is None:
+            return total, 0.0, None
+        elapsed = self._last - self._first
+        return total, elapsed, (total / elapsed if elapsed > 0 else None)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return all metrics as a JSON-compatible dict."""
+        with self._lock:
+            stages: dict[str, dict[str, Any]] = {}
+            for (kind, stage), histogram in sorted(self._stages.items()):
+                stages.setdefault(kind, {})[stage] = {
+                    "count": histogram.count,
+                    "sum_seconds": histogram.sum,
+                    "buckets": dict(histogram.cumulative()),
+                }
+            results: dict[str, dict[str, int]] = {}
+            for (kind, result), count in sorted(self._results.items()):
+                results.setdefault(kind, {})[result] = count
+            error_codes: dict[str, dict[str, int]] = {}
+            for (kind, code), count in sorted(self._error_codes.items()):
+                error_codes.setdefault(kind, {})[code] = count
+            total, elapsed, rate = self._throughput()
+            return {
+                "stages": stages,
+                "validations": results,
+                "error_codes": error_codes,
+                "failure_modes": dict(sorted(self._failure_modes.items())),
+                "throughput": {
+                    "validations": total,
+                    "elapsed_seconds": elapsed,
+                    "per_second": rate,
+                },
+            }
+
+    def to_prometheus(self, prefix: str = "base120") -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            name = f"{prefix}_stage_duration_seconds"
+            lines.append(f"# HELP {name} Latency of each validation stage.")
+            lines.append(f"# TYPE {name} histogram")
+            for (kind, stage), histogram in sorted(self._stages.items()):
+                labels = f'kind="{_escape_label(kind)}",stage="{_escape_label(stage)}"'
+                for le, count in histogram.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+            name = f"{prefix}_validations_total"
+            lines.append(f"# HELP {name} Validations by kind and result.")
+            lines.append(f"# TYPE {name} counter")
+            for (kind, result), count in sorted(self._results.items()):
+                lines.append(
+                    f'{name}{{kind="{_escape_label(kind)}",result="{_escape_label(result)}"}} {count}'
+                )
+
+            name = f"{prefix}_errors_total"
+            lines.append(f"# HELP {name} Error codes emitted by kind.")
+            lines.append(f"# TYPE {name} counter")
+            for (kind, code), count in sorted(self._error_codes.items()):
+                lines.append(
+                    f'{name}{{kind="{_escape_label(kind)}",code="{_escape_label(code)}"}} {count}'
+                )
+
+            name = f"{prefix}_failure_modes_total"
+            lines.append(f"# HELP {name} Failure modes resolved during artifact validation.")
+            lines.append(f"# TYPE {name} counter")
+            for fm, count in sorted(self._failure_modes.items()):
+                lines.append(f'{name}{{fm="{_escape_label(fm)}"}} {count}')
+
+            _, _, rate = self._throughput()
+            name = f"{prefix}_validations_per_second"
+            lines.append(f"# HELP {name} Validation throughput since the first validation started.")
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name} {float(rate or 0.0)!r}")
+        return "\n".join(lines) + "\n"
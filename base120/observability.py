@@ -1,17 +1,45 @@
 """
 Base120 Observability Layer
 
-Provides structured event emission for validator runs.
-Uses standard library only - no runtime dependencies.
+Provides structured event emission for validator runs. Event lines are
+written by base120.codec, which uses orjson when it is installed.
 """
 
-from typing import Any, Callable, Iterable, Mapping, Optional, TextIO, cast
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence, TextIO, cast
 
-import json
+import gzip
+import hashlib
 import os
+import shutil
 import sys
+import threading
+import time
 from datetime import datetime, timezone
 
+from base120.codec import dumps
+from base120.compression import COMPRESSIONS, compression_for, compressor
+
+try:
+    import fcntl
+    LOCK_SH, LOCK_EX, LOCK_UN = fcntl.LOCK_SH, fcntl.LOCK_EX, fcntl.LOCK_UN
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+    LOCK_SH = LOCK_EX = LOCK_UN = 0
+
+
+EventSink = Callable[[Mapping[str, Any]], None]
+
+# Uncompressed bytes a compressed file sink collects in its open stream
+# before appending it to the log
+COMPRESSED_FLUSH_BYTES = 1 << 20
+
+
+def _event_timestamp() -> str:
+    """Current event timestamp, or BASE120_FIXED_TIMESTAMP when set."""
+    if "BASE120_FIXED_TIMESTAMP" in os.environ:
+        return os.environ["BASE120_FIXED_TIMESTAMP"]
+    return datetime.now(timezone.utc).isoformat()
+
 
 def create_event_sink(output: Optional[TextIO] = None) -> Callable[[Mapping[str, Any]], None]:
     """
@@ -33,8 +61,8 @@ def create_event_sink(output: Optional[TextIO] = None) -> Callable[[Mapping[str,
         
     def sink(event: Mapping[str, Any]) -> None:
         try:
-            json.dump(event, output)
-            output.write('\n')
+            # One write per event keeps records whole on shared outputs
+            output.write(dumps(event) + "\n")
             output.flush()
         except Exception:
             # Never propagate event emission errors
@@ -51,6 +79,7 @@ def create_validator_event(
     error_codes: Iterable[str],
     failure_mode_ids: Iterable[str],
     correlation_id: Optional[str] = None,
+    spans: Optional[Sequence[Mapping[str, Any]]] = None,
 ) -> Mapping[str, Any]:
     """
     Create a validator_result event conforming to the observability schema.
@@ -62,15 +91,13 @@ def create_validator_event(
         error_codes: List of error code strings
         failure_mode_ids: List of failure mode ID strings
         correlation_id: Optional correlation ID for request tracing
+        spans: Optional stage spans recorded under a trace
         
     Returns:
         Dict conforming to validator_result event schema
     """
     # Use fixed timestamp for deterministic testing
-    if "BASE120_FIXED_TIMESTAMP" in os.environ:
-        timestamp = os.environ["BASE120_FIXED_TIMESTAMP"]
-    else:
-        timestamp = datetime.now(timezone.utc).isoformat()
+    timestamp = _event_timestamp()
     
     event: dict[str, Any] = {
         "event_type": "validator_result",
@@ -84,5 +111,531 @@ def create_validator_event(
     
     if correlation_id is not None:
         event["correlation_id"] = correlation_id
+    if spans is not None:
+        event["spans"] = spans
     
     return event
+
+
+def create_validator_events(
+    results: Iterable[tuple[str, Sequence[str], Sequence[str]]],
+    schema_version: str,
+    correlation_id: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """
+    Create validator_result events for a batch of results.
+    
+    Unlike create_validator_event(), configuration and the clock are read
+    once per batch: every event in the batch shares one timestamp. The
+    error code and failure mode lists are reused as-is, so they must already
+    be canonical (error codes sorted and deduplicated, failure mode IDs
+    sorted), as produced by validate_artifacts().
+    
+    Args:
+        results: (artifact_id, error_codes, failure_mode_ids) tuples
+        schema_version: Schema version string (e.g., "v1.0.0")
+        correlation_id: Optional correlation ID applied to every event
+        
+    Returns:
+        List of dicts conforming to validator_result event schema
+    """
+    timestamp = _event_timestamp()
+    events = [
+        {
+            "event_type": "validator_result",
+            "artifact_id": artifact_id,
+            "schema_version": schema_version,
+            "result": "failure" if error_codes else "success",
+            "error_codes": error_codes,
+            "failure_mode_ids": failure_mode_ids,
+            "timestamp": timestamp,
+        }
+        for artifact_id, error_codes, failure_mode_ids in results
+    ]
+    if correlation_id is not None:
+        for event in events:
+            event["correlation_id"] = correlation_id
+    return events
+
+
+class BatchEventSink:
+    """
+    JSON-lines event sink that can write a whole batch in one call.
+    
+    Usable anywhere a plain sink is accepted; batch-aware callers such as
+    validate_artifacts() use write_batch() to serialize a batch into a
+    single ``write`` and ``flush`` on the output.
+    
+    Created via create_batch_event_sink().
+    """
+    
+    def __init__(self, output: TextIO) -> None:
+        self._output = output
+    
+    def __call__(self, event: Mapping[str, Any]) -> None:
+        self.write_batch((event,))
+    
+    def write_batch(self, events: Iterable[Mapping[str, Any]]) -> None:
+        """Write events as JSON lines with a single write call."""
+        try:
+            self._output.write("".join([dumps(event) + "\n" for event in events]))
+            self._output.flush()
+        except Exception:
+            # Never propagate event emission errors
+            pass
+
+
+def create_batch_event_sink(output: Optional[TextIO] = None) -> BatchEventSink:
+    """
+    Create a JSON-lines event sink with a batch write path.
+    
+    Args:
+        output: File-like object for output (default: sys.stdout)
+        
+    Returns:
+        BatchEventSink writing one JSON object per line
+        
+    Example:
+        >>> sink = create_batch_event_sink()
+        >>> validate_artifacts(artifacts, schema, mappings, err_registry, event_sink=sink)
+    """
+    return BatchEventSink(cast(TextIO, output if output is not None else sys.stdout))
+
+
+class FileEventSink:
+    """
+    JSON-lines file sink safe for concurrent threads and processes.
+    
+    Every record (or batch of records) is appended with a single ``write``
+    on a descriptor opened with ``O_APPEND``, so lines from different
+    workers never interleave. Rotation is coordinated through an advisory
+    ``flock`` on ``<path>.lock``: writers hold a shared lock while checking
+    that `path` still names their file and appending; the rotating process
+    takes the exclusive lock, renames the file to a timestamped segment and
+    lets every writer reopen `path` on its next write. Rotated segments are
+    only compressed after the exclusive lock is released, when no writer
+    can still be appending to them.
+    
+    Without ``fcntl`` (Windows), writes are still single appends but
+    rotation is only coordinated between threads of one process.
+    
+    With a `compression`, events are fed to one open gzip, bz2 or xz
+    stream, which is finished and appended with a single write once it
+    holds `flush_bytes` of JSON lines, when a new rotation interval starts,
+    and on flush() or close(). Each append is a complete stream and
+    concatenated streams decompress as a single file, so appends stay
+    atomic and the log remains readable while being written. Events still
+    in the open stream are not in the file yet: call flush() (or close())
+    to make them visible and at shutdown.
+    
+    Created via create_file_event_sink().
+    """
+    
+    def __init__(
+        self,
+        path: str,
+        max_bytes: Optional[int] = None,
+        rotate_interval: Optional[float] = None,
+        compress: bool = False,
+        clock: Callable[[], float] = time.time,
+        compression: Optional[str] = None,
+        flush_bytes: int = COMPRESSED_FLUSH_BYTES,
+    ) -> None:
+        self.path = os.fspath(path)
+        self._compression = compression
+        self._flush_bytes = flush_bytes
+        # Open compressed stream: compressor, output so far, input size and
+        # the time of its first event (which decides its segment)
+        self._stream: Any = None
+        self._stream_chunks: list[bytes] = []
+        self._stream_size = 0
+        self._stream_started = 0.0
+        self._max_bytes = max_bytes
+        self._interval = rotate_interval
+        self._compress = compress
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._lock_fd = -1
+        if fcntl is not None and (max_bytes is not None or rotate_interval is not None):
+            self._lock_fd = os.open(self.path + ".lock", os.O_WRONLY | os.O_CREAT, 0o644)
+        self._fd = -1
+        self._inode = -1
+        self._bucket = 0
+        self._open()
+    
+    def _period(self, seconds: float) -> int:
+        return int(seconds // self._interval) if self._interval else 0
+    
+    def _open(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        stat = os.fstat(self._fd)
+        self._inode = stat.st_ino
+        # An existing file belongs to the period of its last write
+        self._bucket = self._period(stat.st_mtime if stat.st_size else self._clock())
+    
+    def _flock(self, operation: int) -> None:
+        if self._lock_fd >= 0:
+            fcntl.flock(self._lock_fd, operation)
+    
+    def _needs_rotation(self, size: int, now: float) -> bool:
+        if self._max_bytes is not None and size >= self._max_bytes:
+            return True
+        return self._interval is not None and size > 0 and self._period(now) != self._bucket
+    
+    def __call__(self, event: Mapping[str, Any]) -> None:
+        self.write_batch((event,))
+    
+    def write_batch(self, events: Iterable[Mapping[str, Any]]) -> None:
+        """Append events as JSON lines with a single write call."""
+        try:
+            data = "".join([dumps(event) + "\n" for event in events]).encode("utf-8")
+            if not data:
+                return
+            with self._lock:
+                if self._compression is None:
+                    self._append(data, self._clock())
+                else:
+                    self._feed_stream(data)
+        except Exception:
+            # Never propagate event emission errors
+            pass
+    
+    def _feed_stream(self, data: bytes) -> None:
+        """Feed lines to the open compressed stream (lock held)."""
+        now = self._clock()
+        if self._stream is not None and self._period(now) != self._period(self._stream_started):
+            # The open stream belongs to the previous interval's segment
+            self._flush_stream()
+        if self._stream is None:
+            self._stream = compressor(cast(str, self._compression))
+            self._stream_started = now
+        self._stream_chunks.append(self._stream.compress(data))
+        self._stream_size += len(data)
+        if self._stream_size >= self._flush_bytes:
+            self._flush_stream()
+    
+    def _flush_stream(self) -> None:
+        """Finish the open compressed stream and append it (lock held)."""
+        if self._stream is None:
+            return
+        self._stream_chunks.append(self._stream.flush())
+        data = b"".join(self._stream_chunks)
+        self._stream = None
+        self._stream_chunks = []
+        self._stream_size = 0
+        self._append(data, self._stream_started)
+    
+    def flush(self) -> None:
+        """Append the events of the open compressed stream to the log."""
+        try:
+            with self._lock:
+                self._flush_stream()
+        except Exception:
+            # Never propagate event emission errors
+            pass
+    
+    def _append(self, data: bytes, now: float) -> None:
+        rotated = None
+        if self._max_bytes is not None or self._interval is not None:
+            self._flock(LOCK_SH)
+            try:
+                try:
+                    current = os.stat(self.path).st_ino
+                except FileNotFoundError:
+                    current = -1
+                if current != self._inode:
+                    # Rotated by another writer
+                    self._open()
+                if self._needs_rotation(os.fstat(self._fd).st_size, now):
+                    self._flock(LOCK_EX)
+                    rotated = self._rotate(now)
+                os.write(self._fd, data)
+            finally:
+                self._flock(LOCK_UN)
+        else:
+            os.write(self._fd, data)
+        if rotated is not None and self._compress:
+            _gzip_segment(rotated)
+    
+    def _rotate(self, now: float) -> Optional[str]:
+        """Rename the active file to a new segment (exclusive lock held)."""
+        stat = os.stat(self.path)
+        if stat.st_ino != self._inode:
+            # Another process rotated while we waited for the lock
+            self._open()
+            return None
+        if not self._needs_rotation(stat.st_size, now):
+            return None
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime(self._clock()))
+        # Compressed logs keep their extension last: events.ndjson.<stamp>.gz
+        suffix = COMPRESSIONS[self._compression] if self._compression else ""
+        base = self.path[:len(self.path) - len(suffix)]
+        segment = f"{base}.{stamp}{suffix}"
+        sequence = 0
+        while os.path.exists(segment) or os.path.exists(segment + ".gz"):
+            sequence += 1
+            segment = f"{base}.{stamp}.{sequence}{suffix}"
+        os.rename(self.path, segment)
+        self._open()
+        return segment
+    
+    def close(self) -> None:
+        """Flush the open compressed stream; close the file and lock descriptors."""
+        with self._lock:
+            try:
+                self._flush_stream()
+            except Exception:
+                # Never propagate event emission errors
+                pass
+            for fd in (self._fd, self._lock_fd):
+                if fd >= 0:
+                    os.close(fd)
+            self._fd = self._lock_fd = -1
+    
+    def __enter__(self) -> "FileEventSink":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def _gzip_segment(segment: str) -> None:
+    """Compress a rotated segment to ``<segment>.gz`` and remove it."""
+    partial = segment + ".gz.tmp"
+    with open(segment, "rb") as src, gzip.open(partial, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    os.replace(partial, segment + ".gz")
+    os.unlink(segment)
+
+
+def create_file_event_sink(
+    path: str,
+    max_bytes: Optional[int] = None,
+    rotate_interval: Optional[float] = None,
+    compress: bool = False,
+    clock: Callable[[], float] = time.time,
+    compression: Optional[str] = None,
+    flush_bytes: int = COMPRESSED_FLUSH_BYTES,
+) -> FileEventSink:
+    """
+    Create a JSON-lines file sink for multi-process and multi-thread use.
+    
+    Any number of threads and worker processes may open a sink on the same
+    `path`; each record is appended atomically and rotation is coordinated
+    between them. Rotated segments are named ``<path>.<UTC timestamp>``.
+    
+    Args:
+        path: Active log file
+        max_bytes: Rotate once the file reaches this size
+        rotate_interval: Rotate at the first write in each new interval of
+            this many seconds (aligned to the Unix epoch, e.g. 3600 = hourly)
+        compress: Gzip rotated segments to ``<segment>.gz``
+        clock: Wall clock used for time-based rotation
+        compression: Write the log itself compressed ("gzip", "bz2" or
+            "xz"); defaults to the extension of `path` (e.g. ``.gz``)
+        flush_bytes: With `compression`, append the open compressed stream
+            once it holds this many bytes of JSON lines
+        
+    Returns:
+        FileEventSink (callable, with write_batch() and close())
+        
+    Example:
+        >>> sink = create_file_event_sink("events.ndjson", max_bytes=64 << 20, compress=True)
+        >>> validate_artifact(artifact, schema, mappings, err_registry, event_sink=sink)
+    """
+    if max_bytes is not None and max_bytes <= 0:
+        raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+    if rotate_interval is not None and rotate_interval <= 0:
+        raise ValueError(f"rotate_interval must be positive, got {rotate_interval}")
+    if flush_bytes <= 0:
+        raise ValueError(f"flush_bytes must be positive, got {flush_bytes}")
+    compression = compression_for(path, compression)
+    if compression is not None and compress:
+        raise ValueError("compress=True gzips rotated segments of a plain log; "
+                         f"segments of a {compression} log are already compressed")
+    return FileEventSink(path, max_bytes, rotate_interval, compress, clock, compression,
+                         flush_bytes)
+
+
+def emit_events(sink: EventSink, events: Sequence[Mapping[str, Any]]) -> None:
+    """
+    Deliver a batch of events to a sink.
+    
+    Uses the sink's ``write_batch`` method when it has one, otherwise calls
+    the sink once per event. Errors are caught and never propagate.
+    """
+    try:
+        write_batch = getattr(sink, "write_batch", None)
+        if write_batch is not None:
+            write_batch(events)
+        else:
+            for event in events:
+                sink(event)
+    except Exception:
+        # Never propagate event emission errors
+        pass
+
+
+def _sample_point(key: str) -> float:
+    """Map a key to a stable point in [0, 1) independent of PYTHONHASHSEED."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / 2**64
+
+
+def create_sampling_sink(
+    sink: EventSink,
+    rate: float,
+    keep_failures: bool = True,
+) -> EventSink:
+    """
+    Wrap a sink so only a deterministic sample of events is forwarded.
+    
+    Sampling is keyed on a hash of ``artifact_id``: the same artifact is
+    either always or never sampled, in every process and run. Failure
+    events are always forwarded when `keep_failures` is set.
+    
+    Args:
+        sink: Downstream sink
+        rate: Fraction of success events to keep (0.0-1.0)
+        keep_failures: Forward every ``result == "failure"`` event
+        
+    Returns:
+        Callable that accepts event dict and forwards sampled events
+        
+    Example:
+        >>> sink = create_sampling_sink(create_event_sink(), rate=0.01)
+    """
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"Sampling rate must be between 0.0 and 1.0, got {rate}")
+    
+    def sampling_sink(event: Mapping[str, Any]) -> None:
+        try:
+            if keep_failures and event.get("result") == "failure":
+                sink(event)
+            elif _sample_point(str(event.get("artifact_id", "unknown"))) < rate:
+                sink(event)
+        except Exception:
+            # Never propagate event emission errors
+            pass
+    
+    return sampling_sink
+
+
+class AggregatingSink:
+    """
+    Sink that rolls events up into per-interval counts.
+    
+    Events are grouped by (schema_version, result, error_codes,
+    failure_mode_ids). When an event arrives after the current window has
+    lasted `interval` seconds, one ``validator_rollup`` event per group is
+    forwarded to the downstream sink and a new window starts. Call flush()
+    (or close()) at shutdown to emit the final partial window.
+    
+    Created via create_aggregating_sink().
+    """
+    
+    def __init__(
+        self,
+        sink: EventSink,
+        interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._sink = sink
+        self._interval = interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._counts: dict[tuple[Any, ...], int] = {}
+        self._window_opened: Optional[float] = None
+        self._window_start = ""
+    
+    def __call__(self, event: Mapping[str, Any]) -> None:
+        try:
+            key = (
+                event.get("schema_version"),
+                event.get("result"),
+                tuple(event.get("error_codes", ())),
+                tuple(event.get("failure_mode_ids", ())),
+            )
+            now = self._clock()
+            with self._lock:
+                if self._window_opened is not None and now - self._window_opened >= self._interval:
+                    rollups = self._drain()
+                else:
+                    rollups = []
+                if self._window_opened is None:
+                    self._window_opened = now
+                    self._window_start = _event_timestamp()
+                self._counts[key] = self._counts.get(key, 0) + 1
+            self._emit(rollups)
+        except Exception:
+            # Never propagate event emission errors
+            pass
+    
+    def _drain(self) -> list[dict[str, Any]]:
+        """Build rollup events for the current window and reset it (lock held)."""
+        window_end = _event_timestamp()
+        rollups = [
+            {
+                "event_type": "validator_rollup",
+                "schema_version": schema_version,
+                "result": result,
+                "error_codes": list(error_codes),
+                "failure_mode_ids": list(failure_mode_ids),
+                "count": count,
+                "window_start": self._window_start,
+                "window_end": window_end,
+            }
+            for (schema_version, result, error_codes, failure_mode_ids), count
+            in sorted(self._counts.items(), key=lambda kv: repr(kv[0]))
+        ]
+        self._counts = {}
+        self._window_opened = None
+        return rollups
+    
+    def _emit(self, rollups: Iterable[Mapping[str, Any]]) -> None:
+        for rollup in rollups:
+            try:
+                self._sink(rollup)
+            except Exception:
+                pass
+    
+    def flush(self) -> None:
+        """Emit rollups for the current window immediately."""
+        with self._lock:
+            rollups = self._drain() if self._counts else []
+        self._emit(rollups)
+    
+    close = flush
+
+
+def create_aggregating_sink(
+    sink: EventSink,
+    interval: float = 60.0,
+    clock: Callable[[], float] = time.monotonic,
+) -> AggregatingSink:
+    """
+    Wrap a sink so events are forwarded as per-interval rollups.
+    
+    Instead of one event per validation, the downstream sink receives one
+    ``validator_rollup`` event per distinct (schema_version, result,
+    error_codes, failure_mode_ids) combination per window, carrying a
+    ``count`` and the window's ``window_start`` / ``window_end`` timestamps.
+    
+    Args:
+        sink: Downstream sink
+        interval: Window length in seconds
+        clock: Monotonic clock used to close windows
+        
+    Returns:
+        Callable sink with flush()/close() to emit the final window
+        
+    Example:
+        >>> sink = create_aggregating_sink(create_event_sink(), interval=10.0)
+        >>> validate_artifact(artifact, schema, mappings, err_registry, event_sink=sink)
+        >>> sink.flush()
+    """
+    if interval <= 0:
+        raise ValueError(f"Aggregation interval must be positive, got {interval}")
+    return AggregatingSink(sink, interval, clock)
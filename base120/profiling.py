@@ -0,0 +1,135 @@
+"""
+Base120 Profiling Hooks
+
+Wraps a CLI command in cProfile and/or tracemalloc and writes a raw stats
+file plus a sorted hotspot summary. Stage timings are totalled with
+base120.tracing.collect_stages(), so summaries attribute time to the
+validator stages (schema, fm_mapping, err_resolution, failure_graph, ...)
+while emitted events stay exactly as in an unprofiled run.
+"""
+
+from contextlib import ExitStack, contextmanager
+from typing import Iterator, Optional, TextIO
+
+import cProfile
+import io
+import pstats
+import sys
+import time
+import tracemalloc
+
+from base120.tracing import TraceContext, collect_stages
+
+
+def format_stage_table(context: TraceContext) -> str:
+    """Render per-stage totals of a trace as an aligned text table."""
+    lines = [f"{'kind':<10} {'stage':<16} {'count':>10} {'total_ms':>14} {'mean_us':>12}"]
+    for kind, stages in context.stages().items():
+        for stage, totals in stages.items():
+            count = totals["count"]
+            mean_us = totals["total_ms"] * 1000 / count if count else 0.0
+            lines.append(
+                f"{kind:<10} {stage:<16} {count:>10} {totals['total_ms']:>14.3f} {mean_us:>12.2f}"
+            )
+    if len(lines) == 1:
+        lines.append("(no validations recorded)")
+    return "\n".join(lines)
+
+
+def _write_profile_summary(
+    profiler: cProfile.Profile,
+    context: TraceContext,
+    path: str,
+    top: int,
+    wall_seconds: float,
+) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"Base120 profile ({wall_seconds:.3f}s wall)\n\n")
+        f.write("== Validator stages ==\n")
+        f.write(format_stage_table(context) + "\n\n")
+        for sort_key, title in (("cumulative", "cumulative time"), ("tottime", "own time")):
+            buffer = io.StringIO()
+            stats = pstats.Stats(profiler, stream=buffer)
+            stats.strip_dirs().sort_stats(sort_key).print_stats(top)
+            f.write(f"== Top {top} functions by {title} ==\n")
+            f.write(buffer.getvalue().lstrip("\n"))
+            f.write("\n")
+
+
+def _write_memory_summary(
+    snapshot: tracemalloc.Snapshot,
+    peak: int,
+    current: int,
+    context: TraceContext,
+    path: str,
+    top: int,
+) -> None:
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Base120 memory trace\n\n")
+        f.write(f"peak traced:    {peak / 1024:12.1f} KiB\n")
+        f.write(f"current traced: {current / 1024:12.1f} KiB\n\n")
+        f.write("== Validator stages ==\n")
+        f.write(format_stage_table(context) + "\n\n")
+        for group, title in (("lineno", "allocation sites"), ("filename", "files")):
+            f.write(f"== Top {top} {title} (live at exit) ==\n")
+            for stat in snapshot.statistics(group)[:top]:
+                f.write(f"{stat.size / 1024:12.1f} KiB {stat.count:>9} blocks  {stat.traceback}\n")
+            f.write("\n")
+
+
+@contextmanager
+def profile_run(
+    profile_path: Optional[str] = None,
+    memory_path: Optional[str] = None,
+    top: int = 30,
+    log: TextIO = sys.stderr,
+) -> Iterator[TraceContext]:
+    """
+    Profile the enclosed block.
+
+    With `profile_path`, cProfile stats are dumped there (loadable with
+    ``pstats`` or snakeviz) and a hotspot summary is written to
+    ``<profile_path>.txt``. With `memory_path`, a tracemalloc snapshot is
+    dumped there (``tracemalloc.Snapshot.load``) and a summary of peak
+    usage and top allocation sites is written to ``<memory_path>.txt``.
+    Both summaries include per-stage validator timings; events emitted
+    in the block are unchanged (no correlation ID or spans are added, and
+    an enclosing trace stays active).
+
+    Outputs are written even if the block exits with an exception or
+    SystemExit. Only the calling thread is profiled.
+    """
+    with ExitStack() as stack:
+        context = stack.enter_context(collect_stages())
+        if memory_path is not None:
+            tracemalloc.start(25)
+        profiler = cProfile.Profile() if profile_path is not None else None
+        started = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield context
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            wall_seconds = time.perf_counter() - started
+            if memory_path is not None:
+                current, peak = tracemalloc.get_traced_memory()
+                snapshot = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+                snapshot.dump(memory_path)
+                _write_memory_summary(snapshot, peak, current, context,
+                                      memory_path + ".txt", top)
+                print(f"Memory trace written to {memory_path} (summary: {memory_path}.txt)",
+                      file=log)
+            if profiler is not None and profile_path is not None:
+                profiler.dump_stats(profile_path)
+                _write_profile_summary(profiler, context, profile_path + ".txt", top,
+                                       wall_seconds)
+                print(f"Profile written to {profile_path} (summary: {profile_path}.txt)",
+                      file=log)
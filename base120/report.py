@@ -0,0 +1,225 @@
+"""
+Base120 Streaming Reports
+
+Writes bulk validation results incrementally so memory use stays constant
+regardless of how many items are validated.
+"""
+
+from collections import Counter
+from types import TracebackType
+from typing import Any, Iterable, Mapping, Optional, Sequence, TextIO, Type
+
+import json
+import os
+from datetime import datetime, timezone
+
+from base120.codec import canonical_dumps, dumps
+
+
+REPORT_FORMATS = ("ndjson", "json")
+
+
+def artifact_record(location: str, artifact: Any, errors: Sequence[str]) -> dict[str, Any]:
+    """Result record for one validated artifact."""
+    artifact_id = artifact.get("id", "unknown") if isinstance(artifact, Mapping) else "unknown"
+    return {
+        "record_type": "result",
+        "kind": "artifact",
+        "path": location,
+        "artifact_id": artifact_id,
+        "status": "fail" if errors else "pass",
+        "errors": list(errors),
+    }
+
+
+def contract_record(
+    location: str,
+    contract: Mapping[str, Any],
+    errors: Sequence[Any],
+    warnings: Sequence[str],
+) -> dict[str, Any]:
+    """Result record for one checked contract unit (errors are ContractErrors)."""
+    return {
+        "record_type": "result",
+        "kind": "contract",
+        "path": location,
+        "service_name": contract.get("service_name", "unknown"),
+        "status": "fail" if errors else "pass",
+        "errors": [e.code for e in errors],
+        "messages": [str(e) for e in errors],
+        "warnings": list(warnings),
+    }
+
+
+def error_record(location: str, message: str, kind: str = "artifact") -> dict[str, Any]:
+    """Result record for an input that could not be validated."""
+    return {
+        "record_type": "result",
+        "kind": kind,
+        "path": location,
+        "status": "error",
+        "errors": [],
+        "message": message,
+    }
+
+
+def read_error_record(path: str, error: Exception) -> dict[str, Any]:
+    """error_record() for an input file that could not be read or parsed."""
+    if isinstance(error, FileNotFoundError):
+        return error_record(path, "File not found")
+    if isinstance(error, json.JSONDecodeError):
+        return error_record(path, f"Invalid JSON: {error}")
+    return error_record(path, f"Failed to read: {error}")
+
+
+def report_timestamp() -> str:
+    """
+    Return the report timestamp.
+    
+    Uses BASE120_FIXED_TIMESTAMP when set so reports are reproducible,
+    otherwise the current UTC time in ISO 8601 format.
+    """
+    fixed = os.environ.get("BASE120_FIXED_TIMESTAMP")
+    if fixed is not None:
+        return fixed
+    return datetime.now(timezone.utc).isoformat()
+
+
+class StreamingReportWriter:
+    """
+    Incremental writer for bulk validation reports.
+
+    Each result record is serialized and written as soon as it is received;
+    only rollup counters are retained. Two layouts are supported:
+
+    - ``ndjson``: one JSON object per line, followed by a final line with
+      ``"record_type": "summary"``
+    - ``json``: a single JSON object ``{"results": [...], "summary": {...}}``
+      emitted piece by piece
+
+    Result records are expected to carry a ``status`` of ``"pass"``,
+    ``"fail"`` or ``"error"`` and an ``errors`` list of error codes.
+
+    With ``canonical=True`` every record is serialized with canonical_dumps()
+    and the ``json`` layout carries no whitespace between elements, so
+    identical runs produce byte-identical reports.
+
+    Example:
+        >>> with StreamingReportWriter(sys.stdout) as writer:
+        ...     writer.write({"status": "pass", "errors": []})
+    """
+
+    def __init__(
+        self,
+        output: TextIO,
+        format: str = "ndjson",
+        top_errors: int = 10,
+        canonical: bool = False,
+    ) -> None:
+        if format not in REPORT_FORMATS:
+            raise ValueError(
+                f"Unknown report format '{format}' (expected one of {REPORT_FORMATS})"
+            )
+        self._output = output
+        self._format = format
+        self._top_errors = top_errors
+        self._canonical = canonical
+        self._sep = "" if canonical else "\n"
+        self._counts: Counter[str] = Counter()
+        self._error_counts: Counter[str] = Counter()
+        self._opened = False
+        self._started = False
+        self._closed = False
+        self._summary: Optional[dict[str, Any]] = None
+
+    def _dumps(self, obj: Mapping[str, Any]) -> str:
+        if self._canonical:
+            return canonical_dumps(obj)
+        return dumps(obj, ensure_ascii=False)
+
+    def write(
+        self,
+        record: Mapping[str, Any],
+        error_codes: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Write one result record and update the rollup counters.
+
+        Args:
+            record: Result record (must include ``status``)
+            error_codes: Codes to tally for ``top_errors``
+                (default: the record's ``errors`` list)
+        """
+        if self._closed:
+            raise ValueError("Report writer is closed")
+
+        self._counts[str(record.get("status", "error"))] += 1
+        if error_codes is None:
+            error_codes = record.get("errors", ())
+        self._error_counts.update(error_codes)
+
+        self._open()
+        line = self._dumps(record)
+        if self._format == "ndjson":
+            self._output.write(line + "\n")
+        else:
+            self._output.write(("," if self._started else "") + self._sep + line)
+        self._started = True
+
+    def _open(self) -> None:
+        if self._opened:
+            return
+        self._opened = True
+        if self._format == "json":
+            self._output.write('{"results":[' if self._canonical else '{"results": [')
+
+    def summary(self) -> dict[str, Any]:
+        """Return the rollup summary for the records written so far."""
+        ranked = sorted(self._error_counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        return {
+            "record_type": "summary",
+            "total": sum(self._counts.values()),
+            "passed": self._counts["pass"],
+            "failed": self._counts["fail"],
+            "errored": self._counts["error"],
+            "top_errors": [
+                {"code": code, "count": count}
+                for code, count in ranked[:self._top_errors]
+            ],
+        }
+
+    def close(self) -> dict[str, Any]:
+        """
+        Write the rollup summary and finish the report.
+
+        Returns:
+            The summary dict written as the final report entry
+        """
+        if self._summary is not None:
+            return self._summary
+        self._open()
+        summary = self.summary()
+        if self._format == "ndjson":
+            self._output.write(self._dumps(summary) + "\n")
+        else:
+            closing = self._sep + "]" if self._started else "]"
+            if self._canonical:
+                self._output.write(f'{closing},"summary":{self._dumps(summary)}}}')
+            else:
+                self._output.write(f'{closing}, "summary": {self._dumps(summary)}}}\n')
+        self._output.flush()
+        self._closed = True
+        self._summary = summary
+        return summary
+
+    def __enter__(self) -> "StreamingReportWriter":
+        self._open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
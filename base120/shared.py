@@ -0,0 +1,438 @@
+"""
+Base120 Shared Registries
+
+Publishes the schema, mappings, ERR registry and their compiled FM bitset
+tables once in a ``multiprocessing.shared_memory`` segment so pool
+workers attach by name instead of re-reading and re-compiling
+``registries/*.json``.
+
+Segment layout (little-endian, read-only after publication):
+
+    header   magic "B120SHM2", subclass and FM counts, mask width and the
+             byte lengths of the sections below
+    meta     UTF-8 JSON: version, FM IDs (bit order), dominant FM bit
+    classes  offsets (2 per subclass + 1, uint64) into a blob holding,
+             per subclass sorted by UTF-8 name, the name and the JSON
+             list of its sorted FM IDs
+    masks    one fixed-width FM mask per subclass, in the same order
+    postings offsets (1 per FM + 1, uint64) into a blob holding, per FM
+             bit, the JSON list of the ERR IDs tagged with it
+    documents
+             canonical JSON of the schema, contract schema, mappings and
+             ERR registry
+
+Attaching decodes only the header and the small meta section. Subclass
+lookups binary-search the shared names, ERR resolution reads the postings
+of the FM bits it needs, and the documents are decoded on first access,
+so a worker that validates through the shared tables never holds its own
+copy of the registries.
+"""
+
+from multiprocessing import shared_memory
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+import hashlib
+import struct
+import sys
+
+from base120.codec import canonical_dumps, dumps, loads
+from base120.validators.bitset import FMTables
+from base120.validators.compiler import Predicate, compile_schema
+
+
+_MAGIC = b"B120SHM2"
+# magic, subclasses, FMs, mask width, meta/classes/postings lengths,
+# schema/contract schema/mappings/registry lengths
+_HEADER = struct.Struct("<8sIII7Q")
+_OFFSET = struct.Struct("<Q")
+
+_UNSET: Any = object()
+
+
+def _offsets(blobs: Sequence[bytes]) -> tuple[bytes, bytes]:
+    """Pack blobs as (uint64 start offsets + end, concatenated bytes)."""
+    starts = [0]
+    for blob in blobs:
+        starts.append(starts[-1] + len(blob))
+    return struct.pack(f"<{len(starts)}Q", *starts), b"".join(blobs)
+
+
+def _encode(
+    schema: Mapping[str, Any],
+    mappings: Mapping[str, Any],
+    err_registry: Sequence[Mapping[str, Any]],
+    contract_schema: Optional[Mapping[str, Any]],
+    version: str,
+) -> bytes:
+    tables = FMTables.compile(mappings, err_registry)
+    width = max(1, (len(tables.fm_ids) + 7) // 8)
+    classes = sorted(tables.class_masks, key=lambda subclass: subclass.encode("utf-8"))
+    meta = dumps({
+        "version": version,
+        "fm_ids": list(tables.fm_ids),
+        "dominant": tables.dominant_bit.bit_length() - 1,
+    }).encode("utf-8")
+    class_offsets, class_blob = _offsets([
+        blob for subclass in classes
+        for blob in (subclass.encode("utf-8"),
+                     dumps(list(tables.class_fms[subclass])).encode("utf-8"))
+    ])
+    masks = b"".join(tables.class_masks[subclass].to_bytes(width, "little") for subclass in classes)
+    postings: list[list[str]] = [[] for _ in tables.fm_ids]
+    for err_id, bits in zip(tables.err_ids, tables.err_masks):
+        for bit, posting in enumerate(postings):
+            if bits >> bit & 1:
+                posting.append(err_id)
+    posting_offsets, posting_blob = _offsets(
+        [dumps(sorted(set(posting))).encode("utf-8") for posting in postings]
+    )
+    documents = [
+        canonical_dumps(doc).encode("utf-8")
+        for doc in (schema, contract_schema, mappings, err_registry)
+    ]
+    header = _HEADER.pack(
+        _MAGIC, len(classes), len(tables.fm_ids), width,
+        len(meta), len(class_offsets) + len(class_blob), len(posting_offsets) + len(posting_blob),
+        *(len(doc) for doc in documents),
+    )
+    return b"".join([header, meta, class_offsets, class_blob, masks,
+                     posting_offsets, posting_blob] + documents)
+
+
+class SharedFMTables:
+    """
+    FM bitset tables backed by a shared-memory buffer.
+
+    Drop-in for FMTables in validation: failure_modes() and errors()
+    resolve identically. Subclasses are found by binary search over the
+    shared names and ERR IDs are read from per-FM postings, so only the
+    subclasses and masks a worker actually meets are decoded (and
+    memoized) in that worker.
+    """
+
+    def __init__(self, buffer: memoryview, offset: int, n_classes: int, width: int,
+                 meta: Mapping[str, Any], postings_offset: int) -> None:
+        self._buffer = buffer
+        self._n_classes = n_classes
+        self._class_offsets = offset
+        self._class_blob = offset + (2 * n_classes + 1) * _OFFSET.size
+        class_blob_len = self._offset(self._class_offsets, 2 * n_classes)
+        self._masks = self._class_blob + class_blob_len
+        self._width = width
+        self.fm_ids = tuple(meta["fm_ids"])
+        self._postings_offsets = postings_offset
+        self._postings_blob = postings_offset + (len(self.fm_ids) + 1) * _OFFSET.size
+        dominant = meta["dominant"]
+        self.dominant_bit = 1 << dominant if dominant >= 0 else 0
+        self._classes: dict[str, tuple[int, tuple[str, ...]]] = {}
+        self._postings: dict[int, tuple[str, ...]] = {}
+        self._errors: dict[int, tuple[str, ...]] = {}
+
+    def _offset(self, table: int, i: int) -> int:
+        return _OFFSET.unpack_from(self._buffer, table + i * _OFFSET.size)[0]
+
+    def _blob(self, table: int, blob: int, i: int) -> bytes:
+        start, end = self._offset(table, i), self._offset(table, i + 1)
+        return bytes(self._buffer[blob + start:blob + end])
+
+    def _find(self, name: bytes) -> int:
+        lo, hi = 0, self._n_classes
+        while lo < hi:
+            mid = (lo + hi) // 2
+            probe = self._blob(self._class_offsets, self._class_blob, 2 * mid)
+            if probe < name:
+                lo = mid + 1
+            elif probe > name:
+                hi = mid
+            else:
+                return mid
+        return -1
+
+    def failure_modes(self, subclass: str) -> tuple[int, tuple[str, ...]]:
+        """Return (FM mask, sorted FM IDs) for a subclass."""
+        found = self._classes.get(subclass)
+        if found is not None:
+            return found
+        try:
+            i = self._find(subclass.encode("utf-8"))
+        except UnicodeEncodeError:
+            i = -1
+        if i < 0:
+            # Misses are not memoized: they are bounded only by the input
+            return 0, ()
+        at = self._masks + i * self._width
+        mask = int.from_bytes(self._buffer[at:at + self._width], "little")
+        fms = tuple(loads(self._blob(self._class_offsets, self._class_blob, 2 * i + 1)))
+        found = self._classes[subclass] = (mask, fms)
+        return found
+
+    def _posting(self, bit: int) -> tuple[str, ...]:
+        posting = self._postings.get(bit)
+        if posting is None:
+            posting = self._postings[bit] = tuple(
+                loads(self._blob(self._postings_offsets, self._postings_blob, bit))
+            )
+        return posting
+
+    def errors(self, fm_mask: int) -> tuple[str, ...]:
+        """Return the sorted, deduplicated ERR IDs for an FM mask (FM30 dominant)."""
+        cached = self._errors.get(fm_mask)
+        if cached is not None:
+            return cached
+        select = self.dominant_bit if fm_mask & self.dominant_bit else fm_mask
+        matched: set[str] = set()
+        bit = 0
+        while select:
+            if select & 1:
+                matched.update(self._posting(bit))
+            select >>= 1
+            bit += 1
+        result = self._errors[fm_mask] = tuple(sorted(matched))
+        return result
+
+    def release(self) -> None:
+        """Release the view of the shared buffer."""
+        self._buffer.release()
+
+
+class _SharedDocument:
+    """Canonical JSON held in a segment, decoded on first access."""
+
+    def __init__(self, canonical_json: bytes) -> None:
+        self.canonical_json = canonical_json
+        self._value: Any = _UNSET
+
+    @property
+    def loaded(self) -> bool:
+        """True once the document has been decoded in this process."""
+        return self._value is not _UNSET
+
+    def _load(self) -> Any:
+        if self._value is _UNSET:
+            self._value = loads(self.canonical_json)
+        return self._value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _SharedDocument):
+            other = other._load()
+        return self._load() == other
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._load()!r})"
+
+
+class SharedMapping(_SharedDocument, Mapping[str, Any]):
+    """Read-only mapping view of a shared document (e.g. mappings.json)."""
+
+    def __getitem__(self, key: str) -> Any:
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+class SharedSequence(_SharedDocument, Sequence[Mapping[str, Any]]):
+    """Read-only sequence view of a shared document (e.g. ERR registry entries)."""
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._load()[index]
+
+    def __iter__(self) -> Iterator[Mapping[str, Any]]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+
+class SharedRegistry:
+    """
+    Registries and compiled tables published in shared memory.
+
+    The parent creates the segment with publish() and passes ``name`` to
+    workers, which call attach(). Attaching copies nothing out of the
+    segment: ``tables`` resolve from the shared buffer, ``mappings`` and
+    ``err_registry`` are read-only views decoded only if something reads
+    their contents (the list resolvers or a ValidationCache), and the
+    schemas are decoded on first access. ``is_valid`` (Python code, so
+    one per process) is compiled on first use.
+
+    validate_shared() passes ``tables`` and ``is_valid`` to
+    validate_artifact(); registry_version() wraps the registry for a
+    RegistryEngine.
+
+    The publishing process owns the segment: close() in the parent also
+    unlinks it. Workers only close() their mapping.
+
+    Example:
+        >>> with SharedRegistry.publish(schema, mappings, err_registry) as shared:
+        ...     with multiprocessing.Pool(initializer=attach_worker,
+        ...                               initargs=(shared.name,)) as pool:
+        ...         results = pool.map(validate_shared, artifacts)
+    """
+
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool) -> None:
+        self._segment = segment
+        self._owner = owner
+        buffer = segment.buf
+        fields = _HEADER.unpack_from(buffer, 0)
+        if fields[0] != _MAGIC:
+            raise ValueError(f"Shared memory segment {segment.name!r} is not a base120 registry")
+        _, n_classes, _, width, meta_len, classes_len, postings_len, *doc_lens = fields
+
+        offset = _HEADER.size
+        meta = loads(bytes(buffer[offset:offset + meta_len]))
+        self.version: str = meta["version"]
+        offset += meta_len
+        postings_offset = offset + classes_len + n_classes * width
+        self.tables = SharedFMTables(buffer, offset, n_classes, width, meta, postings_offset)
+        offset = postings_offset + postings_len
+
+        documents = []
+        for length in doc_lens:
+            documents.append(bytes(buffer[offset:offset + length]))
+            offset += length
+        self._schema, self._contract_schema = (_SharedDocument(doc) for doc in documents[:2])
+        self.mappings = SharedMapping(documents[2])
+        self.err_registry = SharedSequence(documents[3])
+        self._is_valid: Any = _UNSET
+
+    @property
+    def schema(self) -> Mapping[str, Any]:
+        """Artifact JSON schema (decoded on first access)."""
+        return self._schema._load()
+
+    @property
+    def contract_schema(self) -> Optional[Mapping[str, Any]]:
+        """Contract JSON schema, or None if none was published."""
+        return self._contract_schema._load()
+
+    @property
+    def is_valid(self) -> Optional[Predicate]:
+        """compile_schema(schema), compiled on first use in this process."""
+        if self._is_valid is _UNSET:
+            self._is_valid = compile_schema(self.schema)
+        return self._is_valid
+
+    @property
+    def name(self) -> str:
+        """Segment name to pass to attach()."""
+        return self._segment.name
+
+    @property
+    def size(self) -> int:
+        """Segment size in bytes."""
+        return self._segment.size
+
+    @classmethod
+    def publish(
+        cls,
+        schema: Mapping[str, Any],
+        mappings: Mapping[str, Any],
+        err_registry: Sequence[Mapping[str, Any]],
+        name: Optional[str] = None,
+        contract_schema: Optional[Mapping[str, Any]] = None,
+        version: str = "v1.0.0",
+    ) -> "SharedRegistry":
+        """Compile the registries and publish them in a new segment."""
+        payload = _encode(schema, mappings, err_registry, contract_schema, version)
+        segment = shared_memory.SharedMemory(name=name, create=True, size=len(payload))
+        try:
+            segment.buf[:len(payload)] = payload
+            return cls(segment, owner=True)
+        except BaseException:
+            segment.close()
+            segment.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRegistry":
+        """Attach to a segment published by another process."""
+        segment = _open_segment(name)
+        try:
+            return cls(segment, owner=False)
+        except BaseException:
+            segment.close()
+            raise
+
+    def registry_version(self) -> Any:
+        """
+        Return a RegistryVersion over this registry for a RegistryEngine.
+
+        The version resolves through ``tables`` and keeps the shared
+        mapping and ERR registry views, so it does not decode them.
+        """
+        from base120.engine import RegistryVersion
+
+        return RegistryVersion(self.version, self.schema, self.contract_schema,
+                               self.mappings, self.err_registry, self.tables)
+
+    def close(self) -> None:
+        """Release this mapping; the owner also unlinks the segment."""
+        # Documents stay usable with validate_artifact(), which resolves
+        # through the list path without the shared tables
+        self.tables.release()
+        self._segment.close()
+        if self._owner:
+            self._owner = False
+            self._segment.unlink()
+
+    def __enter__(self) -> "SharedRegistry":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def registry_digest(document: Any) -> Optional[bytes]:
+    """
+    BLAKE2b-128 of a shared document's canonical JSON, or None if
+    `document` is not a shared view (ValidationCache fingerprints shared
+    registries with this instead of decoding them).
+    """
+    if not isinstance(document, _SharedDocument):
+        return None
+    return hashlib.blake2b(document.canonical_json, digest_size=16).digest()
+
+
+def _open_segment(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    segment = shared_memory.SharedMemory(name=name)
+    # Before 3.13 attaching registers the segment with this process's
+    # resource tracker, which would unlink it when the worker exits
+    try:
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(segment._name, "shared_memory")  # type: ignore[attr-defined]
+    except Exception:
+        pass
+    return segment
+
+
+_worker_registry: Optional[SharedRegistry] = None
+
+
+def attach_worker(name: str) -> None:
+    """Pool initializer: attach this worker to a published registry."""
+    global _worker_registry
+    _worker_registry = SharedRegistry.attach(name)
+
+
+def worker_registry() -> SharedRegistry:
+    """Return the registry attached by attach_worker() in this process."""
+    if _worker_registry is None:
+        raise RuntimeError("No shared registry attached; use attach_worker as pool initializer")
+    return _worker_registry
+
+
+def validate_shared(artifact: Mapping[str, Any]) -> list[str]:
+    """validate_artifact() against this worker's shared registry."""
+    from base120.validators.validate import validate_artifact
+
+    shared = worker_registry()
+    return validate_artifact(artifact, shared.schema, shared.mappings, shared.err_registry,
+                             schema_version=shared.version, is_valid=shared.is_valid,
+                             tables=shared.tables)
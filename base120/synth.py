@@ -0,0 +1,284 @@
+"""
+Base120 Synthetic Corpus Generator
+
+Deterministic, seeded generation of artifact corpora and contract units for
+load and scaling tests. Expected outputs are computed by the canonical
+validator, so generated corpora can certify mirrors the same way the golden
+corpus does.
+"""
+
+from pathlib import Path
+from typing import Any, Iterator, Mapping, Optional, Sequence
+
+import random
+
+from base120.codec import pretty_dumps
+from base120.contract.validate import check_contract
+from base120.report import canonical_dumps
+from base120.validators.validate import validate_artifact
+
+
+CORPUS_FORMATS = ("files", "ndjson")
+
+# Contract defects that can be injected into generated failure graphs
+CONTRACT_DEFECTS = (
+    "cycle",
+    "termination_edge",
+    "dangling_edge",
+    "duplicate_node",
+    "no_termination",
+)
+
+_REQUIRED_FIELDS = ("id", "domain", "class", "instance", "models")
+_DOMAINS = ("core", "governance", "runtime", "data", "security", "ops")
+
+
+def _schema_variant(artifact: dict[str, Any], rng: random.Random) -> dict[str, Any]:
+    """Break one schema rule of an otherwise valid artifact."""
+    variant = dict(artifact)
+    kind = rng.randrange(3)
+    if kind == 0:
+        # Missing required field
+        del variant[rng.choice(_REQUIRED_FIELDS)]
+    elif kind == 1:
+        # Wrong scalar type
+        variant[rng.choice(_REQUIRED_FIELDS[:4])] = rng.randint(0, 1000)
+    else:
+        # Wrong array shape
+        variant["models"] = rng.choice(["FM1", [1, 2], [None]])
+    return variant
+
+
+def iter_artifacts(
+    count: int,
+    mappings: Mapping[str, Any],
+    seed: int = 0,
+    schema_failure_ratio: float = 0.1,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield `count` synthetic artifacts.
+
+    Subclasses cycle through every key of ``mappings["mappings"]`` plus an
+    unmapped subclass, so every registry entry is exercised in any corpus at
+    least that large. A `schema_failure_ratio` fraction of artifacts break
+    one schema rule. Output depends only on the arguments.
+
+    Args:
+        count: Number of artifacts to generate
+        mappings: Parsed mappings.json
+        seed: Random seed
+        schema_failure_ratio: Fraction of schema-failing variants (0.0-1.0)
+    """
+    rng = random.Random(seed)
+    subclasses = sorted(mappings.get("mappings", {})) + ["example"]
+    fm_ids = [f"FM{i}" for i in range(1, 31)]
+
+    for i in range(count):
+        artifact: dict[str, Any] = {
+            "id": f"synthetic-{seed}-{i:08d}",
+            "domain": rng.choice(_DOMAINS),
+            "class": subclasses[i % len(subclasses)],
+            "instance": f"instance-{rng.getrandbits(32):08x}",
+            "models": sorted(rng.sample(fm_ids, rng.randint(0, 4))),
+        }
+        if rng.random() < 0.25:
+            # Unconstrained extra fields are allowed by the schema
+            artifact["labels"] = {"batch": i // 1000, "source": "synthetic"}
+        if rng.random() < schema_failure_ratio:
+            artifact = _schema_variant(artifact, rng)
+        yield artifact
+
+
+def synthetic_failure_graph(
+    size: int,
+    rng: random.Random,
+    defect: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Build a failure graph with `size` nodes.
+
+    The graph is a random DAG whose edges only point to later nodes and whose
+    final node terminates, so it is valid unless a `defect` from
+    CONTRACT_DEFECTS is injected.
+    """
+    if defect is not None and defect not in CONTRACT_DEFECTS:
+        raise ValueError(f"Unknown contract defect '{defect}'")
+    size = max(size, 3)
+
+    nodes = [
+        {
+            "id": f"FM{i + 1}",
+            "name": f"Failure mode {i + 1}",
+            "max_retries": rng.randint(0, 10),
+            "action": rng.choice(("retry", "escalate")),
+        }
+        for i in range(size)
+    ]
+    nodes[-1]["action"] = "terminate"
+    nodes[-1]["max_retries"] = 0
+
+    edges = []
+    for i in range(size - 1):
+        # Escalate to a later node, sometimes with a second path
+        for _ in range(1 if rng.random() < 0.8 else 2):
+            target = rng.randint(i + 1, min(size - 1, i + 8))
+            edges.append({
+                "from": nodes[i]["id"],
+                "to": nodes[target]["id"],
+                "condition": "max_retries_exceeded",
+            })
+
+    if defect == "cycle":
+        edges.append({"from": nodes[0]["id"], "to": nodes[1]["id"], "condition": "retry"})
+        edges.append({"from": nodes[1]["id"], "to": nodes[0]["id"], "condition": "loop"})
+    elif defect == "termination_edge":
+        edges.append({"from": nodes[-1]["id"], "to": nodes[0]["id"], "condition": "restart"})
+    elif defect == "dangling_edge":
+        edges.append({"from": nodes[0]["id"], "to": f"FM{size + 1}", "condition": "missing"})
+    elif defect == "duplicate_node":
+        nodes.append(dict(nodes[0]))
+    elif defect == "no_termination":
+        nodes[-1]["action"] = "escalate"
+
+    return {"nodes": nodes, "edges": edges}
+
+
+def synthetic_contract(
+    index: int,
+    graph_size: int,
+    rng: random.Random,
+    defect: Optional[str] = None,
+) -> dict[str, Any]:
+    """Build a contract unit around a synthetic failure graph."""
+    return {
+        "contract_version": "v1.0.0",
+        "service_name": f"synthetic-service-{index:06d}",
+        "artifact_schema": {
+            "$schema": "https://json-schema.org/draft/2020-12/schema",
+            "type": "object",
+            "properties": {"models": {"type": "array", "items": {"type": "string"}}},
+        },
+        "failure_graph": synthetic_failure_graph(graph_size, rng, defect),
+        "metadata": {
+            "created": "2026-01-01T00:00:00Z",
+            "updated": "2026-01-02T00:00:00Z",
+            "description": "Synthetic contract for load testing",
+            "tags": ["synthetic"],
+            "compatibility": {"environments": ["production", "staging"]},
+        },
+    }
+
+
+def iter_contracts(
+    count: int,
+    graph_size: int,
+    seed: int = 0,
+    defect_ratio: float = 0.3,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield `count` synthetic contract units with `graph_size`-node graphs.
+
+    A `defect_ratio` fraction carry one defect, cycling through
+    CONTRACT_DEFECTS.
+    """
+    rng = random.Random(seed)
+    defects = 0
+    for i in range(count):
+        defect = None
+        if rng.random() < defect_ratio:
+            defect = CONTRACT_DEFECTS[defects % len(CONTRACT_DEFECTS)]
+            defects += 1
+        yield synthetic_contract(i, graph_size, rng, defect)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(pretty_dumps(data) + "\n")
+
+
+def generate_corpus(
+    out_dir: Path,
+    count: int,
+    schema: Mapping[str, Any],
+    mappings: Mapping[str, Any],
+    err_registry: Sequence[Mapping[str, Any]],
+    contract_schema: Optional[Mapping[str, Any]] = None,
+    seed: int = 0,
+    schema_failure_ratio: float = 0.1,
+    contracts: int = 0,
+    graph_size: int = 16,
+    format: str = "files",
+) -> dict[str, int]:
+    """
+    Generate a corpus with expected outputs from the canonical validator.
+
+    Layouts:
+    - ``files``: the golden corpus layout (``valid/``, ``invalid/``,
+      ``expected/*.errs.json``) plus ``contracts/{valid,invalid,expected}``
+    - ``ndjson``: ``artifacts.ndjson`` with a line-aligned
+      ``artifacts.expected.ndjson`` of canonical error arrays, and likewise
+      ``contracts.ndjson`` / ``contracts.expected.ndjson``
+
+    Contract expectations are the list of ContractError codes.
+
+    Returns:
+        Counts of generated artifacts and contracts by outcome
+    """
+    if format not in CORPUS_FORMATS:
+        raise ValueError(f"Unknown corpus format '{format}' (expected one of {CORPUS_FORMATS})")
+    if contracts and contract_schema is None:
+        raise ValueError("contract_schema is required to generate contracts")
+
+    out_dir = Path(out_dir)
+    stats = {"artifacts_valid": 0, "artifacts_invalid": 0,
+             "contracts_valid": 0, "contracts_invalid": 0}
+
+    if format == "files":
+        for sub in ("valid", "invalid", "expected"):
+            (out_dir / sub).mkdir(parents=True, exist_ok=True)
+        for i, artifact in enumerate(iter_artifacts(count, mappings, seed, schema_failure_ratio)):
+            errs = validate_artifact(artifact, schema, mappings, err_registry)
+            name = f"synthetic-{i:08d}"
+            if errs:
+                stats["artifacts_invalid"] += 1
+                _write_json(out_dir / "invalid" / f"{name}.json", artifact)
+                _write_json(out_dir / "expected" / f"{name}.errs.json", errs)
+            else:
+                stats["artifacts_valid"] += 1
+                _write_json(out_dir / "valid" / f"{name}.json", artifact)
+
+        if contracts:
+            for sub in ("valid", "invalid", "expected"):
+                (out_dir / "contracts" / sub).mkdir(parents=True, exist_ok=True)
+            for i, contract in enumerate(iter_contracts(contracts, graph_size, seed)):
+                is_valid, errors, _ = check_contract(contract, contract_schema or {})
+                name = f"synthetic-contract-{i:06d}"
+                if is_valid:
+                    stats["contracts_valid"] += 1
+                    _write_json(out_dir / "contracts" / "valid" / f"{name}.json", contract)
+                else:
+                    stats["contracts_invalid"] += 1
+                    _write_json(out_dir / "contracts" / "invalid" / f"{name}.json", contract)
+                    _write_json(out_dir / "contracts" / "expected" / f"{name}.errs.json",
+                                [e.code for e in errors])
+        return stats
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with open(out_dir / "artifacts.ndjson", "w", encoding="utf-8") as data, \
+            open(out_dir / "artifacts.expected.ndjson", "w", encoding="utf-8") as expected:
+        for artifact in iter_artifacts(count, mappings, seed, schema_failure_ratio):
+            errs = validate_artifact(artifact, schema, mappings, err_registry)
+            stats["artifacts_invalid" if errs else "artifacts_valid"] += 1
+            data.write(canonical_dumps(artifact) + "\n")
+            expected.write(canonical_dumps(errs) + "\n")
+
+    if contracts:
+        with open(out_dir / "contracts.ndjson", "w", encoding="utf-8") as data, \
+                open(out_dir / "contracts.expected.ndjson", "w", encoding="utf-8") as expected:
+            for contract in iter_contracts(contracts, graph_size, seed):
+                is_valid, errors, _ = check_contract(contract, contract_schema or {})
+                stats["contracts_valid" if is_valid else "contracts_invalid"] += 1
+                data.write(canonical_dumps(contract) + "\n")
+                expected.write(canonical_dumps([e.code for e in errors]) + "\n")
+
+    return stats
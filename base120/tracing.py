@@ -0,0 +1,216 @@
+"""
+Base120 Trace Context
+
+Request-scoped correlation IDs and per-stage spans carried in a
+``contextvars.ContextVar``, so validators pick them up without callers
+threading arguments or wrapping event sinks in per-request closures.
+
+While a trace is active, validate_artifact(), validate_artifacts() and
+check_contract() record stage spans; validator_result events carry the
+trace's ``correlation_id`` and the artifact's ``spans``. Context variables
+follow asyncio tasks and ``contextvars.copy_context()``, so concurrent
+requests never see each other's traces.
+
+collect_stages() only totals stage timings (for profiling): events are
+left unchanged and no spans are built.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union
+
+import threading
+import time
+import uuid
+
+if TYPE_CHECKING:
+    from base120.metrics import Stopwatch, ValidationMetrics
+
+
+class TraceContext:
+    """
+    One trace: a correlation ID plus stage totals across its validations.
+
+    Attributes:
+        correlation_id: ID attached to every event emitted under the trace
+        clock: Clock used for span timings (seconds)
+    """
+
+    def __init__(self, correlation_id: str, clock: Any = time.perf_counter) -> None:
+        self.correlation_id = correlation_id
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._stages: dict[tuple[str, str], list[float]] = {}
+
+    def record(self, kind: str, stage: str, seconds: float) -> None:
+        """Add one stage duration to the trace totals."""
+        key = (kind, stage)
+        with self._lock:
+            totals = self._stages.get(key)
+            if totals is None:
+                totals = self._stages[key] = [0, 0.0]
+            totals[0] += 1
+            totals[1] += seconds
+
+    def stages(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Return stage totals for the trace.
+
+        Shape: ``{kind: {stage: {"count": n, "total_ms": ms}}}``
+        """
+        with self._lock:
+            result: dict[str, dict[str, dict[str, float]]] = {}
+            for (kind, stage), (count, seconds) in sorted(self._stages.items()):
+                result.setdefault(kind, {})[stage] = {
+                    "count": count,
+                    "total_ms": round(seconds * 1000, 6),
+                }
+            return result
+
+
+_current: ContextVar[Optional[TraceContext]] = ContextVar("base120_trace", default=None)
+_collector: ContextVar[Optional[TraceContext]] = ContextVar("base120_stages", default=None)
+
+
+def current_trace() -> Optional[TraceContext]:
+    """Return the active trace, or None outside trace()."""
+    return _current.get()
+
+
+@contextmanager
+def trace(
+    correlation_id: Optional[str] = None,
+    clock: Any = time.perf_counter,
+) -> Iterator[TraceContext]:
+    """
+    Activate a trace for the enclosed validations.
+
+    Args:
+        correlation_id: ID for the trace (default: random UUID4 hex)
+        clock: Clock used for span timings
+
+    Example:
+        >>> with trace("req-12345") as ctx:
+        ...     validate_artifact(artifact, schema, mappings, err_registry, event_sink=sink)
+        >>> ctx.stages()["artifact"]["schema"]["count"]
+        1
+    """
+    context = TraceContext(correlation_id or uuid.uuid4().hex, clock)
+    token = _current.set(context)
+    try:
+        yield context
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def collect_stages(clock: Any = time.perf_counter) -> Iterator[TraceContext]:
+    """
+    Total the stage timings of the enclosed validations.
+
+    Unlike trace(), this does not change what validators emit: events get
+    no correlation ID or spans, and an enclosing trace stays active. The
+    yielded context only serves stages().
+    """
+    context = TraceContext("", clock)
+    token = _collector.set(context)
+    try:
+        yield context
+    finally:
+        _collector.reset(token)
+
+
+class StageRecorder:
+    """
+    Records the stage totals of one validation into a TraceContext.
+
+    Has the same lap()/finish() interface as metrics.Stopwatch and forwards
+    to `watch` (a Stopwatch or another recorder) when given.
+    """
+
+    __slots__ = ("trace", "_kind", "_watch", "_started", "_last")
+
+    def __init__(
+        self,
+        trace: TraceContext,
+        kind: str,
+        watch: Optional[Union["Stopwatch", "StageRecorder"]] = None,
+    ) -> None:
+        self.trace = trace
+        self._kind = kind
+        self._watch = watch
+        self._started = self._last = trace.clock()
+
+    def lap(self, stage: str) -> None:
+        now = self.trace.clock()
+        self.trace.record(self._kind, stage, now - self._last)
+        self._last = now
+        if self._watch is not None:
+            self._watch.lap(stage)
+
+    def finish(
+        self,
+        error_codes: Iterable[str],
+        failure_mode_ids: Iterable[str] = (),
+    ) -> None:
+        self.trace.record(self._kind, "total", self.trace.clock() - self._started)
+        if self._watch is not None:
+            self._watch.finish(error_codes, failure_mode_ids)
+
+
+class SpanRecorder(StageRecorder):
+    """
+    Records the stage spans of one validation under the active trace.
+
+    Span start offsets and durations are in milliseconds relative to the
+    start of the validation.
+    """
+
+    __slots__ = ("spans",)
+
+    def __init__(
+        self,
+        trace: TraceContext,
+        kind: str,
+        watch: Optional[Union["Stopwatch", StageRecorder]] = None,
+    ) -> None:
+        super().__init__(trace, kind, watch)
+        self.spans: list[dict[str, Any]] = []
+
+    def lap(self, stage: str) -> None:
+        now = self.trace.clock()
+        seconds = now - self._last
+        self.spans.append({
+            "name": stage,
+            "start_ms": round((self._last - self._started) * 1000, 6),
+            "duration_ms": round(seconds * 1000, 6),
+        })
+        self.trace.record(self._kind, stage, seconds)
+        self._last = now
+        if self._watch is not None:
+            self._watch.lap(stage)
+
+
+def stage_timer(
+    kind: str,
+    metrics: Optional["ValidationMetrics"] = None,
+) -> Optional[Union["Stopwatch", StageRecorder]]:
+    """
+    Start stage timing for one validation.
+
+    Returns a SpanRecorder when a trace is active, a StageRecorder under
+    collect_stages(), a metrics Stopwatch when only metrics are enabled,
+    and None otherwise, so untraced and unmetered calls pay two context
+    lookups and no timing. Recorders forward to each other and to the
+    Stopwatch, so all enabled consumers see every stage.
+    """
+    watch: Optional[Union["Stopwatch", StageRecorder]] = (
+        metrics.stopwatch(kind) if metrics is not None else None
+    )
+    collector = _collector.get()
+    if collector is not None:
+        watch = StageRecorder(collector, kind, watch)
+    context = _current.get()
+    if context is None:
+        return watch
+    return SpanRecorder(context, kind, watch)
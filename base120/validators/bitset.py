@@ -0,0 +1,114 @@
+"""
+Failure-mode bitset tables.
+
+Compiles mappings.json and the ERR registry into integer bitmasks: every
+failure mode ID gets one bit, each subclass maps to the mask of its FMs and
+each ERR entry stores the mask of the FMs it is tagged with. ERR matches
+and FM30 dominance are then a handful of bitwise ANDs, and results are
+memoized per subclass and per mask so bulk runs allocate nothing new per
+artifact until the API boundary turns them into lists.
+
+Tables are built by the owner of the registries and passed explicitly
+(``validate_artifact(..., tables=...)``); without them validation
+resolves through the list code.
+
+Resolution is identical to resolve_failure_modes() + resolve_errors().
+"""
+
+from typing import Any, Mapping, Optional, Sequence
+
+
+DOMINANT_FM = "FM30"
+
+
+class FMTables:
+    """
+    Bitmask form of one (mappings, ERR registry) pair.
+
+    Attributes:
+        fm_ids: Failure mode ID for each bit (bit i == 1 << i)
+        class_masks: Subclass -> FM mask
+        class_fms: Subclass -> sorted FM IDs (as emitted in events)
+        err_ids: ERR ID per registry entry
+        err_masks: FM mask per registry entry
+    """
+
+    __slots__ = ("fm_ids", "fm_bits", "class_masks", "class_fms", "err_ids", "err_masks",
+                 "dominant_bit", "_errors")
+
+    def __init__(
+        self,
+        fm_ids: Sequence[str],
+        class_fms: Mapping[str, Sequence[str]],
+        err_ids: Sequence[str],
+        err_fms: Sequence[Sequence[str]],
+    ) -> None:
+        self.fm_ids = tuple(fm_ids)
+        self.fm_bits = {fm: 1 << i for i, fm in enumerate(self.fm_ids)}
+        self.class_masks = {subclass: self.mask(fms) for subclass, fms in class_fms.items()}
+        self.class_fms = {subclass: tuple(sorted(fms)) for subclass, fms in class_fms.items()}
+        self.err_ids = tuple(err_ids)
+        self.err_masks = tuple(self.mask(fms) for fms in err_fms)
+        self.dominant_bit = self.fm_bits.get(DOMINANT_FM, 0)
+        self._errors: dict[int, tuple[str, ...]] = {}
+
+    @classmethod
+    def compile(
+        cls,
+        mappings: Mapping[str, Any],
+        err_registry: Sequence[Mapping[str, Any]],
+    ) -> "FMTables":
+        """Build tables from parsed mappings.json and ERR registry entries."""
+        class_fms = {
+            subclass: list(fms) for subclass, fms in mappings.get("mappings", {}).items()
+        }
+        err_fms = [list(entry.get("fm", [])) for entry in err_registry]
+        fm_ids = sorted(
+            {fm for fms in class_fms.values() for fm in fms} | {fm for fms in err_fms for fm in fms},
+            key=str,
+        )
+        err_ids = [str(entry.get("id", "")) for entry in err_registry]
+        return cls(fm_ids, class_fms, err_ids, err_fms)
+
+    def mask(self, fms: Sequence[str]) -> int:
+        """Return the mask of the given FM IDs (unknown IDs are ignored)."""
+        bits = 0
+        for fm in fms:
+            bits |= self.fm_bits.get(fm, 0)
+        return bits
+
+    def failure_modes(self, subclass: str) -> tuple[int, tuple[str, ...]]:
+        """Return (FM mask, sorted FM IDs) for a subclass."""
+        return self.class_masks.get(subclass, 0), self.class_fms.get(subclass, ())
+
+    def errors(self, fm_mask: int) -> tuple[str, ...]:
+        """
+        Return the sorted, deduplicated ERR IDs for an FM mask.
+
+        When the dominant FM (FM30) is set, only entries tagged with it
+        match; otherwise every entry sharing any FM with the mask matches.
+        """
+        cached = self._errors.get(fm_mask)
+        if cached is not None:
+            return cached
+        select = self.dominant_bit if fm_mask & self.dominant_bit else fm_mask
+        matched = {err_id for err_id, bits in zip(self.err_ids, self.err_masks) if bits & select}
+        result = self._errors[fm_mask] = tuple(sorted(matched))
+        return result
+
+
+def compile_tables(
+    mappings: Mapping[str, Any],
+    err_registry: Sequence[Mapping[str, Any]],
+) -> Optional[FMTables]:
+    """
+    FMTables.compile(), or None if the registries cannot be compiled (e.g.
+    non-hashable FM IDs); callers then resolve directly.
+
+    Tables snapshot the registries: whoever keeps them (RegistryEngine,
+    SharedRegistry) must not modify the registries afterwards.
+    """
+    try:
+        return FMTables.compile(mappings, err_registry)
+    except (TypeError, AttributeError):
+        return None
@@ -0,0 +1,397 @@
+"""
+Columnar batch validation.
+
+Validates a table of artifacts given as columns (``{"id": [...],
+"class": [...], ...}``, a pyarrow Table, or anything with ``to_pydict()``)
+without building a dict per row. For schemas made only of required,
+string, string-enum and array-of-string constraints (such as
+artifact.schema.json) the checks run column by column into validity
+masks; the ``class`` column is resolved through a per-class lookup table.
+Other schemas fall back to jsonschema row by row.
+
+With NumPy installed, each column becomes an object (or fixed-width
+unicode) array and the checks are array operations: value types are
+taken in one ufunc pass and compared per distinct type, enums use
+np.isin, and list cells are flattened so their items are type-checked in
+one pass. Without NumPy the same checks run as a row loop per column.
+
+Null values (``None``) mean the field is absent for that row, as in
+Arrow/Parquet tables.
+"""
+
+from itertools import chain, compress
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional, Sequence
+
+from base120.validators.errors import resolve_errors
+from base120.validators.mappings import resolve_failure_modes
+from base120.validators.schema import validate_schema
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+if TYPE_CHECKING:
+    from base120.metrics import ValidationMetrics
+
+
+SCHEMA_FAILURE = (("ERR-SCHEMA-001",), ("FM15",))
+
+# Keywords that carry no validation constraint
+_ANNOTATIONS = {"$schema", "$id", "$comment", "title", "description", "examples"}
+
+# Column check: (kind, allowed strings or None); kind is "string", "array",
+# "string_array" or "" (presence only)
+_Check = tuple[str, Optional[frozenset[str]]]
+
+
+def _column_plan(schema: Mapping[str, Any]) -> Optional[tuple[tuple[str, ...], dict[str, _Check]]]:
+    """
+    Reduce a schema to column checks, or None if it needs jsonschema.
+
+    Returns (required fields, {property: (kind, enum)}).
+    """
+    if set(schema) - _ANNOTATIONS - {"type", "required", "properties", "additionalProperties"}:
+        return None
+    if schema.get("type") != "object" or schema.get("additionalProperties", True) is not True:
+        return None
+    required = schema.get("required", [])
+    if not isinstance(required, list) or not all(isinstance(r, str) for r in required):
+        return None
+
+    checks: dict[str, _Check] = {}
+    for name, prop in schema.get("properties", {}).items():
+        if not isinstance(prop, Mapping) or set(prop) - _ANNOTATIONS - {"type", "items", "enum"}:
+            return None
+        if "enum" in prop:
+            # Only strings equal a string-only enum, so the type is implied
+            enum = prop["enum"]
+            if (prop.get("type", "string") != "string" or "items" in prop
+                    or not isinstance(enum, list) or not all(isinstance(v, str) for v in enum)):
+                return None
+            checks[name] = ("string", frozenset(enum))
+        elif prop.get("type") == "string" and "items" not in prop:
+            checks[name] = ("string", None)
+        elif prop.get("type") == "array":
+            items = prop.get("items")
+            if items is None:
+                checks[name] = ("array", None)
+            elif isinstance(items, Mapping) and dict(items) == {"type": "string"}:
+                checks[name] = ("string_array", None)
+            else:
+                return None
+        else:
+            return None
+    return tuple(dict.fromkeys(required)), checks
+
+
+def _is_string(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, list)
+
+
+def _is_string_array(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+_CHECKS: dict[str, Callable[[Any], bool]] = {
+    "string": _is_string,
+    "array": _is_array,
+    "string_array": _is_string_array,
+}
+
+
+def _normalize(value: Any) -> Any:
+    """Decode list-column cells (tuples, NumPy arrays) to lists."""
+    if value is None or isinstance(value, (str, list, Mapping)):
+        return value
+    if isinstance(value, tuple) or (np is not None and isinstance(value, np.ndarray)):
+        return [_normalize(item) for item in value]
+    if np is not None and isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _as_columns(table: Any) -> dict[str, Sequence[Any]]:
+    if hasattr(table, "to_pydict"):
+        table = table.to_pydict()
+    return {str(name): column for name, column in table.items()}
+
+
+def _mask(bits: Iterable[bool]) -> int:
+    """Pack per-row booleans into an int with byte i == 1 for valid row i."""
+    return int.from_bytes(bytearray(bits), "little")
+
+
+def _column_mask(column: Sequence[Any], check: _Check, required: bool, rows: int) -> int:
+    """Row-loop validity mask of one column: 1 where the row satisfies its checks."""
+    kind, enum = check
+    if kind in ("array", "string_array"):
+        column = [_normalize(value) for value in column]
+    test = _CHECKS.get(kind)
+    if test is None:
+        # Unconstrained property: only presence matters
+        return _mask([value is not None for value in column]) if required else _mask([True] * rows)
+    if enum is not None:
+        allowed = enum
+        test = lambda value: isinstance(value, str) and value in allowed  # noqa: E731
+    if required:
+        return _mask([test(value) for value in column])
+    return _mask([value is None or test(value) for value in column])
+
+
+def _is_array_type(kind: type) -> bool:
+    return issubclass(kind, (list, tuple, np.ndarray))
+
+
+def _is_string_type(kind: type) -> bool:
+    return issubclass(kind, str)
+
+
+def _type_mask(kinds: Any, accept: Callable[[type], bool], common: type) -> Any:
+    """
+    Rows whose value type passes `accept`, deciding each distinct type
+    once; `common` (the type most rows are expected to have) is compared
+    first so the remaining types are only collected from the other rows.
+    """
+    # Compare against object scalars: classes such as np.ndarray are not
+    # converted like ordinary operands
+    target = np.empty((), dtype=object)
+    target[()] = common
+    ok = kinds == target
+    rest = kinds[~ok]
+    if not accept(common):
+        ok[:] = False
+    for kind in set(rest.tolist()):
+        if accept(kind):
+            target[()] = kind
+            ok |= kinds == target
+    return ok
+
+
+def _all_strings(cells: Sequence[Any]) -> Any:
+    """Per list cell: True if every item is a string (items checked in one pass)."""
+    lengths = np.fromiter(map(len, cells), dtype=np.intp, count=len(cells))
+    kinds = np.fromiter(map(type, chain.from_iterable(cells)), dtype=object,
+                        count=int(lengths.sum()))
+    bad = np.zeros(len(kinds) + 1, dtype=np.intp)
+    np.cumsum(~_type_mask(kinds, _is_string_type, str), out=bad[1:])
+    ends = np.cumsum(lengths)
+    return bad[ends] == bad[ends - lengths]
+
+
+def _column_array(column: Sequence[Any], check: _Check, required: bool, rows: int) -> Any:
+    """NumPy validity mask of one column (bool array)."""
+    kind, enum = check
+    if isinstance(column, np.ndarray) and column.ndim == 1 and column.dtype.kind == "U":
+        # Fixed-width unicode arrays hold only strings and cannot hold nulls
+        if kind not in ("string", ""):
+            return np.zeros(rows, dtype=bool)
+        if enum is not None:
+            return np.isin(column, sorted(enum))
+        return np.ones(rows, dtype=bool)
+
+    if kind == "" and not required:
+        return np.ones(rows, dtype=bool)
+    if isinstance(column, np.ndarray) and column.ndim == 1 and column.dtype == object:
+        kinds = _TYPE_OF(column)
+    else:
+        kinds = np.fromiter(map(type, column), dtype=object, count=rows)
+    if kind == "":
+        return kinds != _NONE_TYPE
+    if kind == "string":
+        ok = _type_mask(kinds, _is_string_type, str)
+        if enum is not None:
+            strings = np.fromiter(compress(column, ok), dtype=object, count=int(ok.sum()))
+            ok[ok] = np.isin(strings, sorted(enum))
+    else:
+        ok = _type_mask(kinds, _is_array_type, list)
+        if kind == "string_array":
+            ok[ok] = _all_strings(list(compress(column, ok)))
+    if not required:
+        ok |= kinds == _NONE_TYPE
+    return ok
+
+
+_TYPE_OF = np.frompyfunc(type, 1, 1) if np is not None else None
+_NONE_TYPE = type(None)
+
+
+def _schema_mask(
+    columns: Mapping[str, Sequence[Any]],
+    required: Sequence[str],
+    checks: Mapping[str, _Check],
+    rows: int,
+) -> bytes:
+    """Column-wise schema validity: byte i == 1 if row i passes."""
+    names = set(required) | set(checks)
+    if np is not None:
+        valid = np.ones(rows, dtype=bool)
+        for name in names:
+            column = columns.get(name)
+            if column is None:
+                if name in required:
+                    valid[:] = False
+                continue
+            valid &= _column_array(column, checks.get(name, ("", None)), name in required, rows)
+        return valid.tobytes()
+
+    mask = _mask([True] * rows)
+    for name in names:
+        column = columns.get(name)
+        if column is None:
+            if name in required:
+                mask = 0
+            continue
+        mask &= _column_mask(column, checks.get(name, ("", None)), name in required, rows)
+    return mask.to_bytes(rows, "little") if rows else b""
+
+
+class ColumnarResult:
+    """
+    Per-row results of validate_columns().
+
+    Attributes:
+        error_codes: Canonical error code tuple per row
+        failure_mode_ids: Sorted failure mode ID tuple per row
+        passed: True per row without errors
+        fallback_rows: Rows validated through jsonschema instead of column checks
+    """
+
+    __slots__ = ("error_codes", "failure_mode_ids", "passed", "fallback_rows")
+
+    def __init__(
+        self,
+        error_codes: list[tuple[str, ...]],
+        failure_mode_ids: list[tuple[str, ...]],
+        fallback_rows: int,
+    ) -> None:
+        self.error_codes = error_codes
+        self.failure_mode_ids = failure_mode_ids
+        self.passed = [not codes for codes in error_codes]
+        self.fallback_rows = fallback_rows
+
+    def __len__(self) -> int:
+        return len(self.error_codes)
+
+    def to_lists(self) -> list[list[str]]:
+        """Error codes per row as lists, matching validate_artifacts()."""
+        return [list(codes) for codes in self.error_codes]
+
+
+def validate_columns(
+    table: Any,
+    schema: Mapping[str, Any],
+    mappings: Mapping[str, Any],
+    err_registry: Sequence[Mapping[str, Any]],
+    event_sink: Optional[Callable[[Mapping[str, Any]], None]] = None,
+    metrics: Optional["ValidationMetrics"] = None,
+    schema_version: str = "v1.0.0",
+    tables: Any = None,
+) -> ColumnarResult:
+    """
+    Validate a columnar batch of artifacts.
+
+    Each row gets the same error codes validate_artifact() returns for the
+    equivalent dict (with null cells omitted). Events are emitted per row
+    through the batch event path; metrics are recorded under kind
+    ``columnar`` (stages ``schema``, ``lookup``, ``event_emission``,
+    ``total``) with one result count per row.
+
+    Args:
+        table: Mapping of column name to equal-length sequence, or an object
+            with ``to_pydict()`` (e.g. pyarrow.Table)
+        schema: Artifact JSON schema
+        mappings: Parsed mappings.json
+        err_registry: ERR registry entries
+        event_sink: Optional sink for validator_result events
+        metrics: Optional ValidationMetrics
+        schema_version: Version reported in validator_result events
+        tables: FM bitset tables compiled from `mappings` and
+            `err_registry` (default: resolve through the registries)
+
+    Returns:
+        ColumnarResult with per-row result arrays
+    """
+    columns = _as_columns(table)
+    lengths = {len(column) for column in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns have different lengths: {sorted(lengths)}")
+    rows = lengths.pop() if lengths else 0
+    watch = metrics.stopwatch("columnar") if metrics is not None else None
+    started = metrics.clock() if metrics is not None else 0.0
+
+    # 1. Schema validation: column masks, or jsonschema per row
+    plan = _column_plan(schema)
+    fallback_rows = 0
+    if plan is not None:
+        schema_ok = _schema_mask(columns, *plan, rows)
+    else:
+        fallback_rows = rows
+        names = list(columns)
+        schema_ok = bytes(
+            not validate_schema(
+                {name: _normalize(columns[name][i]) for name in names
+                 if columns[name][i] is not None},
+                schema,
+            )
+            for i in range(rows)
+        )
+    if watch is not None:
+        watch.lap("schema")
+
+    # 2. class -> (errors, FMs) lookup table, one resolution per distinct class
+    classes = columns.get("class", [None] * rows)
+    lookup: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+    error_codes: list[tuple[str, ...]] = []
+    failure_mode_ids: list[tuple[str, ...]] = []
+    for ok, subclass in zip(schema_ok, classes):
+        if not ok:
+            codes, fms = SCHEMA_FAILURE
+        else:
+            # Same key validate_artifact() resolves: str(artifact.get("class", ""))
+            key = "" if subclass is None else str(subclass)
+            entry = lookup.get(key)
+            if entry is None and tables is not None:
+                mask, fm_ids = tables.failure_modes(key)
+                entry = lookup[key] = (tables.errors(mask), fm_ids)
+            elif entry is None:
+                resolved = resolve_failure_modes(key, mappings)
+                entry = lookup[key] = (
+                    tuple(resolve_errors(resolved, err_registry)),
+                    tuple(sorted(resolved)),
+                )
+            codes, fms = entry
+        error_codes.append(codes)
+        failure_mode_ids.append(fms)
+    if watch is not None:
+        watch.lap("lookup")
+
+    # 3. Events
+    if event_sink is not None and rows:
+        try:
+            from base120.observability import create_validator_events, emit_events
+
+            ids = columns.get("id", [None] * rows)
+            emit_events(event_sink, create_validator_events(
+                (
+                    ("unknown" if artifact_id is None else _normalize(artifact_id),
+                     list(codes), list(fms))
+                    for artifact_id, codes, fms in zip(ids, error_codes, failure_mode_ids)
+                ),
+                schema_version=schema_version,
+            ))
+        except Exception:
+            # Never propagate observability failures
+            pass
+    if watch is not None:
+        watch.lap("event_emission")
+        metrics.observe_stage("columnar", "total", metrics.clock() - started)
+        at = metrics.clock()
+        for codes, fms in zip(error_codes, failure_mode_ids):
+            metrics.count_result("columnar", codes, fms, at=at, started=started)
+
+    return ColumnarResult(error_codes, failure_mode_ids, fallback_rows)
@@ -0,0 +1,267 @@
+"""
+Schema compiler.
+
+Generates a specialized Python predicate for a JSON Schema (Draft 2020-12)
+that uses only the keywords base120 schemas need: ``type``, ``required``,
+``properties``, ``additionalProperties``, ``items``, ``pattern``,
+``minLength``/``maxLength``, ``minItems``/``maxItems``,
+``minimum``/``maximum`` (and exclusive forms) and string ``enum``.
+Annotation keywords (``title``, ``description``, ``format``, ...) are
+ignored, as jsonschema does without a format checker.
+
+compile_schema() returns None for schemas using anything else; callers
+then use jsonschema. Compiled predicates only answer valid/invalid; error
+details still come from jsonschema.
+"""
+
+from typing import Any, Callable, Mapping, Optional
+
+import re
+import threading
+
+from base120.codec import canonical_dumps
+
+
+Predicate = Callable[[Any], bool]
+
+# Keywords that never affect validity
+_ANNOTATIONS = frozenset({
+    "$schema", "$id", "$comment", "title", "description", "examples",
+    "default", "format", "deprecated", "readOnly", "writeOnly",
+})
+
+_TYPE_TESTS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "integer": (
+        "((isinstance({v}, int) and not isinstance({v}, bool))"
+        " or (isinstance({v}, float) and {v}.is_integer()))"
+    ),
+}
+
+_NUMBER = "(isinstance({v}, (int, float)) and not isinstance({v}, bool))"
+
+
+class _Unsupported(Exception):
+    """Raised when a schema uses a keyword the compiler does not handle."""
+
+
+class _Generator:
+    """Emits the body of one predicate function."""
+
+    _SUPPORTED = frozenset({
+        "type", "required", "properties", "additionalProperties", "items",
+        "pattern", "minLength", "maxLength", "minItems", "maxItems",
+        "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum", "enum",
+    })
+
+    def __init__(self) -> None:
+        self.namespace: dict[str, Any] = {}
+        self._names = 0
+
+    def _fresh(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def _const(self, value: Any, prefix: str) -> str:
+        name = self._fresh(prefix)
+        self.namespace[name] = value
+        return name
+
+    def emit(self, schema: Any, var: str, indent: str) -> list[str]:
+        """Return lines that ``return False`` when `var` violates `schema`."""
+        if schema is True:
+            return []
+        if schema is False:
+            return [f"{indent}return False"]
+        if not isinstance(schema, Mapping):
+            raise _Unsupported(f"schema must be an object or boolean, got {schema!r}")
+        unknown = set(schema) - self._SUPPORTED - _ANNOTATIONS
+        if unknown:
+            raise _Unsupported(f"unsupported keywords: {sorted(unknown)}")
+
+        lines: list[str] = []
+        if "type" in schema:
+            types = schema["type"]
+            types = [types] if isinstance(types, str) else types
+            if not isinstance(types, list) or not types or any(t not in _TYPE_TESTS for t in types):
+                raise _Unsupported(f"unsupported type: {schema['type']!r}")
+            test = " or ".join(_TYPE_TESTS[t].format(v=var) for t in types)
+            lines.append(f"{indent}if not ({test}):")
+            lines.append(f"{indent}    return False")
+
+        if "enum" in schema:
+            values = schema["enum"]
+            if not isinstance(values, list) or not all(isinstance(x, str) for x in values):
+                raise _Unsupported("enum supports string values only")
+            name = self._const(frozenset(values), "enum")
+            lines.append(f"{indent}if not (isinstance({var}, str) and {var} in {name}):")
+            lines.append(f"{indent}    return False")
+
+        # With a single declared type the type check above already rejected
+        # every other kind, so its keywords need no guard and the rest are dead
+        single = types[0] if "type" in schema and len(types) == 1 else None
+        if single == "integer":
+            single = "number"
+        for kind, guard, build in (
+            ("string", "isinstance({v}, str)", self._string),
+            ("number", _NUMBER, self._number),
+            ("object", "isinstance({v}, dict)", self._object),
+            ("array", "isinstance({v}, list)", self._array),
+        ):
+            if single is None:
+                body = build(schema, var, indent + "    ")
+                if body:
+                    lines += [f"{indent}if {guard.format(v=var)}:"] + body
+            elif single == kind:
+                lines += build(schema, var, indent)
+        return lines
+
+    @staticmethod
+    def _int(schema: Mapping[str, Any], keyword: str) -> int:
+        value = schema[keyword]
+        if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+            raise _Unsupported(f"{keyword} must be a non-negative integer")
+        return value
+
+    def _string(self, schema: Mapping[str, Any], var: str, indent: str) -> list[str]:
+        lines = []
+        if "minLength" in schema:
+            lines += [f"{indent}if len({var}) < {self._int(schema, 'minLength')}:",
+                      f"{indent}    return False"]
+        if "maxLength" in schema:
+            lines += [f"{indent}if len({var}) > {self._int(schema, 'maxLength')}:",
+                      f"{indent}    return False"]
+        if "pattern" in schema:
+            try:
+                regex = re.compile(schema["pattern"])
+            except (re.error, TypeError) as e:
+                raise _Unsupported(f"pattern: {e}")
+            name = self._const(regex.search, "pattern")
+            lines += [f"{indent}if {name}({var}) is None:", f"{indent}    return False"]
+        return lines
+
+    def _number(self, schema: Mapping[str, Any], var: str, indent: str) -> list[str]:
+        lines = []
+        for keyword, op in (("minimum", "<"), ("maximum", ">"),
+                            ("exclusiveMinimum", "<="), ("exclusiveMaximum", ">=")):
+            if keyword in schema:
+                bound = schema[keyword]
+                if not isinstance(bound, (int, float)) or isinstance(bound, bool):
+                    raise _Unsupported(f"{keyword} must be a number")
+                lines += [f"{indent}if {var} {op} {self._const(bound, 'bound')}:",
+                          f"{indent}    return False"]
+        return lines
+
+    def _object(self, schema: Mapping[str, Any], var: str, indent: str) -> list[str]:
+        lines = []
+        required = schema.get("required")
+        if required is not None:
+            if not isinstance(required, list) or not all(isinstance(r, str) for r in required):
+                raise _Unsupported("required must be a list of strings")
+            if required:
+                missing = " or ".join(
+                    f"{self._const(key, 'key')} not in {var}" for key in dict.fromkeys(required)
+                )
+                lines += [f"{indent}if {missing}:", f"{indent}    return False"]
+
+        properties = schema.get("properties", {})
+        if not isinstance(properties, Mapping):
+            raise _Unsupported("properties must be an object")
+        for prop, subschema in properties.items():
+            value = self._fresh("v")
+            body = self.emit(subschema, value, indent + "    ")
+            if body:
+                key = self._const(prop, "key")
+                lines += [f"{indent}if {key} in {var}:",
+                          f"{indent}    {value} = {var}[{key}]"] + body
+
+        additional = schema.get("additionalProperties", True)
+        key_var = self._fresh("k")
+        value = self._fresh("v")
+        body = self.emit(additional, value, indent + "        ")
+        if body:
+            known = self._const(frozenset(properties), "known")
+            lines += [f"{indent}for {key_var} in {var}:",
+                      f"{indent}    if {key_var} not in {known}:",
+                      f"{indent}        {value} = {var}[{key_var}]"] + body
+        return lines
+
+    def _array(self, schema: Mapping[str, Any], var: str, indent: str) -> list[str]:
+        lines = []
+        if "minItems" in schema:
+            lines += [f"{indent}if len({var}) < {self._int(schema, 'minItems')}:",
+                      f"{indent}    return False"]
+        if "maxItems" in schema:
+            lines += [f"{indent}if len({var}) > {self._int(schema, 'maxItems')}:",
+                      f"{indent}    return False"]
+        if "items" in schema:
+            item = self._fresh("item")
+            body = self.emit(schema["items"], item, indent + "    ")
+            if body:
+                lines += [f"{indent}for {item} in {var}:"] + body
+        return lines
+
+
+def generate_source(schema: Mapping[str, Any]) -> Optional[tuple[str, dict[str, Any]]]:
+    """
+    Generate predicate source for `schema`.
+
+    Returns (source, namespace), or None if the schema is unsupported.
+    The source defines ``def is_valid(instance) -> bool``.
+    """
+    generator = _Generator()
+    try:
+        body = generator.emit(schema, "instance", "    ")
+    except _Unsupported:
+        return None
+    source = "\n".join(["def is_valid(instance):"] + body + ["    return True", ""])
+    return source, generator.namespace
+
+
+def compile_schema(schema: Mapping[str, Any]) -> Optional[Predicate]:
+    """
+    Compile `schema` into a predicate with jsonschema's pass/fail outcome.
+
+    Returns None if the schema uses keywords the compiler does not support.
+    """
+    generated = generate_source(schema)
+    if generated is None:
+        return None
+    source, namespace = generated
+    exec(compile(source, "<base120 compiled schema>", "exec"), namespace)
+    return namespace["is_valid"]
+
+
+# Canonical JSON of the schema -> predicate or None
+_compiled: dict[str, Optional[Predicate]] = {}
+_compiled_lock = threading.Lock()
+_MAX_COMPILED = 64
+
+
+def compiled_validator(schema: Mapping[str, Any]) -> Optional[Predicate]:
+    """
+    Return the cached compiled predicate for `schema`, compiling on first use.
+
+    Predicates are cached by the schema's canonical JSON, so a schema
+    changed in place gets a new predicate. Callers validating many
+    artifacts against a schema they own should keep the result of
+    compile_schema() instead of paying for the lookup on every call.
+    Returns None for unsupported schemas.
+    """
+    try:
+        key = canonical_dumps(schema)
+    except (TypeError, ValueError):
+        return compile_schema(schema)
+    if key in _compiled:
+        return _compiled[key]
+    predicate = compile_schema(schema)
+    with _compiled_lock:
+        if len(_compiled) >= _MAX_COMPILED:
+            _compiled.clear()
+        _compiled[key] = predicate
+    return predicate
@@ -4,11 +4,11 @@ from typing import Any, Mapping, Sequence
 def resolve_errors(fms: list[str], err_registry: Sequence[Mapping[str, Any]]) -> list[str]:
     # FM30 dominance: escalation suppresses all other errors
     if "FM30" in fms:
-        return sorted(
+        return sorted({
             str(entry.get("id", ""))
             for entry in err_registry
             if "FM30" in entry.get("fm", [])
-        )
+        })
 
     errs: list[str] = []
     for entry in err_registry:
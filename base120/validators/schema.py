@@ -1,10 +1,23 @@
-from typing import Any, Mapping
+from typing import Any, Mapping, Optional
 
 # pyright: reportMissingModuleSource=false
 from jsonschema import Draft202012Validator
 
+from base120.validators.compiler import Predicate, compiled_validator
+
+
+def validate_schema(
+    artifact: Mapping[str, Any],
+    schema: Mapping[str, Any],
+    is_valid: Optional[Predicate] = None,
+) -> list[str]:
+    # Specialized predicate when the schema only uses compiled keywords
+    # (the caller's compile_schema(schema), or looked up by content)
+    if is_valid is None:
+        is_valid = compiled_validator(schema)
+    if is_valid is not None:
+        return [] if is_valid(artifact) else ["ERR-SCHEMA-001"]
 
-def validate_schema(artifact: Mapping[str, Any], schema: Mapping[str, Any]) -> list[str]:
     validator = Draft202012Validator(schema)
     errors = list(validator.iter_errors(artifact))  # type: ignore[call-overload]
     return ["ERR-SCHEMA-001"] if errors else []
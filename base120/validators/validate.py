@@ -1,8 +1,14 @@
-from typing import Any, Callable, Mapping, MutableSequence, Optional, Sequence
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Mapping, Optional, Sequence, Union
 
 from base120.validators.schema import validate_schema
 from base120.validators.mappings import resolve_failure_modes
 from base120.validators.errors import resolve_errors
+from base120.validators.compiler import Predicate
+from base120.tracing import SpanRecorder, StageRecorder, current_trace, stage_timer
+
+if TYPE_CHECKING:
+    from base120.cache import ValidationCache
+    from base120.metrics import Stopwatch, ValidationMetrics
 
 def validate_artifact(
     artifact: Mapping[str, Any],
@@ -10,32 +16,169 @@ def validate_artifact(
     mappings: Mapping[str, Any],
     err_registry: Sequence[Mapping[str, Any]],
     event_sink: Optional[Callable[[Mapping[str, Any]], None]] = None,
+    metrics: Optional["ValidationMetrics"] = None,
+    cache: Optional["ValidationCache"] = None,
+    schema_version: str = "v1.0.0",
+    is_valid: Optional[Predicate] = None,
+    tables: Any = None,
 ) -> list[str]:
 
-    errs: MutableSequence[str] = []
-    fms: list[str] = []
+    watch = stage_timer("artifact", metrics)
+    result, fms = _evaluate_cached(
+        artifact, schema, mappings, err_registry, watch, cache, is_valid, tables
+    )
+
+    # Emit observability event
+    _emit_event(artifact, result, fms, event_sink, watch, schema_version)
+
+    if watch is not None:
+        watch.lap("event_emission")
+        watch.finish(result, fms)
+    return result
+
+
+def validate_artifacts(
+    artifacts: Iterable[Mapping[str, Any]],
+    schema: Mapping[str, Any],
+    mappings: Mapping[str, Any],
+    err_registry: Sequence[Mapping[str, Any]],
+    event_sink: Optional[Callable[[Mapping[str, Any]], None]] = None,
+    metrics: Optional["ValidationMetrics"] = None,
+    cache: Optional["ValidationCache"] = None,
+    schema_version: str = "v1.0.0",
+    is_valid: Optional[Predicate] = None,
+    tables: Any = None,
+) -> list[list[str]]:
+    """
+    Validate a batch of artifacts.
+    
+    Returns the same error lists as calling validate_artifact() on each
+    artifact in order. Events are built once for the whole batch (one
+    clock read, one configuration lookup) and delivered with a single
+    ``write_batch`` call when the sink supports it. Batch event emission is
+    recorded as the ``event_emission`` stage of kind ``artifact_batch``.
+    Under an active trace, every event carries the trace's correlation ID
+    and its own artifact's spans. Events report `schema_version`.
+    `is_valid` is an optional compile_schema(schema) predicate the caller
+    keeps for `schema`, which skips the compiled-schema lookup; `tables`
+    are FM bitset tables the caller compiled from `mappings` and
+    `err_registry` (see base120.validators.bitset).
+    """
+    results: list[list[str]] = []
+    outcomes: list[tuple[str, Sequence[str], Sequence[str]]] = []
+    spans: list[list[dict[str, Any]]] = []
+    for artifact in artifacts:
+        watch = stage_timer("artifact", metrics)
+        result, fms = _evaluate_cached(
+            artifact, schema, mappings, err_registry, watch, cache, is_valid, tables
+        )
+        if watch is not None:
+            watch.finish(result, fms)
+        results.append(result)
+        if event_sink is not None:
+            outcomes.append((_artifact_id(artifact), result, sorted(fms)))
+            if isinstance(watch, SpanRecorder):
+                spans.append(watch.spans)
+
+    if event_sink is not None and outcomes:
+        started = metrics.clock() if metrics is not None else 0.0
+        try:
+            from base120.observability import create_validator_events, emit_events
+
+            context = current_trace()
+            events = create_validator_events(
+                outcomes,
+                schema_version=schema_version,
+                correlation_id=context.correlation_id if context is not None else None,
+            )
+            for event, artifact_spans in zip(events, spans):
+                event["spans"] = artifact_spans
+            emit_events(event_sink, events)
+        except Exception:
+            # Never propagate observability failures
+            pass
+        if metrics is not None:
+            metrics.observe_stage("artifact_batch", "event_emission", metrics.clock() - started)
+    return results
+
+
+def _evaluate_cached(
+    artifact: Mapping[str, Any],
+    schema: Mapping[str, Any],
+    mappings: Mapping[str, Any],
+    err_registry: Sequence[Mapping[str, Any]],
+    watch: Optional[Union["Stopwatch", StageRecorder]],
+    cache: Optional["ValidationCache"],
+    is_valid: Optional[Predicate] = None,
+    tables: Any = None,
+) -> tuple[list[str], list[str]]:
+    """Run _evaluate() through the result cache, if one is given."""
+    if cache is None:
+        return _evaluate(artifact, schema, mappings, err_registry, watch, is_valid, tables)
+
+    key = cache.key(artifact, schema, mappings, err_registry)
+    hit = cache.get(key) if key is not None else None
+    if watch is not None:
+        watch.lap("cache_lookup")
+    if hit is not None:
+        return list(hit[0]), list(hit[1])
 
+    result, fms = _evaluate(artifact, schema, mappings, err_registry, watch, is_valid, tables)
+    if key is not None:
+        cache.put(key, result, fms)
+    return result, fms
+
+
+def _evaluate(
+    artifact: Mapping[str, Any],
+    schema: Mapping[str, Any],
+    mappings: Mapping[str, Any],
+    err_registry: Sequence[Mapping[str, Any]],
+    watch: Optional[Union["Stopwatch", StageRecorder]],
+    is_valid: Optional[Predicate] = None,
+    tables: Any = None,
+) -> tuple[list[str], list[str]]:
+    """Run the validation pipeline; return (canonical error codes, FMs)."""
     # 1. Schema validation
-    errs.extend(validate_schema(artifact, schema))
+    errs = validate_schema(artifact, schema, is_valid)
+    if watch is not None:
+        watch.lap("schema")
     if errs:
         # Schema failure implies FM15 (Schema Non-Compliance)
-        fms = ["FM15"]
-        _emit_event(artifact, errs, fms, event_sink)
-        seen = set()
-        return [x for x in sorted(errs) if not (x in seen or seen.add(x))]
+        return _canonical(errs), ["FM15"]
 
-    # 2. Subclass → FM
     subclass = str(artifact.get("class", ""))
-    fms = resolve_failure_modes(subclass, mappings)
+    if tables is None:
+        # 2. Subclass → FM
+        fms = resolve_failure_modes(subclass, mappings)
+        if watch is not None:
+            watch.lap("fm_mapping")
+
+        # 3. FM → ERR (resolve_errors returns sorted, deduplicated codes)
+        errs = resolve_errors(fms, err_registry)
+        if watch is not None:
+            watch.lap("err_resolution")
+        return errs, fms
+
+    # 2. Subclass → FM mask
+    fm_mask, fm_ids = tables.failure_modes(subclass)
+    if watch is not None:
+        watch.lap("fm_mapping")
 
-    # 3. FM → ERR
-    errs.extend(resolve_errors(fms, err_registry))
+    # 3. FM mask → ERR (memoized per mask; lists are built only here)
+    codes = tables.errors(fm_mask)
+    if watch is not None:
+        watch.lap("err_resolution")
+    return list(codes), list(fm_ids)
 
-    # 4. Emit observability event
-    _emit_event(artifact, errs, fms, event_sink)
 
-    seen = set()
-    return [x for x in sorted(errs) if not (x in seen or seen.add(x))]
+def _canonical(error_codes: Iterable[str]) -> list[str]:
+    """Deterministic deduplication: sort first, then deduplicate."""
+    return list(dict.fromkeys(sorted(error_codes)))
+
+
+def _artifact_id(artifact: Mapping[str, Any]) -> Any:
+    return artifact.get("id", "unknown")
 
 
 def _emit_event(
@@ -43,10 +186,14 @@ def _emit_event(
     error_codes: Sequence[str],
     failure_mode_ids: Sequence[str],
     event_sink: Optional[Callable[[Mapping[str, Any]], None]],
+    watch: Optional[Union["Stopwatch", StageRecorder]] = None,
+    schema_version: str = "v1.0.0",
 ) -> None:
     """
     Emit validator_result event if event_sink is provided.
     
+    `error_codes` must already be sorted and deduplicated. Under an active
+    trace the event carries its correlation ID and the spans recorded so far.
     Event emission errors are caught and never propagate.
     """
     if event_sink is None:
@@ -55,19 +202,14 @@ def _emit_event(
     try:
         from base120.observability import create_validator_event
         
-        artifact_id = artifact.get("id", "unknown")
-        result = "success" if not error_codes else "failure"
-        
-        # Deterministic deduplication: sort first, then deduplicate
-        seen = set()
-        deduplicated_codes = [x for x in sorted(error_codes) if not (x in seen or seen.add(x))]
-        
         event = create_validator_event(
-            artifact_id=artifact_id,
-            schema_version="v1.0.0",
-            result=result,
-            error_codes=deduplicated_codes,
-            failure_mode_ids=list(failure_mode_ids),
+            artifact_id=_artifact_id(artifact),
+            schema_version=schema_version,
+            result="success" if not error_codes else "failure",
+            error_codes=error_codes,
+            failure_mode_ids=failure_mode_ids,
+            correlation_id=watch.trace.correlation_id if isinstance(watch, SpanRecorder) else None,
+            spans=list(watch.spans) if isinstance(watch, SpanRecorder) else None,
         )
         
         event_sink(event)
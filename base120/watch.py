@@ -0,0 +1,158 @@
+"""
+Base120 Watch Mode
+
+Re-validates artifact and contract files as they change. Directories are
+polled with stat() (size and mtime); files whose stamp changed are read
+and hashed, and only files whose content actually changed are
+re-validated, so no-op writes (touch, editor saves of unchanged buffers)
+produce no output. Schemas, registries and compiled tables stay loaded
+for the life of the watcher.
+"""
+
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence, TextIO
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+
+from base120.codec import dumps
+from base120.compression import compression_for, decompress
+from base120.engine import RegistryEngine, document_record
+from base120.inputs import iter_corpus_paths, iter_text_documents
+from base120.report import canonical_dumps, error_record
+from base120.validators.compiler import compiled_validator
+
+
+class Watcher:
+    """
+    Incremental validator over a set of files and directories.
+
+    poll() returns result records for every file whose content changed
+    since the previous poll (all files on the first poll), plus a
+    ``"record_type": "removed"`` record per deleted file.
+
+    Args:
+        paths: Files or directories to watch (*.json, *.ndjson, optionally
+            compressed; expected outputs of a corpus are skipped)
+        engine: RegistryEngine used for artifacts and contracts
+        metrics: Optional ValidationMetrics
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[str],
+        engine: Optional[RegistryEngine] = None,
+        metrics: Any = None,
+    ) -> None:
+        self.paths = list(paths)
+        self.engine = engine if engine is not None else RegistryEngine()
+        self.metrics = metrics
+        # path -> (size, mtime_ns) and path -> content digest as of the last poll
+        self._stamps: dict[str, tuple[int, int]] = {}
+        self._digests: dict[str, bytes] = {}
+        # Files whose last read failed; retried every poll, reported once
+        self._failed: set[str] = set()
+        self.warm()
+
+    def warm(self) -> None:
+        """Load every registry version and compile its schemas now."""
+        self.engine.load_all()
+        for version in self.engine.versions:
+            loaded = self.engine.get(version)
+            if loaded.contract_schema is not None:
+                compiled_validator(loaded.contract_schema)
+
+    def _scan(self) -> tuple[list[Path], list[str]]:
+        """Return (files whose stamp changed, files that disappeared)."""
+        changed = []
+        seen = set()
+        for path in iter_corpus_paths(self.paths):
+            key = str(path)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            seen.add(key)
+            stamp = (stat.st_size, stat.st_mtime_ns)
+            if self._stamps.get(key) != stamp:
+                self._stamps[key] = stamp
+                changed.append(path)
+        removed = [key for key in self._stamps if key not in seen]
+        for key in removed:
+            del self._stamps[key]
+            self._digests.pop(key, None)
+            self._failed.discard(key)
+        return changed, removed
+
+    def poll(self) -> list[dict[str, Any]]:
+        """Re-validate changed files; return their records."""
+        changed, removed = self._scan()
+        records: list[dict[str, Any]] = []
+        for path in changed:
+            key = str(path)
+            try:
+                data = path.read_bytes()
+            except OSError as e:
+                # Forget the stamp so the file is read again next poll (e.g.
+                # caught mid-replace) even if its size and mtime stay the same
+                del self._stamps[key]
+                if key not in self._failed:
+                    self._failed.add(key)
+                    records.append(error_record(key, f"Failed to read: {e}"))
+                continue
+            self._failed.discard(key)
+            digest = hashlib.blake2b(data, digest_size=16).digest()
+            if self._digests.get(key) == digest:
+                continue
+            self._digests[key] = digest
+            records.extend(self.validate_file(path, data))
+        records.extend({"record_type": "removed", "path": key} for key in removed)
+        return records
+
+    def validate_file(self, path: Path, data: bytes) -> Iterator[dict[str, Any]]:
+        """Yield result records for the documents in one file's contents."""
+        try:
+            text = decompress(data, compression_for(path)).decode("utf-8")
+            documents = list(iter_text_documents(path, text))
+        except (OSError, UnicodeDecodeError) as e:
+            yield error_record(str(path), f"Failed to read: {e}")
+            return
+        except json.JSONDecodeError as e:
+            yield error_record(str(path), f"Invalid JSON: {e}")
+            return
+        for location, document in documents:
+            yield document_record(self.engine, location, document, self.metrics)
+
+    def run(
+        self,
+        output: TextIO,
+        interval: float = 0.02,
+        stop: Optional[threading.Event] = None,
+        canonical: bool = False,
+        log: Optional[TextIO] = sys.stderr,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """
+        Poll every `interval` seconds, writing records as NDJSON lines.
+
+        Runs until `stop` is set (or forever). Each cycle that produced
+        records is flushed immediately and, with `log`, summarized with
+        its duration.
+        """
+        serialize = canonical_dumps if canonical else dumps
+        stop = stop if stop is not None else threading.Event()
+        while not stop.is_set():
+            started = clock()
+            records = self.poll()
+            if records:
+                output.write("".join(serialize(record) + "\n" for record in records))
+                output.flush()
+                if log is not None:
+                    failed = sum(1 for r in records if r.get("status") in ("fail", "error"))
+                    print(f"[watch] {len(records)} result(s), {failed} failing, "
+                          f"{(clock() - started) * 1000:.1f} ms", file=log, flush=True)
+            stop.wait(interval)
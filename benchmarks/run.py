@@ -0,0 +1,389 @@
+"""
+Base120 benchmark suite.
+
+Measures the validator, contract and observability hot paths and writes
+machine-readable results. Optionally compares against a baseline run and
+exits non-zero on regressions, for use as an opt-in CI gate.
+
+The CI gate runs this file against older base revisions too, so modules
+added after the first release are imported optionally and their cases are
+skipped (and listed under ``meta.unavailable``) when a revision lacks them.
+
+Usage:
+    python benchmarks/run.py [-o results.json] [--quick | --smoke]
+    python benchmarks/run.py --baseline base.json --max-regression 0.25
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import timeit
+from io import StringIO
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+from jsonschema import Draft202012Validator  # noqa: E402
+
+from base120.contract.validate import validate_contract, validate_failure_graph  # noqa: E402
+from base120.observability import create_event_sink  # noqa: E402
+from base120.validators.errors import resolve_errors  # noqa: E402
+from base120.validators.validate import validate_artifact  # noqa: E402
+
+UNAVAILABLE: list[str] = []
+
+
+def _optional(module: str, name: str) -> Any:
+    """Return `module.name`, or None when this revision does not have it."""
+    try:
+        return getattr(importlib.import_module(module), name)
+    except (ImportError, AttributeError):
+        UNAVAILABLE.append(f"{module}.{name}")
+        return None
+
+
+ValidationCache = _optional("base120.cache", "ValidationCache")
+JSONCodec = _optional("base120.codec", "JSONCodec")
+json_backend = _optional("base120.codec", "json_backend")
+ValidationMetrics = _optional("base120.metrics", "ValidationMetrics")
+create_batch_event_sink = _optional("base120.observability", "create_batch_event_sink")
+iter_artifacts = _optional("base120.synth", "iter_artifacts")
+validate_columns = _optional("base120.validators.columnar", "validate_columns")
+compiled_validator = _optional("base120.validators.compiler", "compiled_validator")
+validate_artifacts = _optional("base120.validators.validate", "validate_artifacts")
+Watcher = _optional("base120.watch", "Watcher")
+
+# Graph sizes and registry sizes per profile
+PROFILES: dict[str, dict[str, Any]] = {
+    "full": {"graph_sizes": [10, 100, 1_000, 10_000, 100_000],
+             "registry_sizes": [100, 1_000, 10_000], "repeat": 5, "calibrate": True},
+    "quick": {"graph_sizes": [10, 100, 1_000],
+              "registry_sizes": [100, 1_000], "repeat": 3, "calibrate": True},
+    "smoke": {"graph_sizes": [10], "registry_sizes": [100], "repeat": 1,
+              "calibrate": False},
+}
+
+
+def _load(path: Path) -> Any:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+SCHEMA = _load(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json")
+CONTRACT_SCHEMA = _load(ROOT / "schemas" / "v1.0.0" / "contract.schema.json")
+MAPPINGS = _load(ROOT / "registries" / "mappings.json")
+ERR_REGISTRY = _load(ROOT / "registries" / "err.json")["registry"]
+FM_IDS = [entry["id"] for entry in _load(ROOT / "registries" / "fm.json")["registry"]]
+
+# One artifact per validate_artifact outcome path
+ARTIFACTS: dict[str, dict[str, Any]] = {
+    "valid": {"id": "bench-valid", "domain": "core", "class": "example",
+              "instance": "x", "models": ["FM1"]},
+    "schema_failure": {"id": "bench-schema", "domain": "core", "class": "example",
+                       "models": ["FM1"]},
+    "fm_errors": {"id": "bench-fm", "domain": "core", "class": "52",
+                  "instance": "x", "models": ["FM1"]},
+    "fm30_dominance": {"id": "bench-fm30", "domain": "core", "class": "22",
+                       "instance": "x", "models": ["FM1"]},
+}
+
+
+def synthetic_err_registry(size: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Build an err.json-style registry with `size` entries over FM1-FM30."""
+    rng = random.Random(seed)
+    return [
+        {"id": f"ERR-SYN-{i:05d}", "fm": rng.sample(FM_IDS, rng.randint(1, 3)),
+         "severity": "fatal"}
+        for i in range(size)
+    ]
+
+
+def synthetic_failure_graph(size: int) -> dict[str, Any]:
+    """Build an acyclic escalation chain of `size` nodes ending in termination."""
+    nodes = [
+        {"id": f"FM{i}", "name": f"Node {i}", "max_retries": 1, "action": "escalate"}
+        for i in range(size)
+    ]
+    nodes[-1]["action"] = "terminate"
+    edges = [
+        {"from": f"FM{i}", "to": f"FM{i + 1}", "condition": "max_retries_exceeded"}
+        for i in range(size - 1)
+    ]
+    return {"nodes": nodes, "edges": edges}
+
+
+def cases(profile: Mapping[str, Any]) -> Iterator[tuple[str, Callable[[], Any]]]:
+    """Yield (name, zero-argument callable) benchmark cases."""
+    for name, artifact in ARTIFACTS.items():
+        yield (f"validate_artifact.{name}",
+               lambda a=artifact: validate_artifact(a, SCHEMA, MAPPINGS, ERR_REGISTRY))
+
+    # Schema step alone: generic jsonschema engine vs compiled predicate
+    is_valid = compiled_validator(SCHEMA) if compiled_validator is not None else None
+    for name, artifact in (("valid", ARTIFACTS["valid"]),
+                           ("schema_failure", ARTIFACTS["schema_failure"])):
+        yield (f"schema_step.jsonschema.{name}",
+               lambda a=artifact: list(Draft202012Validator(SCHEMA).iter_errors(a)))
+        if is_valid is not None:
+            yield (f"schema_step.compiled.{name}", lambda a=artifact: is_valid(a))
+
+    for size in profile["registry_sizes"]:
+        registry = synthetic_err_registry(size)
+        yield (f"resolve_errors.registry_{size}",
+               lambda r=registry: resolve_errors(["FM8", "FM9", "FM10"], r))
+        yield (f"resolve_errors.fm30.registry_{size}",
+               lambda r=registry: resolve_errors(["FM29", "FM30"], r))
+
+    for size in profile["graph_sizes"]:
+        graph = synthetic_failure_graph(size)
+        yield (f"validate_failure_graph.nodes_{size}",
+               lambda g=graph: validate_failure_graph(g))
+
+    contract = _load(ROOT / "examples" / "contracts" / "valid-basic-contract.json")
+    yield ("validate_contract.valid_basic",
+           lambda: validate_contract(contract, CONTRACT_SCHEMA))
+
+    # Sink overhead = with_sink - without_sink (reported in summary)
+    sink = create_event_sink(StringIO())
+    artifact = ARTIFACTS["valid"]
+    yield ("event_sink.without_sink",
+           lambda: validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY))
+    yield ("event_sink.with_stringio_sink",
+           lambda: validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY,
+                                     event_sink=sink))
+
+    # Per-event vs batched emission over the same 100 artifacts
+    batch = [artifact] * 100
+    yield ("event_sink.per_event_100",
+           lambda: [validate_artifact(a, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=sink)
+                    for a in batch])
+    if create_batch_event_sink is not None and validate_artifacts is not None:
+        batch_sink = create_batch_event_sink(StringIO())
+        yield ("event_sink.batch_100",
+               lambda: validate_artifacts(batch, SCHEMA, MAPPINGS, ERR_REGISTRY,
+                                          event_sink=batch_sink))
+
+    # Row-at-a-time vs columnar over the same 1000-row table
+    rows = ([dict(artifact, id=f"bench-{i}") for i in range(1000)] if iter_artifacts is None
+            else list(iter_artifacts(1000, MAPPINGS, seed=0)))
+    if validate_artifacts is not None:
+        yield ("table.rows_1000.validate_artifacts",
+               lambda: validate_artifacts(rows, SCHEMA, MAPPINGS, ERR_REGISTRY))
+    if validate_columns is not None:
+        columns = {name: [row.get(name) for row in rows]
+                   for name in sorted({name for row in rows for name in row})}
+        yield ("table.rows_1000.validate_columns",
+               lambda: validate_columns(columns, SCHEMA, MAPPINGS, ERR_REGISTRY))
+
+    # Steady-state hit: the artifact is cached after the first call
+    if ValidationCache is not None:
+        cache = ValidationCache()
+        yield ("cache.hit",
+               lambda: validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY, cache=cache))
+
+    if ValidationMetrics is not None:
+        metrics = ValidationMetrics()
+        yield ("metrics.enabled",
+               lambda: validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY,
+                                         metrics=metrics))
+
+    # Watch mode: one poll cycle (stat scan of 500 files, one changed file)
+    if Watcher is not None:
+        watch_dir = tempfile.TemporaryDirectory()
+        for i in range(500):
+            (Path(watch_dir.name) / f"{i:03d}.json").write_text(json.dumps(dict(artifact, id=str(i))))
+        watcher = Watcher([watch_dir.name])
+        watcher.poll()
+        target = Path(watch_dir.name) / "250.json"
+        polls = iter(range(1, 1 << 62))
+
+        def change_and_poll() -> Any:
+            n = next(polls)
+            target.write_text(json.dumps(dict(artifact, id=f"changed-{n}")))
+            os.utime(target, ns=(n, n))
+            return watcher.poll()
+
+        yield ("watch.poll_one_change_500", change_and_poll)
+
+    if JSONCodec is None:
+        return
+
+    # JSON codec per backend: one NDJSON input line, one event line, and a
+    # canonical 100-record report chunk
+    records = [{"record_type": "result", "kind": "artifact", "path": f"corpus.ndjson:{i}",
+                "artifact_id": row.get("id", "unknown"), "status": "pass", "errors": []}
+               for i, row in enumerate(rows[:100])]
+    line = json.dumps(rows[0])
+    event = {"event_type": "validator_result", "artifact_id": "bench", "schema_version": "v1.0.0",
+             "result": "failure", "error_codes": ["ERR-SCHEMA-001"], "failure_mode_ids": ["FM15"],
+             "timestamp": "2026-01-01T00:00:00.000000Z"}
+    backends = ["stdlib"] + (["orjson"] if json_backend("orjson") == "orjson" else [])
+    for backend in backends:
+        codec = JSONCodec(backend)
+        yield (f"json.loads_line.{backend}", lambda c=codec: c.loads(line))
+        yield (f"json.event_line.{backend}", lambda c=codec: c.dumps(event))
+        yield (f"json.canonical_records_100.{backend}",
+               lambda c=codec: c.canonical_dumps(records))
+
+
+def measure(fn: Callable[[], Any], repeat: int, calibrate: bool = True) -> dict[str, Any]:
+    """
+    Time `fn`, returning per-call nanoseconds (median and min over runs).
+    
+    With `calibrate`, the loop count is chosen so each run takes >= 0.2s;
+    otherwise each run is a single call.
+    """
+    timer = timeit.Timer(fn)
+    number = timer.autorange()[0] if calibrate else 1
+    runs = [t / number * 1e9 for t in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "ns_per_op": round(statistics.median(runs), 1),
+        "min_ns_per_op": round(min(runs), 1),
+        "number": number,
+        "repeat": repeat,
+    }
+
+
+def run(profile_name: str, only: Optional[str] = None) -> dict[str, Any]:
+    """Run every case in a profile and return the results document."""
+    profile = PROFILES[profile_name]
+    results: dict[str, Any] = {}
+    for name, fn in cases(profile):
+        if only and only not in name:
+            continue
+        results[name] = measure(fn, profile["repeat"], profile["calibrate"])
+        print(f"{name:48s} {results[name]['ns_per_op'] / 1000:12.2f} us/op", file=sys.stderr)
+
+    derived: dict[str, Any] = {}
+    with_sink = results.get("event_sink.with_stringio_sink")
+    without_sink = results.get("event_sink.without_sink")
+    if with_sink and without_sink:
+        derived["event_sink.overhead_ns_per_event"] = round(
+            with_sink["ns_per_op"] - without_sink["ns_per_op"], 1
+        )
+
+    per_event = results.get("event_sink.per_event_100")
+    batched = results.get("event_sink.batch_100")
+    if per_event and batched:
+        derived["event_sink.batch_speedup"] = round(
+            per_event["ns_per_op"] / batched["ns_per_op"], 2
+        )
+
+    cache_hit = results.get("cache.hit")
+    if cache_hit and without_sink:
+        derived["cache.hit_speedup"] = round(without_sink["ns_per_op"] / cache_hit["ns_per_op"], 2)
+
+    row_path = results.get("table.rows_1000.validate_artifacts")
+    column_path = results.get("table.rows_1000.validate_columns")
+    if row_path and column_path:
+        derived["table.columnar_speedup"] = round(
+            row_path["ns_per_op"] / column_path["ns_per_op"], 2
+        )
+
+    for name in ("valid", "schema_failure"):
+        generic = results.get(f"schema_step.jsonschema.{name}")
+        compiled = results.get(f"schema_step.compiled.{name}")
+        if generic and compiled:
+            derived[f"schema_step.compiled_speedup.{name}"] = round(
+                generic["ns_per_op"] / compiled["ns_per_op"], 1
+            )
+
+    for case in ("loads_line", "event_line", "canonical_records_100"):
+        stdlib = results.get(f"json.{case}.stdlib")
+        accelerated = results.get(f"json.{case}.orjson")
+        if stdlib and accelerated:
+            derived[f"json.orjson_speedup.{case}"] = round(
+                stdlib["ns_per_op"] / accelerated["ns_per_op"], 2
+            )
+
+    with_metrics = results.get("metrics.enabled")
+    if with_metrics and without_sink:
+        derived["metrics.overhead_ns_per_validation"] = round(
+            with_metrics["ns_per_op"] - without_sink["ns_per_op"], 1
+        )
+
+    return {
+        "meta": {
+            "profile": profile_name,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "unavailable": UNAVAILABLE,
+        },
+        "results": results,
+        "derived": derived,
+    }
+
+
+def compare(
+    current: Mapping[str, Any],
+    baseline: Mapping[str, Any],
+    max_regression: float,
+) -> list[str]:
+    """
+    Compare two results documents.
+    
+    Returns a list of regression messages for cases present in both whose
+    median time grew by more than `max_regression` (a fraction, 0.25 = 25%).
+    """
+    regressions = []
+    for name, result in sorted(current["results"].items()):
+        base = baseline["results"].get(name)
+        if not base or base["ns_per_op"] <= 0:
+            continue
+        ratio = result["ns_per_op"] / base["ns_per_op"]
+        if ratio > 1 + max_regression:
+            regressions.append(
+                f"{name}: {base['ns_per_op']:.0f} ns -> {result['ns_per_op']:.0f} ns "
+                f"({(ratio - 1) * 100:+.1f}%)"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Base120 benchmark suite")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--quick", action="store_const", const="quick", dest="profile",
+                       help="Smaller graph/registry sizes")
+    group.add_argument("--smoke", action="store_const", const="smoke", dest="profile",
+                       help="Minimal sizes, single repetition (for tests)")
+    parser.set_defaults(profile="full")
+    parser.add_argument("-o", "--output", help="Write results JSON to this path")
+    parser.add_argument("-k", dest="only", help="Only run cases whose name contains this")
+    parser.add_argument("--baseline", help="Baseline results JSON to compare against")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="Allowed slowdown vs baseline as a fraction (default: 0.25)")
+    args = parser.parse_args()
+
+    document = run(args.profile, args.only)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, sort_keys=True)
+            f.write("\n")
+    else:
+        json.dump(document, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+
+    if args.baseline:
+        regressions = compare(document, _load(Path(args.baseline)), args.max_regression)
+        if regressions:
+            print("Performance regressions detected:", file=sys.stderr)
+            for line in regressions:
+                print(f"  {line}", file=sys.stderr)
+            return 1
+        print("No regressions beyond threshold.", file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
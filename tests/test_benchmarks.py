@@ -0,0 +1,63 @@
+"""Smoke tests for the Base120 benchmark suite."""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+RUNNER = ROOT / "benchmarks" / "run.py"
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, str(RUNNER), "--smoke", *args],
+        capture_output=True,
+        text=True
+    )
+
+
+def test_benchmark_smoke_run_produces_results(tmp_path):
+    """The smoke profile covers every hot path and writes JSON results."""
+    output = tmp_path / "results.json"
+    result = _run("-o", str(output))
+
+    assert result.returncode == 0, result.stderr
+    document = json.loads(output.read_text())
+
+    names = set(document["results"])
+    for prefix in ("validate_artifact.", "resolve_errors.", "validate_failure_graph.",
+                   "validate_contract.", "event_sink.", "json."):
+        assert any(name.startswith(prefix) for name in names), prefix
+    assert all(r["ns_per_op"] > 0 for r in document["results"].values())
+    assert "event_sink.overhead_ns_per_event" in document["derived"]
+
+
+def test_benchmark_regression_gate(tmp_path):
+    """Cases slower than the baseline by more than the threshold fail the run."""
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({
+        "results": {"validate_artifact.valid": {"ns_per_op": 0.001}}
+    }))
+
+    result = _run("-k", "validate_artifact.valid", "--baseline", str(baseline),
+                  "-o", str(tmp_path / "results.json"))
+
+    assert result.returncode == 1
+    assert "validate_artifact.valid" in result.stderr
+
+
+def test_benchmark_skips_cases_missing_from_older_revisions(tmp_path):
+    """Cases whose modules do not import are skipped, as on an older base revision."""
+    output = tmp_path / "results.json"
+    script = (
+        "import runpy, sys\n"
+        "sys.modules['base120.cache'] = None\n"
+        f"sys.argv = ['run.py', '--smoke', '-k', 'validate_artifact.valid', '-o', {str(output)!r}]\n"
+        f"runpy.run_path({str(RUNNER)!r}, run_name='__main__')\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+    document = json.loads(output.read_text())
+    assert document["meta"]["unavailable"] == ["base120.cache.ValidationCache"]
+    assert "validate_artifact.valid" in document["results"]
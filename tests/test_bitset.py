@@ -0,0 +1,87 @@
+"""Differential tests for FM bitset resolution."""
+import json
+import random
+from pathlib import Path
+
+from base120.validators.bitset import FMTables, compile_tables
+from base120.validators.errors import resolve_errors
+from base120.validators.mappings import resolve_failure_modes
+from base120.validators.validate import validate_artifact
+
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json") as f:
+    SCHEMA = json.load(f)
+
+with open(ROOT / "registries" / "mappings.json") as f:
+    MAPPINGS = json.load(f)
+
+with open(ROOT / "registries" / "err.json") as f:
+    ERR_REGISTRY = json.load(f)["registry"]
+
+FM_IDS = [f"FM{i}" for i in range(1, 31)] + ["FM99"]
+
+
+def _random_registries(seed: int) -> tuple[dict, list]:
+    rng = random.Random(seed)
+    mappings = {"mappings": {
+        f"c{i}": rng.sample(FM_IDS, rng.randint(0, 4)) for i in range(40)
+    }}
+    registry = [
+        {"id": f"ERR-{rng.randrange(25):03d}", "fm": rng.sample(FM_IDS, rng.randint(0, 3))}
+        for _ in range(60)
+    ]
+    return mappings, registry
+
+
+def _assert_matches(mappings: dict, registry: list) -> None:
+    tables = FMTables.compile(mappings, registry)
+    for subclass in list(mappings["mappings"]) + ["unmapped"]:
+        fms = resolve_failure_modes(subclass, mappings)
+        mask, fm_ids = tables.failure_modes(subclass)
+        assert list(fm_ids) == sorted(fms)
+        assert list(tables.errors(mask)) == resolve_errors(fms, registry), subclass
+
+
+def test_bitset_matches_list_resolution_on_shipped_registries():
+    """Every mapped subclass resolves identically through the bitset tables."""
+    _assert_matches(MAPPINGS, ERR_REGISTRY)
+
+
+def test_bitset_matches_list_resolution_on_random_registries():
+    """Random registries (FM30 dominance, duplicate ERR IDs, unknown FMs) agree."""
+    for seed in range(20):
+        _assert_matches(*_random_registries(seed))
+
+
+def test_validate_artifact_uses_tables_transparently():
+    """validate_artifact results are the same with and without explicit tables."""
+    mappings, registry = _random_registries(99)
+    tables = compile_tables(mappings, registry)
+    for subclass in mappings["mappings"]:
+        artifact = {"id": subclass, "domain": "d", "class": subclass, "instance": "i",
+                    "models": []}
+        expected = resolve_errors(resolve_failure_modes(subclass, mappings), registry)
+        assert validate_artifact(artifact, SCHEMA, mappings, registry) == expected
+        assert validate_artifact(artifact, SCHEMA, mappings, registry, tables=tables) == expected
+
+
+def test_registry_mutated_in_place_is_honoured():
+    """Without explicit tables, validate_artifact reads the registries as they are now."""
+    mappings = json.loads(json.dumps(MAPPINGS))
+    subclass = next(c for c, fms in mappings["mappings"].items() if "FM30" not in fms)
+    artifact = {"id": "a", "domain": "d", "class": subclass, "instance": "i", "models": []}
+    before = validate_artifact(artifact, SCHEMA, mappings, ERR_REGISTRY)
+
+    mappings["mappings"][subclass] = ["FM30"]
+    after = validate_artifact(artifact, SCHEMA, mappings, ERR_REGISTRY)
+    assert after == resolve_errors(["FM30"], ERR_REGISTRY) != before
+
+
+def test_uncompilable_registry_falls_back():
+    """Registries with unhashable FM IDs resolve through the list path."""
+    registry = [{"id": "ERR-X", "fm": [["FM1"]]}]
+    assert compile_tables(MAPPINGS, registry) is None
+    artifact = {"id": "a", "domain": "d", "class": "example", "instance": "i", "models": []}
+    assert validate_artifact(artifact, SCHEMA, MAPPINGS, registry) == []
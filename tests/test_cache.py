@@ -0,0 +1,104 @@
+"""Tests for the Base120 validation result cache."""
+import copy
+import json
+from pathlib import Path
+from typing import Any, Mapping
+
+from base120.cache import ValidationCache
+from base120.metrics import ValidationMetrics
+from base120.validators.validate import validate_artifact, validate_artifacts
+
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json") as f:
+    SCHEMA = json.load(f)
+
+with open(ROOT / "registries" / "mappings.json") as f:
+    MAPPINGS = json.load(f)
+
+with open(ROOT / "registries" / "err.json") as f:
+    ERR_REGISTRY = json.load(f)["registry"]
+
+VALID = {"id": "ok", "domain": "core", "class": "example", "instance": "i", "models": []}
+
+
+def test_cache_hit_returns_same_result_and_still_emits_event():
+    """Hits skip validation but keep results and events identical."""
+    cache = ValidationCache()
+    events: list[Mapping[str, Any]] = []
+
+    first = validate_artifact({"id": "bad"}, SCHEMA, MAPPINGS, ERR_REGISTRY,
+                              event_sink=events.append, cache=cache)
+    second = validate_artifact({"id": "bad"}, SCHEMA, MAPPINGS, ERR_REGISTRY,
+                               event_sink=events.append, cache=cache)
+
+    assert first == second == ["ERR-SCHEMA-001"]
+    assert second is not first
+    assert len(events) == 2
+    strip = lambda e: {k: v for k, v in e.items() if k != "timestamp"}  # noqa: E731
+    assert strip(events[0]) == strip(events[1])
+    assert events[1]["failure_mode_ids"] == ["FM15"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_key_is_canonical_and_registry_sensitive():
+    """Key order does not matter; registry content does."""
+    cache = ValidationCache()
+    reordered = dict(reversed(list(VALID.items())))
+    assert cache.key(VALID, SCHEMA, MAPPINGS, ERR_REGISTRY) == \
+        cache.key(reordered, SCHEMA, MAPPINGS, ERR_REGISTRY)
+
+    changed = copy.deepcopy(MAPPINGS)
+    changed.setdefault("mappings", {})["example"] = ["FM30"]
+    assert cache.key(VALID, SCHEMA, MAPPINGS, ERR_REGISTRY) != \
+        cache.key(VALID, SCHEMA, changed, ERR_REGISTRY)
+
+    validate_artifact(VALID, SCHEMA, MAPPINGS, ERR_REGISTRY, cache=cache)
+    assert validate_artifact(VALID, SCHEMA, changed, ERR_REGISTRY, cache=cache) == \
+        validate_artifact(VALID, SCHEMA, changed, ERR_REGISTRY)
+
+
+def test_cache_lru_and_ttl_eviction():
+    """Least recently used entries go first; expired entries miss."""
+    now = [0.0]
+    cache = ValidationCache(maxsize=2, ttl=10.0, clock=lambda: now[0])
+    keys = [cache.key({"id": f"a-{i}"}, SCHEMA, MAPPINGS, ERR_REGISTRY) for i in range(3)]
+
+    cache.put(keys[0], ["E0"], [])
+    cache.put(keys[1], ["E1"], [])
+    assert cache.get(keys[0]) == (("E0",), ())
+    cache.put(keys[2], ["E2"], [])
+    assert cache.get(keys[1]) is None
+    assert len(cache) == 2
+
+    now[0] = 10.0
+    assert cache.get(keys[0]) is None
+    assert cache.stats()["evictions"] == 2
+
+
+def test_cache_with_batch_and_metrics():
+    """validate_artifacts shares the cache and records the cache_lookup stage."""
+    cache = ValidationCache()
+    metrics = ValidationMetrics()
+    batch = [VALID, {"id": "bad"}] * 5
+
+    assert validate_artifacts(batch, SCHEMA, MAPPINGS, ERR_REGISTRY,
+                              metrics=metrics, cache=cache) == \
+        [validate_artifact(a, SCHEMA, MAPPINGS, ERR_REGISTRY) for a in batch]
+
+    assert cache.stats()["hit_rate"] == 0.8
+    stages = metrics.snapshot()["stages"]["artifact"]
+    assert stages["cache_lookup"]["count"] == 10
+    assert stages["schema"]["count"] == 2
+    assert metrics.snapshot()["validations"]["artifact"] == {"failure": 5, "success": 5}
+
+
+def test_uncanonicalizable_artifact_bypasses_cache():
+    """Artifacts that are not plain JSON are validated without caching."""
+    cache = ValidationCache()
+    artifact = dict(VALID, extra={1, 2})
+    assert validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY, cache=cache) == \
+        validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY)
+    assert len(cache) == 0
@@ -0,0 +1,90 @@
+"""Tests for git-diff-aware input selection."""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from base120.changes import ChangeDetectionError, changed_files, select_changed_inputs
+
+
+ARTIFACT = {"id": "a", "domain": "core", "class": "example", "instance": "x", "models": []}
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A git repo with a small corpus, a contract and registries, committed once."""
+    for sub in ("valid", "invalid", "expected"):
+        (tmp_path / "corpus" / sub).mkdir(parents=True)
+    for name in ("one", "two", "three"):
+        (tmp_path / "corpus" / "valid" / f"{name}.json").write_text(json.dumps(dict(ARTIFACT, id=name)))
+    (tmp_path / "corpus" / "invalid" / "bad.json").write_text(json.dumps({"id": "bad"}))
+    (tmp_path / "corpus" / "expected" / "bad.errs.json").write_text('["ERR-SCHEMA-001"]')
+    (tmp_path / "registries").mkdir()
+    (tmp_path / "registries" / "mappings.json").write_text("{}")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "corpus")
+    return tmp_path
+
+
+def _names(paths):
+    return sorted(p.name for p in paths)
+
+
+def test_selects_changed_untracked_and_expected_inputs(repo):
+    """Modified, untracked and expected-output changes select their inputs."""
+    (repo / "corpus" / "valid" / "two.json").write_text(json.dumps(dict(ARTIFACT, id="2")))
+    (repo / "corpus" / "valid" / "four.json").write_text(json.dumps(dict(ARTIFACT, id="4")))
+    (repo / "corpus" / "expected" / "bad.errs.json").write_text('["ERR-SCHEMA-001"]\n')
+
+    changed = changed_files("HEAD", repo)
+    assert _names(changed) == ["bad.errs.json", "four.json", "two.json"]
+
+    selected, dependencies = select_changed_inputs([str(repo / "corpus")], changed, root=repo)
+    assert dependencies == []
+    assert _names(selected) == ["bad.json", "four.json", "two.json"]
+
+
+def test_registry_change_selects_every_input(repo):
+    """A changed registry pulls in every input as a dependent."""
+    (repo / "registries" / "mappings.json").write_text('{"mappings": {}}')
+    _git(repo, "commit", "-q", "-am", "registry bump")
+
+    changed = changed_files("HEAD~1", repo)
+    selected, dependencies = select_changed_inputs([str(repo / "corpus")], changed, root=repo)
+    assert _names(dependencies) == ["mappings.json"]
+    assert _names(selected) == ["bad.json", "one.json", "three.json", "two.json"]
+
+
+def test_unknown_revision_raises(repo):
+    with pytest.raises(ChangeDetectionError):
+        changed_files("no-such-rev", repo)
+
+
+def test_cli_changed_since_validates_only_changed_files_in_parallel(repo):
+    """--changed-since with --jobs reports only the changed inputs, in order."""
+    (repo / "corpus" / "valid" / "one.json").write_text(json.dumps(dict(ARTIFACT, models=[1])))
+    (repo / "corpus" / "valid" / "three.json").write_text(json.dumps(dict(ARTIFACT, id="3")))
+
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-artifacts", "corpus",
+         "--changed-since", "HEAD", "--jobs", "2", "-o", "-"],
+        cwd=repo, capture_output=True, text=True,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parent.parent)},
+    )
+    assert result.returncode == 1, result.stderr
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(Path(r["path"]).name, r["status"]) for r in lines[:-1]] == [
+        ("one.json", "fail"), ("three.json", "pass"),
+    ]
+    assert "2 input file(s) changed since HEAD" in result.stderr
@@ -56,6 +56,10 @@ def test_cli_validate_invalid_contract(tmp_path):
     assert report["service_name"] == "invalid-service"
     assert report["validation_status"] == "fail"
     assert len(report["errors"]) > 0
+    
+    # Structured details mirror the message list
+    assert [d["message"] for d in report["error_details"]] == report["errors"]
+    assert all("code" in d and d["path"].startswith("$") for d in report["error_details"])
 
 
 def test_cli_validate_missing_metadata(tmp_path):
@@ -136,3 +140,198 @@ def test_cli_default_output_path():
     
     # Clean up
     output_path.unlink()
+
+
+def test_cli_validate_artifacts_streams_report(tmp_path):
+    """Test bulk artifact validation over the golden corpus."""
+    output_path = tmp_path / "artifacts.ndjson"
+    corpus = ROOT / "tests" / "corpus"
+    
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-artifacts",
+         str(corpus / "valid"), str(corpus / "invalid"), "-o", str(output_path)],
+        capture_output=True,
+        text=True
+    )
+    
+    assert result.returncode == 1, "Invalid corpus entries should fail the run"
+    
+    lines = [json.loads(line) for line in output_path.read_text().splitlines()]
+    results, summary = lines[:-1], lines[-1]
+    
+    for record in results:
+        expected_path = corpus / "expected" / f"{Path(record['path']).stem}.errs.json"
+        expected = json.loads(expected_path.read_text()) if "invalid" in record["path"] else []
+        assert record["errors"] == expected
+    
+    assert summary["record_type"] == "summary"
+    assert summary["total"] == len(results)
+    assert summary["passed"] == 1
+
+
+def test_cli_validate_artifacts_reports_unreadable_files(tmp_path):
+    """Test that unreadable inputs are recorded without aborting the run."""
+    (tmp_path / "bad.json").write_text("{ invalid json }")
+    (tmp_path / "batch.json").write_text(json.dumps([
+        {"id": "a", "domain": "core", "class": "example", "instance": "x", "models": []},
+        {"id": "b", "domain": "core", "class": "example", "instance": "y", "models": []},
+    ]))
+    
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-artifacts",
+         str(tmp_path), "-o", "-", "--format", "json"],
+        capture_output=True,
+        text=True
+    )
+    
+    assert result.returncode == 1
+    report = json.loads(result.stdout)
+    statuses = [r["status"] for r in report["results"]]
+    assert statuses == ["error", "pass", "pass"]
+    assert report["summary"]["errored"] == 1
+
+
+def test_cli_validate_artifacts_jobs_match_serial_report(tmp_path):
+    """--jobs streams sharded inputs and reports exactly what --jobs 1 does."""
+    import gzip
+
+    artifact = {"id": "a", "domain": "core", "class": "example", "instance": "x", "models": []}
+    (tmp_path / "a_big.json").write_text(json.dumps(
+        [dict(artifact, id=str(i), models=[i] if i % 7 == 0 else []) for i in range(700)]
+    ))
+    lines = [json.dumps(dict(artifact, id=f"l{i}")) for i in range(600)]
+    (tmp_path / "b_lines.ndjson").write_text("\n".join(lines[:400] + ["{ bad"] + lines[400:]))
+    with gzip.open(tmp_path / "c_lines.ndjson.gz", "wt") as f:
+        f.write("\n".join(lines) + "\n\n")
+    (tmp_path / "d_utf8.ndjson").write_bytes(b"\n".join(
+        [line.encode() for line in lines[:300]] + [b'{"id": "\xff"}']
+    ))
+    (tmp_path / "e_bad.json").write_text("[1, {")
+    (tmp_path / "f_one.json").write_text(json.dumps(artifact))
+
+    outputs = []
+    for jobs in ("1", "3"):
+        result = subprocess.run(
+            [sys.executable, "-m", "base120.cli", "validate-artifacts", str(tmp_path),
+             str(tmp_path / "missing.json"), "--jobs", jobs, "-o", "-"],
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 1, result.stderr
+        outputs.append([json.loads(line) for line in result.stdout.splitlines()])
+    assert outputs[0] == outputs[1]
+    errors = [Path(r["path"]).name for r in outputs[0] if r.get("status") == "error"]
+    assert errors == ["b_lines.ndjson", "d_utf8.ndjson", "e_bad.json[0]", "e_bad.json",
+                      "missing.json"]
+
+
+def test_cli_validate_artifacts_routes_by_schema_version(tmp_path):
+    """Test that undeclared versions use --schema-version and unknown ones are errors."""
+    artifact = {"id": "a", "domain": "core", "class": "example", "instance": "x", "models": []}
+    (tmp_path / "batch.json").write_text(json.dumps([
+        artifact,
+        dict(artifact, schema_version="v1.0.0"),
+        dict(artifact, schema_version="v9.0.0"),
+    ]))
+    
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-artifacts",
+         str(tmp_path), "-o", "-", "--format", "json"],
+        capture_output=True,
+        text=True
+    )
+    
+    assert result.returncode == 1
+    report = json.loads(result.stdout)
+    assert [r["status"] for r in report["results"]] == ["pass", "pass", "error"]
+    assert "v9.0.0" in report["results"][2]["message"]
+    
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-artifacts",
+         str(tmp_path), "-o", "-", "--schema-version", "v9.0.0"],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 2
+    assert "Unknown schema version" in result.stderr
+
+
+def test_cli_pinned_version_commands_use_the_engine(tmp_path):
+    """Test that validate-stream and impact pin --schema-version and reject unknown ones."""
+    artifact = {"id": "a", "domain": "core", "class": "example", "instance": "x", "models": []}
+    line = json.dumps(dict(artifact, schema_version="v9.0.0")) + "\n" + json.dumps(artifact) + "\n"
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-stream"],
+        input=line,
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert len(result.stdout.splitlines()) == 2
+    
+    (tmp_path / "a.json").write_text(json.dumps(artifact))
+    for command in (["validate-stream"], ["impact", str(tmp_path)]):
+        result = subprocess.run(
+            [sys.executable, "-m", "base120.cli", *command, "--schema-version", "v9.0.0"],
+            input=line,
+            capture_output=True,
+            text=True
+        )
+        assert result.returncode == 2
+        assert "Unknown schema version" in result.stderr
+
+
+def test_cli_canonical_contract_report_is_reproducible(tmp_path):
+    """Test that canonical reports with a fixed timestamp are byte-identical."""
+    import os
+    
+    contract_path = EXAMPLES_PATH / "invalid-termination-edge.json"
+    env = dict(os.environ, BASE120_FIXED_TIMESTAMP="2026-01-01T00:00:00.000000Z")
+    outputs = []
+    
+    for run in range(2):
+        output_path = tmp_path / f"report{run}.json"
+        subprocess.run(
+            [sys.executable, "-m", "base120.cli", "validate-contract",
+             str(contract_path), "-o", str(output_path), "--canonical"],
+            capture_output=True,
+            text=True,
+            env=env
+        )
+        outputs.append(output_path.read_bytes())
+    
+    assert outputs[0] == outputs[1]
+    report = json.loads(outputs[0])
+    assert outputs[0] == json.dumps(
+        report, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+    assert report["timestamp"] == "2026-01-01T00:00:00.000000Z"
+
+
+def test_cli_profile_and_trace_memory(tmp_path):
+    """--profile and --trace-memory write raw stats plus stage-attributed summaries."""
+    import pstats
+    import tracemalloc
+
+    profile_path = tmp_path / "run.prof"
+    memory_path = tmp_path / "run.mem"
+    corpus = ROOT / "tests" / "corpus"
+
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli",
+         "--profile", str(profile_path), "--trace-memory", str(memory_path),
+         "--profile-top", "5",
+         "validate-artifacts", str(corpus / "valid"), "-o", str(tmp_path / "report.ndjson")],
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert pstats.Stats(str(profile_path)).total_calls > 0
+    assert tracemalloc.Snapshot.load(str(memory_path)).traces
+
+    summary = (tmp_path / "run.prof.txt").read_text()
+    assert "== Validator stages ==" in summary
+    assert "artifact   schema" in summary
+    assert "Top 5 functions by cumulative time" in summary
+    assert "peak traced:" in (tmp_path / "run.mem.txt").read_text()
@@ -0,0 +1,122 @@
+"""Tests for the pluggable JSON codec."""
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from base120.codec import JSONCodec, json_backend
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+STDLIB = JSONCodec("stdlib")
+
+
+def _orjson_codec():
+    pytest.importorskip("orjson")
+    return JSONCodec("orjson")
+
+
+def _random_float(rng):
+    return rng.choice([
+        0.0, -0.0, 1.5, 0.1, 1e-4, 9.99e-5, 1.25e-7, 5e-324, 1e16, 9999999999999998.0,
+        -2.5e22, 1.7976931348623157e308, rng.uniform(-1e6, 1e6),
+        rng.random() * 10 ** rng.randint(-12, 24),
+    ])
+
+
+def _random_value(rng, depth=0):
+    roll = rng.random()
+    if depth > 3 or roll < 0.4:
+        return rng.choice([
+            0, -7, 2 ** 63 - 1, 2 ** 64, -(10 ** 30), _random_float(rng), True, False, None,
+            "", "plain", 's"\\/\b\f\n\r\t\x00\x1f\x7f', "é☃\U0001f600", " ",
+        ])
+    if roll < 0.7:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {rng.choice(["a", "B", "é", "k" * i, "\x01"]): _random_value(rng, depth + 1)
+            for i in range(rng.randint(0, 4))}
+
+
+def test_backends_write_identical_output():
+    """Canonical, compact and indented JSON are byte-identical across backends."""
+    fast = _orjson_codec()
+    rng = random.Random(11)
+    for _ in range(2000):
+        value = _random_value(rng)
+        assert fast.canonical_dumps(value) == STDLIB.canonical_dumps(value) == json.dumps(
+            value, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+        )
+        line = fast.dumps(value)
+        assert line == STDLIB.dumps(value) == json.dumps(value, separators=(",", ":"))
+        assert fast.dumps(value, ensure_ascii=False) == STDLIB.dumps(value, ensure_ascii=False)
+        assert fast.pretty_dumps(value) == STDLIB.pretty_dumps(value) == json.dumps(
+            value, indent=2, ensure_ascii=False
+        )
+        assert (fast.pretty_dumps(value, sort_keys=True, ensure_ascii=True)
+                == json.dumps(value, indent=2, sort_keys=True))
+
+    for value in ([math.nan, math.inf], {"x": -math.inf}, {1: "a", 2.5: "b", 10: "c"},
+                  "\ud800"):
+        assert fast.canonical_dumps(value) == STDLIB.canonical_dumps(value)
+        assert fast.dumps(value) == STDLIB.dumps(value)
+        assert fast.pretty_dumps(value) == STDLIB.pretty_dumps(value)
+    with pytest.raises(TypeError):
+        fast.dumps({"when": object()})
+
+
+@pytest.mark.parametrize("text", [
+    '{"n": 12345678901234567890}', "[-99999999999999999999.5]", "[1e400, -1e400]",
+    "[NaN, Infinity]", '"\\ud800"', '{"a": 1, "a": 2}', '"é\\u00e9"', "  [0.1]  ",
+])
+def test_loads_matches_json(text):
+    """Values json accepts parse the same with either backend, from str or bytes."""
+    fast = _orjson_codec()
+    expected = json.loads(text)
+    for data in (text, text.encode("utf-8")):
+        result = fast.loads(data)
+        assert repr(result) == repr(expected)
+
+
+@pytest.mark.parametrize("text", ["", "{", "[1,]", '{"a" 1}', "[1] x", "tru"])
+def test_loads_errors_match_json(text):
+    """Malformed input raises json's JSONDecodeError with the same message."""
+    fast = _orjson_codec()
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    with pytest.raises(json.JSONDecodeError) as raised:
+        fast.loads(text)
+    assert str(raised.value) == str(expected.value)
+
+
+def test_json_backend_resolution(monkeypatch):
+    """BASE120_JSON_BACKEND selects the backend; unknown names are rejected."""
+    monkeypatch.setenv("BASE120_JSON_BACKEND", "stdlib")
+    assert json_backend() == "stdlib"
+    assert JSONCodec().backend == "stdlib"
+    assert json_backend("auto") in ("stdlib", "orjson")
+    with pytest.raises(ValueError, match="Unknown JSON backend"):
+        json_backend("simdjson")
+
+
+@pytest.mark.parametrize("options", [["--canonical"], []])
+def test_cli_report_is_identical_across_backends(options):
+    """Canonical and default reports do not depend on the backend."""
+    _orjson_codec()
+    outputs = []
+    for backend in ("stdlib", "orjson"):
+        result = subprocess.run(
+            [sys.executable, "-m", "base120.cli", "validate-artifacts",
+             str(REPO_ROOT / "tests" / "corpus"), "-o", "-", *options],
+            capture_output=True,
+            env={**os.environ, "BASE120_JSON_BACKEND": backend, "BASE120_FIXED_TIMESTAMP": "t"}
+        )
+        assert result.returncode in (0, 1), result.stderr
+        outputs.append(result.stdout)
+    assert outputs[0] == outputs[1]
+    assert outputs[0].count(b"\n") > 1
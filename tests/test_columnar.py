@@ -0,0 +1,151 @@
+"""Differential tests for columnar batch validation."""
+import json
+from pathlib import Path
+from typing import Any, Mapping
+
+import pytest
+
+from base120.metrics import ValidationMetrics
+from base120.synth import iter_artifacts
+from base120.validators.columnar import validate_columns
+from base120.validators.validate import validate_artifact
+
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json") as f:
+    SCHEMA = json.load(f)
+
+with open(ROOT / "registries" / "mappings.json") as f:
+    MAPPINGS = json.load(f)
+
+with open(ROOT / "registries" / "err.json") as f:
+    ERR_REGISTRY = json.load(f)["registry"]
+
+
+def _to_columns(artifacts: list[dict[str, Any]]) -> dict[str, list[Any]]:
+    names = sorted({name for artifact in artifacts for name in artifact})
+    return {name: [artifact.get(name) for artifact in artifacts] for name in names}
+
+
+def _corpus(count: int = 600) -> list[dict[str, Any]]:
+    return list(iter_artifacts(count, MAPPINGS, seed=7, schema_failure_ratio=0.3))
+
+
+def test_columnar_matches_validate_artifact():
+    """Column checks agree with the jsonschema path on every row."""
+    artifacts = _corpus()
+    result = validate_columns(_to_columns(artifacts), SCHEMA, MAPPINGS, ERR_REGISTRY)
+
+    assert result.to_lists() == [
+        validate_artifact(a, SCHEMA, MAPPINGS, ERR_REGISTRY) for a in artifacts
+    ]
+    assert result.fallback_rows == 0
+    assert any(not ok for ok in result.passed)
+    assert len(result) == len(artifacts)
+
+
+def test_columnar_falls_back_for_unsupported_schema():
+    """Schemas beyond column checks are validated per row with jsonschema."""
+    schema = dict(SCHEMA, properties=dict(SCHEMA["properties"], id={"type": "string",
+                                                                     "pattern": "^synthetic-"}))
+    artifacts = _corpus(50) + [{"id": "other", "domain": "d", "class": "example",
+                                "instance": "i", "models": []}]
+    result = validate_columns(_to_columns(artifacts), schema, MAPPINGS, ERR_REGISTRY)
+
+    assert result.fallback_rows == len(artifacts)
+    assert result.to_lists() == [
+        validate_artifact(a, schema, MAPPINGS, ERR_REGISTRY) for a in artifacts
+    ]
+    assert result.to_lists()[-1] == ["ERR-SCHEMA-001"]
+
+
+def test_columnar_missing_required_column_and_tuple_cells():
+    """A missing required column fails every row; tuple list cells are arrays."""
+    columns = {"id": ["a", "b"], "domain": ["d", "d"], "class": ["example", "example"],
+               "instance": ["i", "i"]}
+    assert validate_columns(columns, SCHEMA, MAPPINGS, ERR_REGISTRY).to_lists() == [
+        ["ERR-SCHEMA-001"], ["ERR-SCHEMA-001"]
+    ]
+
+    columns["models"] = [("FM1",), ("FM1", 2)]
+    assert validate_columns(columns, SCHEMA, MAPPINGS, ERR_REGISTRY).passed == [True, False]
+
+    with pytest.raises(ValueError):
+        validate_columns({"id": ["a"], "class": []}, SCHEMA, MAPPINGS, ERR_REGISTRY)
+
+
+def test_columnar_events_and_metrics():
+    """Events match the per-row path; metrics count every row."""
+    artifacts = _corpus(40)
+    events: list[Mapping[str, Any]] = []
+    metrics = ValidationMetrics()
+    validate_columns(_to_columns(artifacts), SCHEMA, MAPPINGS, ERR_REGISTRY,
+                     event_sink=events.append, metrics=metrics)
+
+    expected: list[Mapping[str, Any]] = []
+    for artifact in artifacts:
+        validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=expected.append)
+
+    strip = lambda e: {k: v for k, v in e.items() if k != "timestamp"}  # noqa: E731
+    assert [strip(e) for e in events] == [strip(e) for e in expected]
+    assert sum(metrics.snapshot()["validations"]["columnar"].values()) == 40
+
+
+def test_columnar_numpy_columns():
+    """NumPy unicode and object columns are accepted when NumPy is installed."""
+    np = pytest.importorskip("numpy")
+    artifacts = _corpus(100)
+    columns: dict[str, Any] = _to_columns(artifacts)
+    columns["domain"] = np.array([a.get("domain") for a in artifacts], dtype=object)
+    columns["models"] = np.array([np.array(a["models"]) if isinstance(a.get("models"), list)
+                                  and all(isinstance(m, str) for m in a["models"])
+                                  else a.get("models") for a in artifacts], dtype=object)
+    result = validate_columns(columns, SCHEMA, MAPPINGS, ERR_REGISTRY)
+    assert result.to_lists() == [
+        validate_artifact(a, SCHEMA, MAPPINGS, ERR_REGISTRY) for a in artifacts
+    ]
+
+
+def _random_cell(rng, np):
+    return rng.choice([
+        None, "x", "example", 7, 1.5, True, {"a": "b"}, [], ["FM1", "FM2"], ["FM1", 2],
+        ("FM1",), [["FM1"]], np.str_("example"), np.int64(3), np.array(["FM1", "FM2"]),
+        np.array([1, 2]), np.array([["a"], ["b"]]), type("Tag", (str,), {})("example"),
+    ])
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_columnar_checks_match_jsonschema_on_mixed_cells(monkeypatch, vectorized):
+    """Array and row-loop checks agree with jsonschema on mixed cell types and enums."""
+    np = pytest.importorskip("numpy")
+    import random
+
+    from base120.validators import columnar
+
+    if not vectorized:
+        monkeypatch.setattr(columnar, "np", None)
+    schema = dict(SCHEMA, properties=dict(
+        SCHEMA["properties"], domain={"enum": ["core", "example"]},
+        instance={"type": "string", "enum": ["x", "example"]}, extra={"type": "array"},
+    ))
+    rng = random.Random(5)
+    valid = {"id": ["x", np.str_("y")], "domain": ["core"], "class": ["example"],
+             "instance": ["x"], "models": [["FM1"], ("FM1",), np.array(["FM1"])],
+             "extra": [None, []]}
+    rows = [{name: rng.choice(options) if rng.random() < 0.7 else _random_cell(rng, np)
+             for name, options in valid.items()}
+            for _ in range(400)]
+    columns: dict[str, Any] = {name: [row[name] for row in rows] for name in rows[0]}
+    columns["class"] = np.array(["example"] * len(rows))
+    expected = []
+    for i, row in enumerate(rows):
+        artifact = {name: columnar._normalize(value) for name, value in row.items()
+                    if value is not None}
+        artifact["class"] = "example"
+        expected.append(validate_artifact(artifact, schema, MAPPINGS, ERR_REGISTRY))
+
+    result = validate_columns(columns, schema, MAPPINGS, ERR_REGISTRY)
+    assert result.fallback_rows == 0
+    assert result.to_lists() == expected
+    assert 0 < result.passed.count(True) < len(rows)
@@ -0,0 +1,156 @@
+"""Differential tests: compiled schema predicates vs jsonschema."""
+import copy
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+from jsonschema import Draft202012Validator
+
+from base120.synth import iter_artifacts, iter_contracts
+from base120.validators.compiler import compile_schema, compiled_validator
+
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json") as f:
+    SCHEMA = json.load(f)
+
+with open(ROOT / "schemas" / "v1.0.0" / "contract.schema.json") as f:
+    CONTRACT_SCHEMA = json.load(f)
+
+with open(ROOT / "registries" / "mappings.json") as f:
+    MAPPINGS = json.load(f)
+
+
+def _random_value(rng: random.Random, depth: int = 0) -> Any:
+    kind = rng.randrange(9 if depth < 2 else 7)
+    if kind == 0:
+        return None
+    if kind == 1:
+        return rng.choice([True, False])
+    if kind == 2:
+        return rng.choice([0, 1, -3, 10, 11, 2**40])
+    if kind == 3:
+        return rng.choice([0.0, 1.0, 1.5, -0.5, 10.0, float("inf")])
+    if kind in (4, 5, 6):
+        return rng.choice(["", "a", "FM1", "v1.0.0", "v10.2.3", "FM", "ünï", "2026-01-01T00:00:00Z"])
+    if kind == 7:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randrange(4))]
+    return {rng.choice(["id", "name", "x", "models"]): _random_value(rng, depth + 1)
+            for _ in range(rng.randrange(3))}
+
+
+def _mutate(document: Any, rng: random.Random) -> Any:
+    """Replace, delete or add one value somewhere in a copy of `document`."""
+    document = copy.deepcopy(document)
+    target = document
+    for _ in range(rng.randrange(5)):
+        if isinstance(target, dict) and target:
+            child = target[rng.choice(sorted(target))]
+        elif isinstance(target, list) and target:
+            child = rng.choice(target)
+        else:
+            break
+        if not isinstance(child, (dict, list)):
+            break
+        target = child
+    if isinstance(target, dict) and target:
+        key = rng.choice(sorted(target))
+        action = rng.randrange(3)
+        if action == 0:
+            del target[key]
+        elif action == 1:
+            target[key] = _random_value(rng)
+        else:
+            target[f"extra_{rng.randrange(3)}"] = _random_value(rng)
+    elif isinstance(target, list) and target:
+        target[rng.randrange(len(target))] = _random_value(rng)
+    return document
+
+
+def _assert_agrees(schema: Any, instances: list[Any]) -> list[bool]:
+    predicate = compile_schema(schema)
+    assert predicate is not None
+    reference = Draft202012Validator(schema)
+    outcomes = []
+    for instance in instances:
+        expected = reference.is_valid(instance)
+        assert predicate(instance) == expected, (schema, instance)
+        outcomes.append(expected)
+    return outcomes
+
+
+def test_artifact_schema_matches_jsonschema():
+    """Synthetic, mutated and random artifacts get identical pass/fail outcomes."""
+    rng = random.Random(1)
+    corpus = list(iter_artifacts(500, MAPPINGS, seed=3, schema_failure_ratio=0.3))
+    instances = corpus + [_mutate(a, rng) for a in corpus]
+    instances += [_random_value(rng) for _ in range(300)]
+    outcomes = _assert_agrees(SCHEMA, instances)
+    assert True in outcomes and False in outcomes
+
+
+def test_contract_schema_matches_jsonschema():
+    """Example, synthetic and mutated contracts get identical pass/fail outcomes."""
+    rng = random.Random(2)
+    contracts = [json.loads(p.read_text())
+                 for p in sorted((ROOT / "examples" / "contracts").glob("*.json"))]
+    contracts += list(iter_contracts(20, graph_size=6, seed=4))
+    instances = contracts + [_mutate(c, rng) for c in contracts for _ in range(40)]
+    outcomes = _assert_agrees(CONTRACT_SCHEMA, instances)
+    assert True in outcomes and False in outcomes
+
+
+@pytest.mark.parametrize("schema", [
+    {"type": "integer"},
+    {"type": "number", "minimum": 0, "exclusiveMaximum": 10},
+    {"type": ["string", "null"], "minLength": 1, "maxLength": 3},
+    {"pattern": "^v[0-9]+"},
+    {"enum": ["a", "FM1"]},
+    {"type": "array", "minItems": 1, "maxItems": 2, "items": {"type": "boolean"}},
+    {"type": "object", "properties": {"id": {"type": "string"}}, "additionalProperties": False},
+    {"properties": {"id": True}, "additionalProperties": {"type": "integer"}},
+    {"items": False},
+    True,
+    False,
+])
+def test_keywords_match_jsonschema(schema):
+    """Each supported keyword follows jsonschema semantics (bools, 1.0, ...)."""
+    rng = random.Random(5)
+    instances = [_random_value(rng) for _ in range(400)]
+    instances += [True, 1, 1.0, [], {}, {"id": "x", "x": 1}, {"id": 1}]
+    _assert_agrees(schema, instances)
+
+
+@pytest.mark.parametrize("schema", [
+    {"$ref": "#/$defs/x", "$defs": {"x": {}}},
+    {"allOf": [{"type": "string"}]},
+    {"enum": [1, 2]},
+    {"type": "array", "uniqueItems": True},
+    {"type": "custom"},
+])
+def test_unsupported_schemas_fall_back(schema):
+    """Schemas with unsupported keywords are not compiled."""
+    assert compile_schema(schema) is None
+    assert compiled_validator(schema) is None
+
+
+def test_base_schemas_compile_and_cache():
+    """Both shipped schemas use only compiled keywords; compilation is cached."""
+    assert compiled_validator(SCHEMA) is compiled_validator(SCHEMA)
+    assert compiled_validator(CONTRACT_SCHEMA) is not None
+
+
+def test_schema_mutated_in_place_is_recompiled():
+    """The compiled-schema cache follows schema content, not object identity."""
+    from base120.validators.validate import validate_artifact
+
+    schema = copy.deepcopy(SCHEMA)
+    artifact = {"id": "a", "domain": "d", "class": "example", "instance": "i", "models": []}
+    assert validate_artifact(artifact, schema, MAPPINGS, []) == []
+    assert compiled_validator(copy.deepcopy(SCHEMA)) is compiled_validator(schema)
+
+    schema["required"].append("owner")
+    assert validate_artifact(artifact, schema, MAPPINGS, []) == ["ERR-SCHEMA-001"]
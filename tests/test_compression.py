@@ -0,0 +1,99 @@
+"""Tests for compressed inputs, reports and the prefetch reader."""
+import bz2
+import gzip
+import io
+import json
+import lzma
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from base120.compression import PrefetchReader, compression_for, open_input, open_output
+from base120.inputs import is_expected_output, iter_documents, iter_input_paths
+from base120.watch import Watcher
+
+
+ARTIFACT = {"id": "a", "domain": "core", "class": "example", "instance": "x", "models": []}
+
+
+def _write_corpus(directory):
+    with gzip.open(directory / "batch.json.gz", "wt", encoding="utf-8") as f:
+        json.dump([ARTIFACT, {**ARTIFACT, "id": "b"}], f)
+    with bz2.open(directory / "lines.ndjson.bz2", "wt", encoding="utf-8") as f:
+        f.write(json.dumps(ARTIFACT) + "\n\n" + json.dumps({"id": "c"}) + "\n")
+    with lzma.open(directory / "single.json.xz", "wt", encoding="utf-8") as f:
+        json.dump({**ARTIFACT, "id": "d"}, f)
+    (directory / "notes.txt.gz").write_bytes(gzip.compress(b"ignored"))
+
+
+def test_compressed_inputs_read_like_plain_files(tmp_path):
+    """Inputs are found and split by their name without the compression extension."""
+    _write_corpus(tmp_path)
+    paths = list(iter_input_paths([str(tmp_path)]))
+    assert [p.name for p in paths] == ["batch.json.gz", "lines.ndjson.bz2", "single.json.xz"]
+    locations = [loc for path in paths for loc, _ in iter_documents(path)]
+    assert [loc.rsplit("/", 1)[1] for loc in locations] == [
+        "batch.json.gz[0]", "batch.json.gz[1]", "lines.ndjson.bz2:1",
+        "lines.ndjson.bz2:3", "single.json.xz",
+    ]
+    assert is_expected_output(tmp_path / "artifacts.expected.ndjson.gz")
+    assert compression_for("report.json", "xz") == "xz"
+    with pytest.raises(ValueError):
+        compression_for("report.json", "zip")
+
+    records = Watcher([str(tmp_path)]).poll()
+    assert [r["status"] for r in records] == ["pass", "pass", "pass", "fail", "pass"]
+
+
+def test_prefetch_reader_surfaces_errors_and_stops_on_close(tmp_path):
+    """Truncated data raises OSError in the reader; closing early stops the thread."""
+    path = tmp_path / "big.ndjson.gz"
+    path.write_bytes(gzip.compress(b"".join(b'{"n": %d}\n' % i for i in range(100_000)))[:-64])
+    with pytest.raises(OSError, match="Compressed file ended"):
+        with open_input(path) as f:
+            for _ in f:
+                pass
+
+    class Endless(io.RawIOBase):
+        def readable(self):
+            return True
+
+        def readinto(self, buffer):
+            buffer[:] = b"x" * len(buffer)
+            return len(buffer)
+
+    before = threading.active_count()
+    reader = PrefetchReader(Endless(), chunk_size=1024, depth=2)
+    assert reader.read(10) == b"x" * 10
+    reader.close()
+    assert threading.active_count() == before
+
+
+def test_cli_compressed_reports(tmp_path):
+    """Reports are compressed by extension or --compression, including to stdout."""
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    _write_corpus(corpus)
+    report = tmp_path / "report.ndjson.gz"
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-artifacts", str(corpus),
+         "-o", str(report), "--canonical"],
+        capture_output=True
+    )
+    assert result.returncode == 1, result.stderr
+    plain = gzip.decompress(report.read_bytes())
+    assert json.loads(plain.splitlines()[-1])["total"] == 5
+
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-artifacts", str(corpus),
+         "-o", "-", "--compression", "xz", "--canonical"],
+        capture_output=True
+    )
+    assert result.returncode == 1
+    assert lzma.decompress(result.stdout) == plain
+
+    with open_output(str(tmp_path / "events.ndjson.bz2")) as f:
+        f.write("{}\n")
+    assert bz2.decompress((tmp_path / "events.ndjson.bz2").read_bytes()) == b"{}\n"
@@ -0,0 +1,89 @@
+"""Tests for the Base120 mirror conformance runner."""
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from base120.conformance import CANONICAL_COMMAND, run_conformance
+
+ROOT = Path(__file__).parent.parent
+CORPUS = ROOT / "tests" / "corpus"
+
+
+def test_validate_stream_matches_expected_corpus():
+    """validate-stream emits one canonical error array per input line."""
+    lines = []
+    expected = []
+    for path in sorted((CORPUS / "invalid").glob("*.json")):
+        lines.append(json.dumps(json.loads(path.read_text())))
+        expected.append(json.loads((CORPUS / "expected" / f"{path.stem}.errs.json").read_text()))
+
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-stream"],
+        input="\n".join(lines) + "\n",
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines() == [
+        json.dumps(e, separators=(",", ":")) for e in expected
+    ]
+
+
+def test_canonical_mirror_is_conformant():
+    """The canonical validator used as a mirror conforms to itself."""
+    report = run_conformance(
+        [str(CORPUS)], {"self": list(CANONICAL_COMMAND)}, jobs=2, shard_size=2
+    )
+
+    assert report["conformant"]
+    assert report["artifacts"] == 4
+    assert report["shards"] == 2
+    assert [i["status"] for i in report["implementations"]] == ["conformant", "conformant"]
+
+
+def test_divergent_and_broken_mirrors_are_reported(tmp_path):
+    """Divergent output and crashing mirrors fail certification."""
+    lenient = tmp_path / "lenient.py"
+    lenient.write_text("import sys\nfor _ in sys.stdin:\n    print('[]')\n")
+    broken = tmp_path / "broken.py"
+    broken.write_text("import sys\nsys.exit(2)\n")
+
+    report = run_conformance(
+        [str(CORPUS)],
+        {"lenient": [sys.executable, str(lenient)], "broken": [sys.executable, str(broken)]},
+        jobs=3,
+    )
+    results = {i["name"]: i for i in report["implementations"]}
+
+    assert not report["conformant"]
+    assert results["lenient"]["status"] == "divergent"
+    assert results["lenient"]["divergences"] == 3
+    first = results["lenient"]["first_divergence"]
+    assert first["location"].endswith("invalid-governance-unrecoverable.json")
+    assert first["canonical"] == '["ERR-GOV-004"]'
+    assert first["mirror"] == "[]"
+    assert results["broken"]["status"] == "error"
+
+
+def test_unreadable_corpus_files_fail_certification(tmp_path):
+    """Corpus files that cannot be parsed are reported instead of aborting the run."""
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "good.json").write_text(json.dumps({"id": "a"}))
+    (corpus / "truncated.json").write_text('{"id":"a",')
+
+    report = run_conformance([str(corpus)], {}, jobs=1)
+    assert report["artifacts"] == 1
+    assert not report["conformant"]
+    assert [r["path"] for r in report["unreadable"]] == [str(corpus / "truncated.json")]
+    assert report["unreadable"][0]["message"].startswith("Invalid JSON:")
+
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "conformance", str(corpus)],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 1, result.stderr
+    assert "truncated.json: Invalid JSON" in result.stdout
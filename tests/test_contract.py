@@ -423,3 +423,93 @@ def test_warning_unconstrained_models():
     
     assert is_valid  # Should still be valid
     assert any("models" in warn.lower() and "constraint" in warn.lower() for warn in warnings)
+
+
+def test_structured_errors_carry_code_and_path():
+    """Test that structured errors expose code, JSON path and graph ids."""
+    from base120.contract.validate import check_failure_graph
+    from base120.contract.errors import GRAPH_UNKNOWN_EDGE_NODE
+
+    failure_graph = {
+        "nodes": [
+            {"id": "FM1", "name": "Test", "max_retries": 0, "action": "terminate"}
+        ],
+        "edges": [
+            {"from": "FM1", "to": "FM99", "condition": "test"}
+        ]
+    }
+
+    errors = check_failure_graph(failure_graph)
+    unknown = [e for e in errors if e.code == GRAPH_UNKNOWN_EDGE_NODE]
+
+    assert len(unknown) == 1
+    assert unknown[0].to_dict() == {
+        "code": "graph.unknown_edge_node",
+        "path": "$.failure_graph.edges[0].to",
+        "message": "Edge 0: 'to' node 'FM99' does not exist",
+        "node_id": "FM99",
+        "edge_index": 0,
+    }
+    # Dangling edges suppress cycle detection without inspecting messages
+    assert not any(e.code == "graph.cycle" for e in errors)
+
+
+def test_structured_errors_match_string_messages():
+    """Test that validate_contract messages are rendered from structured errors."""
+    from base120.contract.validate import check_contract
+
+    for name in ("invalid-missing-metadata.json", "invalid-termination-edge.json"):
+        with open(EXAMPLES_PATH / name) as f:
+            contract = json.load(f)
+
+        _, structured, _ = check_contract(contract, CONTRACT_SCHEMA)
+        _, messages, _ = validate_contract(contract, CONTRACT_SCHEMA)
+
+        assert messages == [e.message for e in structured]
+        assert all(e.code.split(".")[0] in ("schema", "graph", "metadata") for e in structured)
+
+
+def test_cycle_error_records_path():
+    """Test that cycle errors carry the cycle as node ids."""
+    from base120.contract.validate import check_failure_graph
+
+    failure_graph = {
+        "nodes": [
+            {"id": "FM1", "name": "Node1", "max_retries": 3, "action": "escalate"},
+            {"id": "FM2", "name": "Node2", "max_retries": 3, "action": "escalate"},
+            {"id": "FM30", "name": "Termination", "max_retries": 0, "action": "terminate"}
+        ],
+        "edges": [
+            {"from": "FM1", "to": "FM2", "condition": "retry_exceeded"},
+            {"from": "FM2", "to": "FM1", "condition": "back_to_start"}
+        ]
+    }
+
+    cycles = [e for e in check_failure_graph(failure_graph) if e.code == "graph.cycle"]
+
+    assert len(cycles) == 1
+    assert cycles[0].params["cycle"][0] == cycles[0].params["cycle"][-1]
+    assert cycles[0].message.startswith("Failure graph contains a cycle: ")
+
+
+def test_cycle_detection_deep_graph():
+    """Test that cycle detection handles chains deeper than the recursion limit."""
+    import sys
+
+    size = sys.getrecursionlimit() * 2
+    nodes = [
+        {"id": f"FM{i}", "name": f"Node{i}", "max_retries": 1, "action": "escalate"}
+        for i in range(size)
+    ]
+    nodes[-1]["action"] = "terminate"
+    edges = [
+        {"from": f"FM{i}", "to": f"FM{i + 1}", "condition": "escalate"}
+        for i in range(size - 1)
+    ]
+
+    assert validate_failure_graph({"nodes": nodes, "edges": edges}) == []
+
+    edges.append({"from": f"FM{size - 2}", "to": "FM0", "condition": "loop"})
+    errors = validate_failure_graph({"nodes": nodes, "edges": edges})
+
+    assert any(err.startswith("Failure graph contains a cycle: FM0 -> FM1") for err in errors)
@@ -0,0 +1,88 @@
+"""Tests for the determinism verifier."""
+import subprocess
+import sys
+from pathlib import Path
+
+from base120.determinism import check_determinism
+
+
+ROOT = Path(__file__).parent.parent
+CORPUS = [str(ROOT / "tests" / "corpus"), str(ROOT / "examples" / "contracts")]
+
+# Stand-in pass whose second line depends on the hash seed
+SEED_DEPENDENT = (
+    "import json, sys\n"
+    "print(json.dumps(['a', {'ok': True}, []]))\n"
+    "print(json.dumps(['b', {'hash': hash('b')}, []]))\n"
+    "print(json.dumps(['c', {'ok': True}, []]))\n"
+)
+
+
+def test_golden_corpus_is_deterministic():
+    """Passes under different hash seeds agree on every corpus document."""
+    report = check_determinism(CORPUS, passes=3)
+    assert report["deterministic"], report
+    assert report["documents"] == 7
+    assert report["seeds"] == ["0", "1", "2"]
+    assert len(set(report["digests"].values())) == 1
+    assert "first_divergence" not in report
+
+
+def test_reports_first_divergent_document():
+    """Seed-dependent output is caught and located."""
+    report = check_determinism(
+        ["unused"], seeds=["1", "2"], pass_command=[sys.executable, "-c", SEED_DEPENDENT]
+    )
+    assert not report["deterministic"]
+    assert report["documents"] == 3
+    assert report["divergences"] == 1
+    divergence = report["first_divergence"]
+    assert divergence["index"] == 1
+    assert divergence["location"] == "b"
+    assert set(divergence["outputs_by_seed"]) == {"1", "2"}
+
+
+def test_failing_pass_is_not_deterministic():
+    """A pass that exits non-zero fails the check even with identical output."""
+    report = check_determinism(
+        ["unused"], passes=2, pass_command=[sys.executable, "-c", "import sys; sys.exit(3)"]
+    )
+    assert not report["deterministic"]
+    assert report["documents"] == 0
+    assert set(report["errors"]) == {"0", "1"}
+
+
+def test_hung_pass_times_out():
+    """A pass that stops writing is killed at the deadline and reported."""
+    hang = "import sys, time; print('[\"a\", {}, []]'); sys.stdout.flush(); time.sleep(60)"
+    report = check_determinism(
+        ["unused"], passes=2, timeout=0.5, pass_command=[sys.executable, "-c", hang]
+    )
+    assert not report["deterministic"]
+    assert report["documents"] == 1
+    assert report["errors"] == {"0": "timed out after 0.5s", "1": "timed out after 0.5s"}
+    assert report["wall_seconds"] < 30
+
+
+def test_cli_rejects_passes_with_seeds():
+    """--seeds fixes the number of passes, so --passes alongside it is an error."""
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "determinism-check", *CORPUS,
+         "--passes", "3", "--seeds", "1,2"],
+        capture_output=True, text=True
+    )
+    assert result.returncode == 2
+    assert "--passes and --seeds cannot be combined" in result.stderr
+
+
+def test_cli_determinism_check(tmp_path):
+    """The CLI exits 0 for the golden corpus and writes a report."""
+    output = tmp_path / "determinism.json"
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "determinism-check", *CORPUS,
+         "--passes", "2", "-o", str(output)],
+        capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Determinism check PASSED" in result.stdout
+    assert output.exists()
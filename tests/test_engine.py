@@ -0,0 +1,115 @@
+"""Tests for the multi-version registry engine."""
+import io
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from base120.engine import RegistryEngine, UnknownVersionError, iter_file_records
+from base120.observability import create_event_sink
+
+
+ROOT = Path(__file__).parent.parent
+
+
+@pytest.fixture
+def root(tmp_path):
+    """Repository layout with v1.0.0 and a v1.1.0 that also requires `owner`."""
+    shutil.copytree(ROOT / "schemas", tmp_path / "schemas")
+    shutil.copytree(ROOT / "registries", tmp_path / "registries")
+    v11 = tmp_path / "schemas" / "v1.1.0"
+    v11.mkdir()
+    schema = json.loads((ROOT / "schemas" / "v1.0.0" / "artifact.schema.json").read_text())
+    schema["required"].append("owner")
+    schema["properties"]["owner"] = {"type": "string"}
+    (v11 / "artifact.schema.json").write_text(json.dumps(schema))
+    return tmp_path
+
+
+def _artifact(**fields):
+    artifact = {"id": "a", "domain": "core", "class": "example", "instance": "x", "models": []}
+    artifact.update(fields)
+    return artifact
+
+
+def test_routes_artifacts_by_declared_version(root):
+    """Each artifact is validated against the version it declares."""
+    engine = RegistryEngine(root)
+    assert engine.versions == ("v1.0.0", "v1.1.0")
+
+    assert engine.validate(_artifact()) == []
+    assert engine.validate(_artifact(schema_version="v1.0.0")) == []
+    assert engine.validate(_artifact(schema_version="v1.1.0")) == ["ERR-SCHEMA-001"]
+    assert engine.validate(_artifact(schema_version="v1.1.0", owner="team")) == []
+
+    with pytest.raises(UnknownVersionError, match="v9.9.9"):
+        engine.validate(_artifact(schema_version="v9.9.9"))
+
+
+def test_versions_share_identical_registries(root):
+    """Versions without their own registries share parsed documents and tables."""
+    engine = RegistryEngine(root)
+    v10, v11 = engine.get("v1.0.0"), engine.get("v1.1.0")
+    assert v10.schema is not v11.schema
+    assert v10.mappings is v11.mappings
+    assert v10.err_registry is v11.err_registry
+    assert v11.contract_schema is None
+    assert engine.get("v1.1.0") is v11
+    assert v10.tables is v11.tables is not None
+
+
+def test_versioned_registries_override_shared_ones(root):
+    """registries/<version>/ replaces the shared registries for that version."""
+    versioned = root / "registries" / "v1.1.0"
+    versioned.mkdir()
+    mappings = json.loads((root / "registries" / "mappings.json").read_text())
+    mappings["mappings"]["example"] = []
+    (versioned / "mappings.json").write_text(json.dumps(mappings))
+
+    engine = RegistryEngine(root)
+    assert engine.get("v1.0.0").mappings is not engine.get("v1.1.0").mappings
+    assert engine.get("v1.0.0").err_registry is engine.get("v1.1.0").err_registry
+
+
+def test_validate_many_keeps_order_and_reports_versions(root):
+    """Mixed batches return results in input order; events carry their version."""
+    engine = RegistryEngine(root)
+    artifacts = [
+        _artifact(id="1", schema_version="v1.1.0"),
+        _artifact(id="2"),
+        _artifact(id="3", schema_version="v1.1.0", owner="team"),
+        {"id": "4", "schema_version": "v1.0.0"},
+    ]
+    output = io.StringIO()
+    results = engine.validate_many(artifacts, event_sink=create_event_sink(output))
+
+    assert results == [engine.validate(a) for a in artifacts]
+    assert results == [["ERR-SCHEMA-001"], [], [], ["ERR-SCHEMA-001"]]
+    events = {e["artifact_id"]: e for e in map(json.loads, output.getvalue().splitlines())}
+    assert {k: e["schema_version"] for k, e in events.items()} == {
+        "1": "v1.1.0", "2": "v1.0.0", "3": "v1.1.0", "4": "v1.0.0",
+    }
+
+    with pytest.raises(UnknownVersionError):
+        engine.validate_many([_artifact(), _artifact(schema_version=["v1.0.0"])])
+
+
+def test_contracts_route_to_declared_contract_schema(root):
+    """Contracts use their version's contract schema, else the default one."""
+    engine = RegistryEngine(root)
+    assert engine.route_contract({"contract_version": "v1.0.0"}).version == "v1.0.0"
+    assert engine.route_contract({"contract_version": "v1.1.0"}).version == "v1.0.0"
+
+    with pytest.raises(UnknownVersionError):
+        RegistryEngine(root, default_version="v2.0.0")
+
+
+def test_invalid_utf8_input_is_an_error_record(tmp_path):
+    """Undecodable bytes become an unreadable-file record instead of an exception."""
+    for name, data in (("batch.json", b'[{"id":"\xff"}]'), ("lines.ndjson", b'{"id":"a"}\n\xff\n')):
+        path = tmp_path / name
+        path.write_bytes(data)
+        records = list(iter_file_records(path, RegistryEngine()))
+        assert records[-1]["status"] == "error"
+        assert records[-1]["message"].startswith("Failed to read: 'utf-8' codec")
@@ -0,0 +1,134 @@
+"""Tests for registry-change impact analysis."""
+import copy
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from base120.impact import SubclassIndex, analyze_impact
+from base120.synth import iter_artifacts
+from base120.validators.validate import validate_artifact
+
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json") as f:
+    SCHEMA = json.load(f)
+
+with open(ROOT / "registries" / "mappings.json") as f:
+    MAPPINGS = json.load(f)
+
+with open(ROOT / "registries" / "err.json") as f:
+    ERR_DOCUMENT = json.load(f)
+    ERR_REGISTRY = ERR_DOCUMENT["registry"]
+
+
+def _proposed():
+    """A registry bump touching one mapping, FM30 dominance and an ERR entry."""
+    mappings = copy.deepcopy(MAPPINGS)
+    mappings["mappings"]["01"] = ["FM15"]
+    mappings["mappings"]["02"].append("FM30")
+    mappings["mappings"]["example"] = ["FM29"]
+    registry = copy.deepcopy(ERR_REGISTRY)
+    registry.append({"id": "ERR-NEW-001", "fm": ["FM8"], "severity": "minor"})
+    return mappings, registry
+
+
+def _corpus(tmp_path, count=400):
+    artifacts = list(iter_artifacts(count, MAPPINGS, seed=7, schema_failure_ratio=0.2))
+    (tmp_path / "corpus").mkdir()
+    (tmp_path / "corpus" / "batch.json").write_text(json.dumps(artifacts))
+    return artifacts
+
+
+def test_impact_matches_full_revalidation(tmp_path):
+    """Reported artifacts are exactly those whose error codes change."""
+    artifacts = _corpus(tmp_path)
+    new_mappings, new_registry = _proposed()
+
+    index = SubclassIndex.build([str(tmp_path / "corpus")], SCHEMA)
+    records = list(analyze_impact(index, MAPPINGS, ERR_REGISTRY, new_mappings, new_registry))
+
+    expected = {}
+    for artifact in artifacts:
+        before = validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY)
+        after = validate_artifact(artifact, SCHEMA, new_mappings, new_registry)
+        if before != after:
+            expected[artifact["id"]] = (before, after)
+
+    assert expected
+    assert {r["artifact_id"]: (r["previous_errors"], r["errors"]) for r in records} == expected
+    assert len(records) == len(expected)
+    assert index.schema_failures > 0
+    assert len(index) + index.schema_failures == len(artifacts)
+
+
+def test_index_round_trip_and_staleness(tmp_path):
+    """Saved indexes reload unchanged and go stale when the corpus changes."""
+    _corpus(tmp_path, count=50)
+    paths = [str(tmp_path / "corpus")]
+    index = SubclassIndex.build(paths, SCHEMA)
+    index.save(tmp_path / "index.json")
+
+    loaded = SubclassIndex.load(tmp_path / "index.json")
+    assert loaded.classes == index.classes
+    assert loaded.is_current(paths, SCHEMA)
+    assert not loaded.is_current(paths, dict(SCHEMA, required=["id"]))
+
+    (tmp_path / "corpus" / "more.ndjson").write_text(json.dumps({"id": "x"}) + "\n")
+    assert not loaded.is_current(paths, SCHEMA)
+
+
+def test_cli_impact_reports_changed_artifacts(tmp_path):
+    """The impact command exits 1 with changed artifacts and 0 without."""
+    _corpus(tmp_path, count=100)
+    new_mappings, new_registry = _proposed()
+    (tmp_path / "mappings.json").write_text(json.dumps(new_mappings))
+    (tmp_path / "err.json").write_text(json.dumps(dict(ERR_DOCUMENT, registry=new_registry)))
+    command = [sys.executable, "-m", "base120.cli", "impact", str(tmp_path / "corpus"),
+               "--index", str(tmp_path / "index.json"), "-o", "-"]
+
+    result = subprocess.run(
+        command + ["--mappings", str(tmp_path / "mappings.json"),
+                   "--err", str(tmp_path / "err.json")],
+        capture_output=True, text=True
+    )
+    assert result.returncode == 1, result.stderr
+    lines = [json.loads(line) for line in result.stdout.splitlines()]
+    assert lines[-1]["total"] == len(lines) - 1 > 0
+    assert {r["class"] for r in lines[:-1]} >= {"01", "02", "example"}
+    assert (tmp_path / "index.json").exists()
+
+    result = subprocess.run(command, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert "stale" not in result.stderr
+    assert "Changed: 0 subclass(es)" in result.stderr
+
+
+def test_unreadable_inputs_are_errors_and_fail_the_gate(tmp_path):
+    """Broken or missing inputs are reported, drop their partial entries and exit 1."""
+    artifact = {"id": "a", "domain": "d", "class": "01", "instance": "i", "models": []}
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    (corpus / "good.json").write_text(json.dumps(artifact))
+    (corpus / "partial.ndjson").write_text(json.dumps(dict(artifact, id="b")) + "\n{\"id\":\n")
+    missing = str(tmp_path / "missing.json")
+
+    index = SubclassIndex.build([str(corpus), missing], SCHEMA)
+    assert [entry[1] for entry in index.classes["01"]] == ["a"]
+    assert [(r["path"], r["status"]) for r in index.errors] == [
+        (str(corpus / "partial.ndjson"), "error"), (missing, "error"),
+    ]
+    index.save(tmp_path / "index.json")
+    assert SubclassIndex.load(tmp_path / "index.json").errors == index.errors
+
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "impact", str(corpus / "partial.ndjson"),
+         missing, "-o", "-"],
+        capture_output=True, text=True
+    )
+    assert result.returncode == 1, result.stderr
+    records = [json.loads(line) for line in result.stdout.splitlines()]
+    assert records[-1]["errored"] == 2
+    assert "Unreadable: 2 input(s)" in result.stderr
+    assert "missing.json: File not found" in result.stderr
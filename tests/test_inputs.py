@@ -0,0 +1,136 @@
+"""Tests for the input readers and streaming array parser."""
+import io
+import json
+import random
+import subprocess
+import sys
+import tracemalloc
+
+import pytest
+
+from base120.engine import RegistryEngine, iter_file_records
+from base120.inputs import iter_corpus_paths, iter_documents, iter_json_array, stream_backend
+
+
+ARTIFACT = {"id": "a", "domain": "core", "class": "example", "instance": "x", "models": []}
+
+
+def _random_value(rng, depth=0):
+    roll = rng.random()
+    if depth > 3 or roll < 0.3:
+        return rng.choice([0, -7, 1.25e-3, -2.5e7, 10**20, "", 's"],\n\\', "é☃\U0001f600", True, None])
+    if roll < 0.65:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    return {f"k{i}": _random_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+
+
+class _GeneratedArray(io.TextIOBase):
+    """Text stream of a JSON array of `count` artifacts, produced lazily."""
+
+    def __init__(self, count):
+        self._items = (json.dumps({**ARTIFACT, "id": f"a{i}"}) for i in range(count))
+        self._pending = "["
+        self._first = True
+        self._done = False
+
+    def read(self, size=-1):
+        while len(self._pending) < size and not self._done:
+            item = next(self._items, None)
+            if item is None:
+                self._pending += "]"
+                self._done = True
+                break
+            self._pending += item if self._first else ",\n" + item
+            self._first = False
+        chunk, self._pending = self._pending[:size], self._pending[size:]
+        return chunk
+
+
+def test_iter_json_array_matches_json_load():
+    """Elements equal json.loads() for any chunk size and layout."""
+    rng = random.Random(7)
+    for _ in range(200):
+        data = [_random_value(rng) for _ in range(rng.randint(0, 8))]
+        text = json.dumps(data, indent=rng.choice([None, 1]), ensure_ascii=rng.random() < 0.5)
+        for chunk_size in (1, 3, 17, 1 << 16):
+            assert list(iter_json_array(io.StringIO(text), chunk_size)) == data
+    with pytest.raises(json.JSONDecodeError, match="Expecting '\\['"):
+        list(iter_json_array(io.StringIO("{}")))
+
+
+@pytest.mark.parametrize("text", [
+    "[1 2]", "[1,]", "[1", "[", '[{"a": }]', "[1]\nx", '[\n{"a": 1},\n{"b": tru}\n]',
+])
+def test_iter_json_array_errors_match_json_load(text):
+    """Malformed arrays yield the preceding elements, then json.load()'s error."""
+    with pytest.raises(json.JSONDecodeError) as expected:
+        json.loads(text)
+    for chunk_size in (1, 4, 64):
+        items = []
+        with pytest.raises(json.JSONDecodeError) as raised:
+            for item in iter_json_array(io.StringIO(text), chunk_size):
+                items.append(item)
+        assert str(raised.value) == str(expected.value)
+        assert raised.value.pos == expected.value.pos
+        assert len(items) <= text.count(",") + 1
+
+
+def test_iter_json_array_memory_is_bounded():
+    """Peak memory does not grow with the number of elements."""
+    peaks = []
+    for count in (5_000, 20_000):
+        tracemalloc.start()
+        try:
+            assert sum(1 for _ in iter_json_array(_GeneratedArray(count))) == count
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    # ~1.7 MB of JSON at 20k elements; the reader holds about one chunk
+    assert peaks[1] < 2 * peaks[0] and peaks[1] < 1_000_000
+
+
+def test_iter_documents_streams_arrays_and_reports_errors(tmp_path):
+    """Array files keep path[index] locations; a truncated file errors after its elements."""
+    path = tmp_path / "batch.json"
+    path.write_text(json.dumps([ARTIFACT, {**ARTIFACT, "id": "b"}]))
+    assert [loc for loc, _ in iter_documents(path)] == [f"{path}[0]", f"{path}[1]"]
+
+    single = tmp_path / "single.json"
+    single.write_text("\n\n" + json.dumps(ARTIFACT))
+    assert list(iter_documents(single)) == [(str(single), ARTIFACT)]
+
+    path.write_text(json.dumps([ARTIFACT, ARTIFACT])[:-30])
+    records = list(iter_file_records(path, RegistryEngine()))
+    assert [r["status"] for r in records] == ["pass", "error"]
+    assert records[1]["message"].startswith("Invalid JSON: Unterminated string")
+
+    assert stream_backend("stdlib") == "stdlib"
+    with pytest.raises(ValueError):
+        stream_backend("yaml")
+
+
+def test_expected_outputs_are_matched_below_the_corpus_root(tmp_path):
+    """An ``expected`` directory above the corpus root does not hide its inputs."""
+    corpus = tmp_path / "expected" / "checkout" / "corpus"
+    for sub in ("valid", "expected"):
+        (corpus / sub).mkdir(parents=True)
+    (corpus / "valid" / "a.json").write_text(json.dumps(ARTIFACT))
+    (corpus / "expected" / "a.errs.json").write_text("[]")
+    (corpus / "batch.ndjson").write_text(json.dumps(ARTIFACT) + "\n")
+    (corpus / "batch.expected.ndjson").write_text("[]\n")
+
+    assert [p.name for p in iter_corpus_paths([str(corpus)])] == ["batch.ndjson", "a.json"]
+    assert list(iter_corpus_paths([str(tmp_path)])) == []
+
+
+def test_cli_validate_contract_rejects_arrays(tmp_path):
+    """validate-contract points arrays of contracts to validate-artifacts."""
+    path = tmp_path / "contracts.json"
+    path.write_text("[]")
+    result = subprocess.run(
+        [sys.executable, "-m", "base120.cli", "validate-contract", str(path)],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 2
+    assert "validate-artifacts" in result.stderr
@@ -0,0 +1,97 @@
+"""Tests for Base120 validation metrics."""
+import json
+from pathlib import Path
+
+from base120.contract.validate import validate_contract
+from base120.metrics import Histogram, ValidationMetrics
+from base120.validators.validate import validate_artifact
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json") as f:
+    SCHEMA = json.load(f)
+
+with open(ROOT / "schemas" / "v1.0.0" / "contract.schema.json") as f:
+    CONTRACT_SCHEMA = json.load(f)
+
+with open(ROOT / "registries" / "mappings.json") as f:
+    MAPPINGS = json.load(f)
+
+with open(ROOT / "registries" / "err.json") as f:
+    ERR_REGISTRY = json.load(f)["registry"]
+
+VALID = {"id": "m-1", "domain": "core", "class": "example", "instance": "x", "models": []}
+FM30 = {"id": "m-2", "domain": "core", "class": "22", "instance": "x", "models": []}
+SCHEMA_FAIL = {"id": "m-3", "domain": "core", "class": "example"}
+
+
+def test_artifact_stages_and_counters_are_recorded():
+    """Each artifact validation records its stages, result and codes."""
+    metrics = ValidationMetrics()
+
+    for artifact in (VALID, FM30, FM30, SCHEMA_FAIL):
+        validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY, metrics=metrics)
+
+    snapshot = metrics.snapshot()
+    stages = snapshot["stages"]["artifact"]
+
+    assert stages["schema"]["count"] == 4
+    assert stages["total"]["count"] == 4
+    assert stages["fm_mapping"]["count"] == 3  # schema failures stop early
+    assert stages["err_resolution"]["count"] == 3
+    assert stages["total"]["buckets"]["+Inf"] == 4
+    assert snapshot["validations"]["artifact"] == {"failure": 3, "success": 1}
+    assert snapshot["error_codes"]["artifact"] == {"ERR-GOV-004": 2, "ERR-SCHEMA-001": 1}
+    assert snapshot["failure_modes"] == {"FM15": 1, "FM29": 2, "FM30": 2}
+    assert snapshot["throughput"]["validations"] == 4
+
+
+def test_metrics_do_not_change_results():
+    """Validation results are identical with and without metrics."""
+    metrics = ValidationMetrics()
+    for artifact in (VALID, FM30, SCHEMA_FAIL):
+        assert validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY) == \
+            validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY, metrics=metrics)
+
+
+def test_contract_stages_are_recorded():
+    """Contract validation records its stages and contract error codes."""
+    metrics = ValidationMetrics()
+    with open(ROOT / "examples" / "contracts" / "invalid-termination-edge.json") as f:
+        contract = json.load(f)
+
+    is_valid, _, _ = validate_contract(contract, CONTRACT_SCHEMA, metrics=metrics)
+
+    snapshot = metrics.snapshot()
+    assert not is_valid
+    assert set(snapshot["stages"]["contract"]) == {
+        "schema", "failure_graph", "metadata", "warnings", "total"
+    }
+    assert "graph.termination_escalates" in snapshot["error_codes"]["contract"]
+
+
+def test_prometheus_export():
+    """Prometheus output has typed families with cumulative buckets."""
+    ticks = iter(range(100))
+    metrics = ValidationMetrics(buckets=(0.5, 2.0), clock=lambda: next(ticks))
+
+    validate_artifact(FM30, SCHEMA, MAPPINGS, ERR_REGISTRY, metrics=metrics)
+    text = metrics.to_prometheus()
+
+    assert "# TYPE base120_stage_duration_seconds histogram" in text
+    assert 'base120_stage_duration_seconds_bucket{kind="artifact",stage="schema",le="0.5"} 0' in text
+    assert 'base120_stage_duration_seconds_bucket{kind="artifact",stage="schema",le="2.0"} 1' in text
+    assert 'base120_stage_duration_seconds_bucket{kind="artifact",stage="total",le="+Inf"} 1' in text
+    assert 'base120_validations_total{kind="artifact",result="failure"} 1' in text
+    assert 'base120_errors_total{kind="artifact",code="ERR-GOV-004"} 1' in text
+    assert 'base120_failure_modes_total{fm="FM30"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_histogram_bucket_boundaries_are_inclusive():
+    """Values equal to a bound fall into that bucket (Prometheus 'le')."""
+    histogram = Histogram((1.0, 2.0))
+    for value in (1.0, 1.5, 2.0, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [("1.0", 1), ("2.0", 3), ("+Inf", 4)]
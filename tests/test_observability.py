@@ -345,3 +345,224 @@ def test_dynamic_timestamp_without_env_var():
         # Restore original env state
         if original_timestamp is not None:
             os.environ["BASE120_FIXED_TIMESTAMP"] = original_timestamp
+
+
+def test_sampling_sink_is_deterministic_and_keeps_failures():
+    """Sampling depends only on artifact_id; failures are always kept."""
+    from base120.observability import create_sampling_sink
+
+    def run() -> list[Mapping[str, Any]]:
+        kept: list[Mapping[str, Any]] = []
+        sink = create_sampling_sink(kept.append, rate=0.25)
+        for i in range(400):
+            result = "failure" if i % 10 == 0 else "success"
+            sink(create_validator_event(f"a-{i}", "v1.0.0", result, [], []))
+        return kept
+
+    first, second = run(), run()
+    assert [e["artifact_id"] for e in first] == [e["artifact_id"] for e in second]
+
+    failures = [e for e in first if e["result"] == "failure"]
+    successes = [e for e in first if e["result"] == "success"]
+    assert len(failures) == 40
+    assert 50 < len(successes) < 130
+
+    dropped: list[Mapping[str, Any]] = []
+    create_sampling_sink(dropped.append, rate=0.0, keep_failures=False)(
+        create_validator_event("x", "v1.0.0", "failure", ["ERR-SCHEMA-001"], ["FM15"])
+    )
+    assert dropped == []
+
+
+def test_aggregating_sink_rolls_up_per_window():
+    """Rollups count each outcome combination and close on interval."""
+    from base120.observability import create_aggregating_sink
+
+    now = [0.0]
+    rollups: list[Mapping[str, Any]] = []
+    sink = create_aggregating_sink(rollups.append, interval=10.0, clock=lambda: now[0])
+
+    for i in range(3):
+        validate_artifact({"id": f"bad-{i}"}, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=sink)
+    validate_artifact(
+        {"id": "ok", "domain": "core", "class": "example", "instance": "i", "models": []},
+        SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=sink,
+    )
+    assert rollups == []
+
+    now[0] = 11.0
+    validate_artifact({"id": "bad-late"}, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=sink)
+    assert [(r["result"], r["error_codes"], r["count"]) for r in rollups] == [
+        ("failure", ["ERR-SCHEMA-001"], 3),
+        ("success", [], 1),
+    ]
+    assert all(r["event_type"] == "validator_rollup" for r in rollups)
+
+    sink.flush()
+    assert rollups[-1]["count"] == 1
+    assert rollups[-1]["failure_mode_ids"] == ["FM15"]
+    sink.flush()
+    assert len(rollups) == 3
+
+
+def test_validate_artifacts_matches_per_artifact_results():
+    """Batch validation returns the same results and events as single calls."""
+    from base120.validators.validate import validate_artifacts
+
+    artifacts = [
+        {"id": "ok", "domain": "core", "class": "example", "instance": "i", "models": []},
+        {"id": "bad"},
+        {"domain": "core", "class": "example", "instance": "i", "models": []},
+    ]
+    single_events: list[Mapping[str, Any]] = []
+    expected = [
+        validate_artifact(a, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=single_events.append)
+        for a in artifacts
+    ]
+
+    batch_events: list[Mapping[str, Any]] = []
+    assert validate_artifacts(
+        artifacts, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=batch_events.append
+    ) == expected
+
+    strip = lambda e: {k: v for k, v in e.items() if k != "timestamp"}  # noqa: E731
+    assert [strip(e) for e in batch_events] == [strip(e) for e in single_events]
+    assert len({e["timestamp"] for e in batch_events}) == 1
+    assert batch_events[2]["artifact_id"] == "unknown"
+
+
+def test_batch_event_sink_writes_batch_in_one_call():
+    """create_batch_event_sink serializes a whole batch with a single write."""
+    from base120.observability import create_batch_event_sink
+    from base120.validators.validate import validate_artifacts
+
+    class CountingIO(StringIO):
+        writes = 0
+
+        def write(self, s: str) -> int:
+            self.writes += 1
+            return super().write(s)
+
+    output = CountingIO()
+    sink = create_batch_event_sink(output)
+    validate_artifacts([{"id": f"bad-{i}"} for i in range(5)],
+                       SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=sink)
+
+    assert output.writes == 1
+    events = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert [e["artifact_id"] for e in events] == [f"bad-{i}" for i in range(5)]
+    assert all(e["failure_mode_ids"] == ["FM15"] for e in events)
+
+    sink(create_validator_event("single", "v1.0.0", "success", [], []))
+    assert output.writes == 2
+
+
+_FILE_SINK_WORKER = """
+import sys
+from base120.observability import create_file_event_sink
+path, worker = sys.argv[1], int(sys.argv[2])
+sink = create_file_event_sink(path, max_bytes=8000, compress=True)
+for i in range(0, 600, 3):
+    sink({"worker": worker, "i": i, "pad": "x" * 40})
+    sink.write_batch([{"worker": worker, "i": i + k, "pad": "x" * 40} for k in (1, 2)])
+sink.close()
+"""
+
+
+def test_file_event_sink_concurrent_processes_with_rotation(tmp_path):
+    """Concurrent writers never interleave lines or lose records across rotations."""
+    import gzip
+    import subprocess
+    import sys
+
+    path = tmp_path / "events.ndjson"
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    procs = [
+        subprocess.Popen([sys.executable, "-c", _FILE_SINK_WORKER, str(path), str(w)], env=env)
+        for w in range(4)
+    ]
+    assert [p.wait(timeout=60) for p in procs] == [0, 0, 0, 0]
+
+    segments = sorted(tmp_path.glob("events.ndjson.*.gz"))
+    assert segments, "expected size-based rotation"
+    assert not list(tmp_path.glob("*.tmp"))
+
+    lines = path.read_text().splitlines()
+    for segment in segments:
+        with gzip.open(segment, "rt") as f:
+            lines.extend(f.read().splitlines())
+    records = [json.loads(line) for line in lines]
+    for worker in range(4):
+        assert sorted(r["i"] for r in records if r["worker"] == worker) == list(range(600))
+
+
+def test_file_event_sink_time_rotation(tmp_path):
+    """Time-based rotation starts a new segment at the first write of each interval."""
+    from base120.observability import create_file_event_sink
+
+    now = [1_000_000.0]
+    path = tmp_path / "events.ndjson"
+    with create_file_event_sink(str(path), rotate_interval=60.0, clock=lambda: now[0]) as sink:
+        sink({"n": 1})
+        sink({"n": 2})
+        now[0] += 60.0
+        sink({"n": 3})
+
+    segments = [p for p in tmp_path.iterdir() if p.name.startswith("events.ndjson.") and
+                not p.name.endswith(".lock")]
+    assert len(segments) == 1
+    assert [json.loads(x)["n"] for x in segments[0].read_text().splitlines()] == [1, 2]
+    assert [json.loads(x)["n"] for x in path.read_text().splitlines()] == [3]
+
+
+def test_file_event_sink_compressed_log(tmp_path):
+    """A .gz log stays readable as one file; its open stream goes to its own interval."""
+    import gzip
+    import pytest
+    from base120.observability import create_file_event_sink
+
+    now = [1_000_000.0]
+    path = tmp_path / "events.ndjson.gz"
+    with create_file_event_sink(str(path), rotate_interval=60.0, clock=lambda: now[0]) as sink:
+        sink({"n": 1})
+        sink.write_batch([{"n": 2}, {"n": 3}])
+        now[0] += 60.0
+        sink({"n": 4})
+
+    segments = sorted(tmp_path.glob("events.ndjson.*.gz"))
+    assert [p.name for p in segments] == ["events.ndjson.19700112T134740.gz"]
+    with gzip.open(segments[0], "rt") as f:
+        assert [json.loads(x)["n"] for x in f] == [1, 2, 3]
+    with gzip.open(path, "rt") as f:
+        assert [json.loads(x)["n"] for x in f] == [4]
+
+    with pytest.raises(ValueError):
+        create_file_event_sink(str(path), max_bytes=1000, compress=True)
+
+
+def test_file_event_sink_compressed_log_keeps_one_stream_open(tmp_path):
+    """Events share one open stream, appended whole when full and on flush()."""
+    import gzip
+    import zlib
+    from base120.observability import create_file_event_sink
+
+    path = tmp_path / "events.ndjson.gz"
+    with create_file_event_sink(str(path)) as sink:
+        for i in range(500):
+            sink({"n": i, "result": "success"})
+        assert path.stat().st_size == 0
+        sink.flush()
+        data = path.read_bytes()
+        # One gzip member for all 500 events, far smaller than 500 members
+        stream = zlib.decompressobj(wbits=31)
+        assert len(stream.decompress(data).splitlines()) == 500
+        assert stream.eof and stream.unused_data == b""
+        assert len(data) < 500 * 20
+
+    small = tmp_path / "small.ndjson.gz"
+    with create_file_event_sink(str(small), flush_bytes=1000) as sink:
+        for i in range(500):
+            sink({"n": i})
+        assert small.stat().st_size > 0
+    with gzip.open(small, "rt") as f:
+        assert [json.loads(x)["n"] for x in f] == list(range(500))
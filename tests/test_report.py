@@ -0,0 +1,115 @@
+"""Tests for Base120 streaming report writer."""
+import json
+from io import StringIO
+
+import pytest
+
+from base120.report import StreamingReportWriter
+
+
+def _records():
+    yield {"status": "pass", "errors": []}
+    yield {"status": "fail", "errors": ["ERR-GOV-004"]}
+    yield {"status": "fail", "errors": ["ERR-SCHEMA-001"]}
+    yield {"status": "fail", "errors": ["ERR-GOV-004"]}
+    yield {"status": "error", "errors": [], "message": "Invalid JSON"}
+
+
+def test_ndjson_report_streams_records_then_summary():
+    """NDJSON reports write one line per record and end with a summary line."""
+    output = StringIO()
+    with StreamingReportWriter(output, format="ndjson") as writer:
+        for record in _records():
+            writer.write(record)
+
+    lines = [json.loads(line) for line in output.getvalue().splitlines()]
+
+    assert len(lines) == 6
+    assert lines[1] == {"status": "fail", "errors": ["ERR-GOV-004"]}
+    assert lines[-1] == {
+        "record_type": "summary",
+        "total": 5,
+        "passed": 1,
+        "failed": 3,
+        "errored": 1,
+        "top_errors": [
+            {"code": "ERR-GOV-004", "count": 2},
+            {"code": "ERR-SCHEMA-001", "count": 1},
+        ],
+    }
+
+
+def test_json_report_is_a_single_document():
+    """JSON reports emit a results array followed by the summary."""
+    output = StringIO()
+    writer = StreamingReportWriter(output, format="json", top_errors=1)
+    for record in _records():
+        writer.write(record)
+    summary = writer.close()
+
+    report = json.loads(output.getvalue())
+
+    assert len(report["results"]) == 5
+    assert report["summary"] == summary
+    assert summary["top_errors"] == [{"code": "ERR-GOV-004", "count": 2}]
+
+
+def test_empty_report_is_valid():
+    """Reports with no records are still well-formed."""
+    for fmt in ("ndjson", "json"):
+        output = StringIO()
+        with StreamingReportWriter(output, format=fmt):
+            pass
+
+        text = output.getvalue()
+        summary = json.loads(text) if fmt == "ndjson" else json.loads(text)["summary"]
+        assert summary["total"] == 0
+
+
+def test_records_are_written_before_close():
+    """Records reach the output immediately rather than being buffered."""
+    output = StringIO()
+    writer = StreamingReportWriter(output)
+    writer.write({"status": "pass", "errors": []})
+
+    assert output.getvalue().count("\n") == 1
+
+
+def test_write_after_close_raises():
+    """Writing to a closed report is an error."""
+    writer = StreamingReportWriter(StringIO())
+    writer.close()
+
+    with pytest.raises(ValueError):
+        writer.write({"status": "pass", "errors": []})
+
+
+def test_unknown_format_rejected():
+    """Unsupported report formats are rejected up front."""
+    with pytest.raises(ValueError):
+        StreamingReportWriter(StringIO(), format="xml")
+
+
+def test_canonical_report_is_compact_and_sorted():
+    """Canonical reports use sorted keys and no insignificant whitespace."""
+    from base120.report import canonical_dumps
+
+    output = StringIO()
+    with StreamingReportWriter(output, format="json", canonical=True) as writer:
+        writer.write({"status": "fail", "errors": ["ERR-GOV-004"], "artifact_id": "é"})
+
+    text = output.getvalue()
+    report = json.loads(text)
+
+    assert text.startswith('{"results":[{"artifact_id":"é","errors":["ERR-GOV-004"],"status":"fail"}]')
+    assert text == canonical_dumps(report)
+
+
+def test_report_timestamp_honours_fixed_timestamp(monkeypatch):
+    """BASE120_FIXED_TIMESTAMP pins report timestamps."""
+    from base120.contract.report import generate_report
+
+    monkeypatch.setenv("BASE120_FIXED_TIMESTAMP", "2026-01-01T00:00:00.000000Z")
+    report = generate_report("svc", True, [], [], ["production"])
+
+    assert report["timestamp"] == "2026-01-01T00:00:00.000000Z"
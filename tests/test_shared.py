@@ -0,0 +1,130 @@
+"""Tests for registries published in shared memory."""
+import json
+import multiprocessing
+import random
+from pathlib import Path
+
+import pytest
+
+from base120.cache import ValidationCache
+from base120.engine import RegistryEngine, iter_file_records
+from base120.shared import SharedRegistry, attach_worker, validate_shared
+from base120.validators.errors import resolve_errors
+from base120.validators.mappings import resolve_failure_modes
+from base120.validators.validate import validate_artifact
+
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json") as f:
+    SCHEMA = json.load(f)
+
+with open(ROOT / "registries" / "mappings.json") as f:
+    MAPPINGS = json.load(f)
+
+with open(ROOT / "registries" / "err.json") as f:
+    ERR_REGISTRY = json.load(f)["registry"]
+
+
+def _artifact(subclass: str) -> dict:
+    return {"id": subclass, "domain": "d", "class": subclass, "instance": "i", "models": []}
+
+
+def test_attached_tables_match_list_resolution():
+    """Shared masks resolve every subclass like the list resolvers."""
+    with SharedRegistry.publish(SCHEMA, MAPPINGS, ERR_REGISTRY) as shared:
+        attached = SharedRegistry.attach(shared.name)
+        try:
+            assert attached.schema == SCHEMA
+            assert attached.mappings == MAPPINGS
+            assert attached.err_registry == ERR_REGISTRY
+            for subclass in list(MAPPINGS["mappings"]) + ["unmapped"]:
+                fms = resolve_failure_modes(subclass, MAPPINGS)
+                mask, fm_ids = attached.tables.failure_modes(subclass)
+                assert list(fm_ids) == sorted(fms)
+                assert list(attached.tables.errors(mask)) == resolve_errors(fms, ERR_REGISTRY)
+        finally:
+            attached.close()
+
+
+def test_owner_close_unlinks_segment():
+    """Closing the publisher removes the segment; its documents stay usable."""
+    shared = SharedRegistry.publish(SCHEMA, MAPPINGS, ERR_REGISTRY)
+    name = shared.name
+    shared.close()
+    with pytest.raises(FileNotFoundError):
+        SharedRegistry.attach(name)
+    artifact = _artifact("example")
+    assert validate_artifact(artifact, shared.schema, shared.mappings, shared.err_registry) == \
+        validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY)
+
+
+def test_pool_workers_validate_against_shared_registry():
+    """Pool workers attached by name return the same results as the parent."""
+    artifacts = [_artifact(subclass) for subclass in list(MAPPINGS["mappings"])[:50]]
+    artifacts.append({"id": "bad"})
+    expected = [validate_artifact(a, SCHEMA, MAPPINGS, ERR_REGISTRY) for a in artifacts]
+
+    with SharedRegistry.publish(SCHEMA, MAPPINGS, ERR_REGISTRY) as shared:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(2, initializer=attach_worker, initargs=(shared.name,)) as pool:
+            assert pool.map(validate_shared, artifacts) == expected
+
+
+def test_attached_tables_match_list_resolution_on_random_registries():
+    """Binary search and FM postings agree with the list resolvers (FM30, non-ASCII names)."""
+    fm_ids = [f"FM{i}" for i in range(1, 31)] + ["FM99"]
+    for seed in range(10):
+        rng = random.Random(seed)
+        mappings = {"mappings": {
+            f"{rng.choice(['c', 'é', 'Z'])}{i}": rng.sample(fm_ids, rng.randint(0, 4))
+            for i in range(40)
+        }}
+        registry = [
+            {"id": f"ERR-{rng.randrange(25):03d}", "fm": rng.sample(fm_ids, rng.randint(0, 3))}
+            for _ in range(60)
+        ]
+        with SharedRegistry.publish(SCHEMA, mappings, registry) as shared:
+            for subclass in list(mappings["mappings"]) + ["unmapped", "\ud800"]:
+                fms = resolve_failure_modes(subclass, mappings)
+                mask, found = shared.tables.failure_modes(subclass)
+                assert list(found) == sorted(fms)
+                assert list(shared.tables.errors(mask)) == resolve_errors(fms, registry)
+
+
+def test_validation_does_not_decode_registries():
+    """Validating through the shared tables leaves mappings and ERR registry in the segment."""
+    with SharedRegistry.publish(SCHEMA, MAPPINGS, ERR_REGISTRY) as shared:
+        attached = SharedRegistry.attach(shared.name)
+        try:
+            version = attached.registry_version()
+            for subclass in list(MAPPINGS["mappings"])[:20] + ["unmapped"]:
+                artifact = _artifact(subclass)
+                assert version.validate(artifact) == \
+                    validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY)
+            assert not attached.mappings.loaded
+            assert not attached.err_registry.loaded
+
+            # Cache keys hash the shared canonical JSON, matching decoded copies
+            cache = ValidationCache()
+            artifact = _artifact("example")
+            assert cache.key(artifact, SCHEMA, attached.mappings, attached.err_registry) == \
+                cache.key(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY)
+            assert not attached.mappings.loaded
+        finally:
+            attached.close()
+
+
+def test_engine_attaches_published_versions():
+    """An engine given segment names reports the same records as one reading files."""
+    engine = RegistryEngine(ROOT)
+    published = engine.publish_shared()
+    try:
+        worker = RegistryEngine(ROOT, shared={r.version: r.name for r in published})
+        for path in sorted((ROOT / "tests" / "corpus").rglob("*.json")) + \
+                sorted((ROOT / "examples" / "contracts").glob("*.json")):
+            assert list(iter_file_records(path, worker)) == list(iter_file_records(path, engine))
+        assert not worker.get("v1.0.0").mappings.loaded
+    finally:
+        for registry in published:
+            registry.close()
@@ -0,0 +1,71 @@
+"""Tests for the Base120 synthetic corpus generator."""
+import json
+from pathlib import Path
+
+from base120.synth import generate_corpus, iter_artifacts, iter_contracts
+from base120.validators.validate import validate_artifact
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json") as f:
+    SCHEMA = json.load(f)
+
+with open(ROOT / "schemas" / "v1.0.0" / "contract.schema.json") as f:
+    CONTRACT_SCHEMA = json.load(f)
+
+with open(ROOT / "registries" / "mappings.json") as f:
+    MAPPINGS = json.load(f)
+
+with open(ROOT / "registries" / "err.json") as f:
+    ERR_REGISTRY = json.load(f)["registry"]
+
+
+def test_generation_is_deterministic():
+    """The same seed yields the same artifacts and contracts."""
+    assert list(iter_artifacts(200, MAPPINGS, seed=7)) == list(iter_artifacts(200, MAPPINGS, seed=7))
+    assert list(iter_artifacts(50, MAPPINGS, seed=7)) != list(iter_artifacts(50, MAPPINGS, seed=8))
+    assert list(iter_contracts(10, 20, seed=7)) == list(iter_contracts(10, 20, seed=7))
+
+
+def test_artifacts_cover_every_subclass_and_schema_failures():
+    """Every mapped subclass appears, and some artifacts fail the schema."""
+    artifacts = list(iter_artifacts(500, MAPPINGS, seed=1, schema_failure_ratio=0.2))
+
+    classes = {a.get("class") for a in artifacts}
+    assert set(MAPPINGS["mappings"]) <= classes
+
+    outcomes = {tuple(validate_artifact(a, SCHEMA, MAPPINGS, ERR_REGISTRY)) for a in artifacts}
+    assert ("ERR-SCHEMA-001",) in outcomes
+    assert () in outcomes
+    assert ("ERR-GOV-004",) in outcomes
+
+
+def test_files_layout_matches_golden_corpus(tmp_path):
+    """Generated file corpora use the golden corpus layout and expectations."""
+    stats = generate_corpus(
+        tmp_path, 100, SCHEMA, MAPPINGS, ERR_REGISTRY,
+        contract_schema=CONTRACT_SCHEMA, seed=3, contracts=10, graph_size=30
+    )
+
+    assert stats["artifacts_valid"] + stats["artifacts_invalid"] == 100
+    assert stats["contracts_valid"] + stats["contracts_invalid"] == 10
+    assert stats["contracts_invalid"] > 0
+
+    for path in sorted((tmp_path / "invalid").glob("*.json")):
+        artifact = json.loads(path.read_text())
+        expected = json.loads((tmp_path / "expected" / f"{path.stem}.errs.json").read_text())
+        assert validate_artifact(artifact, SCHEMA, MAPPINGS, ERR_REGISTRY) == expected
+    assert len(list((tmp_path / "contracts" / "expected").glob("*.errs.json"))) == stats["contracts_invalid"]
+
+
+def test_ndjson_layout_is_line_aligned(tmp_path):
+    """NDJSON corpora pair each artifact line with its canonical expected output."""
+    generate_corpus(tmp_path, 50, SCHEMA, MAPPINGS, ERR_REGISTRY, seed=5, format="ndjson")
+
+    artifacts = (tmp_path / "artifacts.ndjson").read_text().splitlines()
+    expected = (tmp_path / "artifacts.expected.ndjson").read_text().splitlines()
+
+    assert len(artifacts) == len(expected) == 50
+    for line, errs in zip(artifacts, expected):
+        result = validate_artifact(json.loads(line), SCHEMA, MAPPINGS, ERR_REGISTRY)
+        assert json.dumps(result, separators=(",", ":")) == errs
@@ -0,0 +1,128 @@
+"""Tests for Base120 trace context propagation."""
+import asyncio
+import io
+import json
+from pathlib import Path
+from typing import Any, Mapping
+from unittest.mock import ANY
+
+from base120.contract.validate import check_contract
+from base120.metrics import ValidationMetrics
+from base120.tracing import current_trace, trace
+from base120.validators.validate import validate_artifact, validate_artifacts
+
+
+ROOT = Path(__file__).parent.parent
+
+with open(ROOT / "schemas" / "v1.0.0" / "artifact.schema.json") as f:
+    SCHEMA = json.load(f)
+
+with open(ROOT / "schemas" / "v1.0.0" / "contract.schema.json") as f:
+    CONTRACT_SCHEMA = json.load(f)
+
+with open(ROOT / "registries" / "mappings.json") as f:
+    MAPPINGS = json.load(f)
+
+with open(ROOT / "registries" / "err.json") as f:
+    ERR_REGISTRY = json.load(f)["registry"]
+
+VALID = {"id": "ok", "domain": "core", "class": "example", "instance": "i", "models": []}
+
+
+def test_events_outside_trace_are_unchanged():
+    """Without an active trace, events carry no correlation_id or spans."""
+    events: list[Mapping[str, Any]] = []
+    validate_artifact(VALID, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=events.append)
+
+    assert current_trace() is None
+    assert "correlation_id" not in events[0]
+    assert "spans" not in events[0]
+
+
+def test_trace_attaches_correlation_id_and_spans():
+    """Events emitted under a trace carry its correlation ID and stage spans."""
+    events: list[Mapping[str, Any]] = []
+    with trace("req-12345") as ctx:
+        validate_artifact(VALID, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=events.append)
+        validate_artifact({"id": "bad"}, SCHEMA, MAPPINGS, ERR_REGISTRY,
+                          event_sink=events.append)
+    assert current_trace() is None
+
+    assert [e["correlation_id"] for e in events] == ["req-12345", "req-12345"]
+    assert [s["name"] for s in events[0]["spans"]] == ["schema", "fm_mapping", "err_resolution"]
+    assert [s["name"] for s in events[1]["spans"]] == ["schema"]
+    assert all(s["duration_ms"] >= 0 for s in events[0]["spans"])
+
+    stages = ctx.stages()["artifact"]
+    assert stages["schema"]["count"] == 2
+    assert stages["fm_mapping"]["count"] == 1
+    assert stages["total"]["count"] == 2
+
+
+def test_trace_flows_through_batch_and_contract_validation():
+    """Batch events and contract stages are attributed to the active trace."""
+    with open(ROOT / "examples" / "contracts" / "valid-basic-contract.json") as f:
+        contract = json.load(f)
+
+    events: list[Mapping[str, Any]] = []
+    metrics = ValidationMetrics()
+    with trace() as ctx:
+        validate_artifacts([VALID, {"id": "bad"}], SCHEMA, MAPPINGS, ERR_REGISTRY,
+                           event_sink=events.append, metrics=metrics)
+        check_contract(contract, CONTRACT_SCHEMA)
+
+    assert len(ctx.correlation_id) == 32
+    assert {e["correlation_id"] for e in events} == {ctx.correlation_id}
+    assert [len(e["spans"]) for e in events] == [3, 1]
+    assert set(ctx.stages()["contract"]) == {
+        "schema", "failure_graph", "metadata", "warnings", "total"
+    }
+    # Metrics still record when tracing is active
+    assert metrics.snapshot()["validations"]["artifact"] == {"failure": 1, "success": 1}
+
+
+def test_concurrent_tasks_keep_separate_traces():
+    """Each asyncio task sees only its own trace."""
+    async def handle(request_id: str) -> list[Mapping[str, Any]]:
+        events: list[Mapping[str, Any]] = []
+        with trace(request_id):
+            await asyncio.sleep(0)
+            validate_artifact(VALID, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=events.append)
+        return events
+
+    async def main() -> list[list[Mapping[str, Any]]]:
+        return await asyncio.gather(*(handle(f"req-{i}") for i in range(5)))
+
+    results = asyncio.run(main())
+    assert [r[0]["correlation_id"] for r in results] == [f"req-{i}" for i in range(5)]
+
+
+def test_profile_run_leaves_events_unchanged(tmp_path):
+    """Profiling records stage totals without adding trace fields to events."""
+    from base120.profiling import profile_run
+
+    def run(sink):
+        validate_artifact(VALID, SCHEMA, MAPPINGS, ERR_REGISTRY, event_sink=sink)
+        validate_artifacts([VALID, {"id": "bad"}], SCHEMA, MAPPINGS, ERR_REGISTRY,
+                           event_sink=sink)
+
+    strip = lambda e: {k: v for k, v in e.items() if k != "timestamp"}  # noqa: E731
+    plain: list[Mapping[str, Any]] = []
+    run(plain.append)
+
+    profiled: list[Mapping[str, Any]] = []
+    with profile_run(str(tmp_path / "run.prof"), log=io.StringIO()) as ctx:
+        run(profiled.append)
+    assert [strip(e) for e in profiled] == [strip(e) for e in plain]
+    assert ctx.stages()["artifact"]["total"]["count"] == 3
+
+    # An enclosing trace keeps its correlation ID and spans; both see the stages
+    traced: list[Mapping[str, Any]] = []
+    with trace("req-1") as outer:
+        with profile_run(str(tmp_path / "run.prof"), log=io.StringIO()) as ctx:
+            run(traced.append)
+        assert current_trace() is outer
+    assert {e["correlation_id"] for e in traced} == {"req-1"}
+    assert all(e["spans"] for e in traced)
+    assert ctx.stages() == {"artifact": {k: dict(v, total_ms=ANY)
+                                         for k, v in outer.stages()["artifact"].items()}}
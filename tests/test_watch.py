@@ -0,0 +1,133 @@
+"""Tests for watch mode."""
+import io
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+from base120.watch import Watcher
+
+
+ROOT = Path(__file__).parent.parent
+ARTIFACT = {"id": "a", "domain": "core", "class": "example", "instance": "x", "models": []}
+
+
+def _write(path, data, bump_mtime=True):
+    path.write_text(json.dumps(data))
+    if bump_mtime:
+        # Filesystems with coarse mtimes may not see back-to-back writes
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_poll_revalidates_only_changed_content(tmp_path):
+    """First poll covers everything; later polls only real content changes."""
+    _write(tmp_path / "a.json", ARTIFACT)
+    _write(tmp_path / "batch.ndjson", {"id": "b"})
+    shutil.copy(ROOT / "examples" / "contracts" / "valid-basic-contract.json", tmp_path / "c.json")
+    watcher = Watcher([str(tmp_path)])
+
+    records = watcher.poll()
+    by_path = {Path(r["path"]).name: r for r in records}
+    assert by_path["a.json"]["status"] == "pass"
+    assert by_path["batch.ndjson:1"]["errors"] == ["ERR-SCHEMA-001"]
+    assert by_path["c.json"]["kind"] == "contract"
+    assert by_path["c.json"]["status"] == "pass"
+    assert watcher.poll() == []
+
+    # Same content with a new mtime: hashed and skipped
+    _write(tmp_path / "a.json", ARTIFACT)
+    assert watcher.poll() == []
+
+    _write(tmp_path / "a.json", dict(ARTIFACT, models=[1]))
+    records = watcher.poll()
+    assert [(Path(r["path"]).name, r["status"]) for r in records] == [("a.json", "fail")]
+
+    (tmp_path / "batch.ndjson").unlink()
+    assert watcher.poll() == [{"record_type": "removed", "path": str(tmp_path / "batch.ndjson")}]
+
+
+def test_poll_reports_unreadable_documents(tmp_path):
+    """Invalid JSON and non-object documents become error records."""
+    watcher = Watcher([str(tmp_path)])
+    assert watcher.poll() == []
+    (tmp_path / "bad.json").write_text("{ invalid json }")
+    _write(tmp_path / "list.json", [1, ARTIFACT])
+    statuses = [(Path(r["path"]).name, r["status"]) for r in watcher.poll()]
+    assert statuses == [("bad.json", "error"), ("list.json[0]", "error"), ("list.json[1]", "pass")]
+
+
+def test_failed_read_is_retried_without_a_stamp_change(tmp_path, monkeypatch):
+    """A file whose read fails is reported once and re-read on the next poll."""
+    watcher = Watcher([str(tmp_path)])
+    _write(tmp_path / "a.json", ARTIFACT)
+    real_read = Path.read_bytes
+
+    def failing_read(self):
+        raise PermissionError(13, "Permission denied")
+
+    monkeypatch.setattr(Path, "read_bytes", failing_read)
+    assert [r["status"] for r in watcher.poll()] == ["error"]
+    assert watcher.poll() == []
+
+    monkeypatch.setattr(Path, "read_bytes", real_read)
+    assert [r["status"] for r in watcher.poll()] == ["pass"]
+    assert watcher.poll() == []
+
+
+def test_poll_reads_only_changed_files(tmp_path, monkeypatch):
+    """One change among 500 files is detected by stat() and only that file is read."""
+    for i in range(500):
+        _write(tmp_path / f"{i:03d}.json", dict(ARTIFACT, id=str(i)), bump_mtime=False)
+    watcher = Watcher([str(tmp_path)])
+    watcher.poll()
+
+    reads = []
+    real_read = Path.read_bytes
+
+    def counting_read(self):
+        reads.append(self.name)
+        return real_read(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read)
+    _write(tmp_path / "250.json", dict(ARTIFACT, id="changed"))
+    records = watcher.poll()
+    assert [r["artifact_id"] for r in records] == ["changed"]
+    assert reads == ["250.json"]
+
+
+def test_poll_skips_expected_outputs(tmp_path):
+    """Expected-output files of a corpus are not validated as inputs."""
+    (tmp_path / "valid").mkdir()
+    (tmp_path / "expected").mkdir()
+    _write(tmp_path / "valid" / "a.json", ARTIFACT)
+    _write(tmp_path / "expected" / "a.errs.json", [])
+    _write(tmp_path / "batch.expected.ndjson", [])
+    records = Watcher([str(tmp_path)]).poll()
+    assert [Path(r["path"]).name for r in records] == ["a.json"]
+
+
+def test_run_streams_changes(tmp_path):
+    """run() writes records for changes as they happen."""
+    output = io.StringIO()
+    stop = threading.Event()
+    watcher = Watcher([str(tmp_path)])
+    thread = threading.Thread(
+        target=watcher.run, args=(output,), kwargs={"interval": 0.005, "stop": stop, "log": None}
+    )
+    thread.start()
+    try:
+        time.sleep(0.05)
+        written = time.perf_counter()
+        _write(tmp_path / "a.json", ARTIFACT)
+        deadline = written + 5.0
+        while not output.getvalue() and time.perf_counter() < deadline:
+            time.sleep(0.001)
+    finally:
+        stop.set()
+        thread.join()
+
+    record = json.loads(output.getvalue().splitlines()[0])
+    assert record["status"] == "pass"